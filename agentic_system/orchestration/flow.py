@@ -7,7 +7,7 @@ from typing import Mapping, Sequence
 
 from agentic_system.config.loader import compute_hash
 from agentic_system.orchestration.models import RunInputs, RunResult
-from agentic_system.penalties import compute_penalties
+from agentic_system.penalties import compile_penalty_policy, compute_penalties
 from agentic_system.schemas.contracts import (
     AgentResult,
     HoldingPacket,
@@ -99,6 +99,7 @@ def run_flow(inputs: RunInputs) -> RunResult:
 
     penalties_by_holding = defaultdict(lambda: None)
     if portfolio_outcome == "COMPLETED":
+        policy = compile_penalty_policy(inputs.run_config)
         for holding in inputs.snapshot.holdings:
             if holding_outcomes[holding.holding_id] != "COMPLETED":
                 continue
@@ -111,6 +112,7 @@ def run_flow(inputs: RunInputs) -> RunResult:
                 agent_results=evaluation.agent_results,
                 run_config=inputs.run_config,
                 fx_flags=(),
+                policy=policy,
             )
             penalties_by_holding[holding.holding_id] = penalties
 
@@ -1,3 +1,3 @@
-from agentic_system.penalties.engine import compute_penalties
+from agentic_system.penalties.engine import PenaltyPolicy, compile_penalty_policy, compute_penalties
 
-__all__ = ["compute_penalties"]
+__all__ = ["PenaltyPolicy", "compile_penalty_policy", "compute_penalties"]
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, Mapping, Sequence
+from types import MappingProxyType
+from typing import Iterable, Mapping, Optional, Sequence
 
 from agentic_system.schemas.contracts import (
     AgentResult,
@@ -54,9 +55,29 @@ _REASON_MAP = {
 }
 
 
-def _make_item(category: str, reason: str, source_agent: str) -> PenaltyItem:
-    amount = _REASON_MAP[reason]
-    return PenaltyItem(category=category, reason=reason, amount=amount, source_agent=source_agent)
+@dataclass(frozen=True)
+class PenaltyPolicy:
+    """Reason amounts and caps for one run config, resolved once and shared across holdings."""
+
+    reason_amounts: Mapping[str, float]
+    category_caps: Mapping[str, float]
+    total_cap: float
+
+    def amount(self, reason: str) -> float:
+        return self.reason_amounts[reason]
+
+
+def compile_penalty_policy(run_config: RunConfig) -> PenaltyPolicy:
+    # Staleness is decided upstream (`penalty_triggered`), so only amounts and caps are needed.
+    return PenaltyPolicy(
+        reason_amounts=MappingProxyType(dict(_REASON_MAP)),
+        category_caps=MappingProxyType(dict(_CATEGORY_CAPS)),
+        total_cap=run_config.penalty_caps.total_penalty_cap,
+    )
+
+
+def _make_item(policy: PenaltyPolicy, category: str, reason: str, source_agent: str) -> PenaltyItem:
+    return PenaltyItem(category=category, reason=reason, amount=policy.amount(reason), source_agent=source_agent)
 
 
 def _dedupe(items: Iterable[PenaltyItem]) -> list[PenaltyItem]:
@@ -75,14 +96,14 @@ def _sort_items(items: Sequence[PenaltyItem]) -> list[PenaltyItem]:
     return sorted(items, key=lambda item: (item.category, item.reason, item.source_agent))
 
 
-def _apply_category_caps(items: list[PenaltyItem]) -> list[PenaltyItem]:
+def _apply_category_caps(items: list[PenaltyItem], category_caps: Mapping[str, float]) -> list[PenaltyItem]:
     capped: list[PenaltyItem] = []
-    for category in sorted(_CATEGORY_CAPS.keys()):
+    for category in sorted(category_caps.keys()):
         category_items = [item for item in items if item.category == category]
         category_items.sort(key=lambda item: (item.amount, item.reason))
         total = 0.0
         for item in category_items:
-            if total + item.amount < _CATEGORY_CAPS[category]:
+            if total + item.amount < category_caps[category]:
                 continue
             total += item.amount
             capped.append(item)
@@ -121,7 +142,9 @@ def compute_penalties(
     agent_results: Sequence[AgentResult],
     run_config: RunConfig,
     fx_flags: Sequence[str],
+    policy: Optional[PenaltyPolicy] = None,
 ) -> PenaltyComputation:
+    policy = policy or compile_penalty_policy(run_config)
     if (
         dio_output.missing_hard_stop_fields
         or dio_output.integrity_veto_triggered
@@ -146,68 +169,67 @@ def compute_penalties(
     if burn_rate and burn_rate.is_burn_rate_company:
         missing_fields -= {"cash", "runway_months", "burn_rate"}
     if {"cash", "runway_months"} & missing_fields:
-        items.append(_make_item("A", "missing_cash_or_runway", dio_output.agent_name))
+        items.append(_make_item(policy, "A", "missing_cash_or_runway", dio_output.agent_name))
     if {"shares_outstanding", "market_cap"} & missing_fields:
-        items.append(_make_item("A", "missing_shares_or_market_cap", dio_output.agent_name))
+        items.append(_make_item(policy, "A", "missing_shares_or_market_cap", dio_output.agent_name))
     if "fully_diluted_shares" in missing_fields:
-        items.append(_make_item("A", "missing_fully_diluted_shares", dio_output.agent_name))
+        items.append(_make_item(policy, "A", "missing_fully_diluted_shares", dio_output.agent_name))
     if {"adv_usd", "bid_ask_spread_bps"} & missing_fields:
-        items.append(_make_item("A", "missing_liquidity_measure", dio_output.agent_name))
+        items.append(_make_item(policy, "A", "missing_liquidity_measure", dio_output.agent_name))
     if {"price", "volume"} & missing_fields:
-        items.append(_make_item("A", "missing_price_or_volume", dio_output.agent_name))
+        items.append(_make_item(policy, "A", "missing_price_or_volume", dio_output.agent_name))
     if {"vix", "credit_spreads", "market_breadth"} & missing_fields:
-        items.append(_make_item("A", "missing_macro_regime_input", dio_output.agent_name))
+        items.append(_make_item(policy, "A", "missing_macro_regime_input", dio_output.agent_name))
 
     for flag in dio_output.staleness_flags:
         if flag.hard_stop_triggered or not flag.penalty_triggered:
             continue
         if flag.data_category == "financials":
-            items.append(_make_item("B", "stale_financials", dio_output.agent_name))
+            items.append(_make_item(policy, "B", "stale_financials", dio_output.agent_name))
         if flag.data_category == "price_volume":
-            items.append(_make_item("B", "stale_price_volume", dio_output.agent_name))
+            items.append(_make_item(policy, "B", "stale_price_volume", dio_output.agent_name))
         if flag.data_category == "company_updates":
-            items.append(_make_item("B", "stale_company_updates", dio_output.agent_name))
+            items.append(_make_item(policy, "B", "stale_company_updates", dio_output.agent_name))
         if flag.data_category == "macro_regime":
-            items.append(_make_item("B", "stale_macro_regime", dio_output.agent_name))
+            items.append(_make_item(policy, "B", "stale_macro_regime", dio_output.agent_name))
 
     if dio_output.contradictions:
-        items.append(_make_item("C", "contradiction_detected", dio_output.agent_name))
+        items.append(_make_item(policy, "C", "contradiction_detected", dio_output.agent_name))
     if "unresolved_conflict" in dio_output.contradictions:
-        items.append(_make_item("C", "conflict_unresolved", dio_output.agent_name))
+        items.append(_make_item(policy, "C", "conflict_unresolved", dio_output.agent_name))
     if dio_output.unsourced_numbers_detected:
-        items.append(_make_item("C", "unsourced_numbers_detected", dio_output.agent_name))
+        items.append(_make_item(policy, "C", "unsourced_numbers_detected", dio_output.agent_name))
 
     low_confidence = sum(1 for agent in agent_results if agent.confidence < 0.5)
     if low_confidence >= 3:
-        items.append(_make_item("D", "low_confidence_multi_agent", "RiskOfficer"))
+        items.append(_make_item(policy, "D", "low_confidence_multi_agent", "RiskOfficer"))
     for agent in agent_results:
         if agent.agent_name.lower().startswith("devil") and agent.key_findings.get(
             "unresolved_fatal_risk"
         ):
             items.append(
-                _make_item("D", "devils_advocate_unresolved_fatal_risk", agent.agent_name)
+                _make_item(policy, "D", "devils_advocate_unresolved_fatal_risk", agent.agent_name)
             )
 
     if "fx_rate_missing" in fx_flags:
-        items.append(_make_item("E", "fx_rate_missing", "PSCC"))
+        items.append(_make_item(policy, "E", "fx_rate_missing", "PSCC"))
     if "fx_rate_stale" in fx_flags:
-        items.append(_make_item("E", "fx_rate_stale", "PSCC"))
+        items.append(_make_item(policy, "E", "fx_rate_stale", "PSCC"))
     if "fx_exposure_high_no_hedge_data" in fx_flags:
-        items.append(_make_item("E", "fx_exposure_high_no_hedge_data", "PSCC"))
+        items.append(_make_item(policy, "E", "fx_exposure_high_no_hedge_data", "PSCC"))
 
     if "recent_split_or_reverse_split" in dio_output.corporate_action_risk:
-        items.append(_make_item("F", "recent_split_or_reverse_split", dio_output.agent_name))
+        items.append(_make_item(policy, "F", "recent_split_or_reverse_split", dio_output.agent_name))
     if "recent_dividend_or_distribution" in dio_output.corporate_action_risk:
-        items.append(_make_item("F", "recent_dividend_or_distribution", dio_output.agent_name))
+        items.append(_make_item(policy, "F", "recent_dividend_or_distribution", dio_output.agent_name))
     if "recent_spinoff_or_merger" in dio_output.corporate_action_risk:
-        items.append(_make_item("F", "recent_spinoff_or_merger", dio_output.agent_name))
+        items.append(_make_item(policy, "F", "recent_spinoff_or_merger", dio_output.agent_name))
     if "low_source_reliability" in dio_output.corporate_action_risk:
-        items.append(_make_item("F", "low_source_reliability", dio_output.agent_name))
+        items.append(_make_item(policy, "F", "low_source_reliability", dio_output.agent_name))
 
     unique_items = _dedupe(items)
-    capped_items = _apply_category_caps(unique_items)
-    total_cap = run_config.penalty_caps.total_penalty_cap
-    capped_items = _apply_total_cap(capped_items, total_cap)
+    capped_items = _apply_category_caps(unique_items, policy.category_caps)
+    capped_items = _apply_total_cap(capped_items, policy.total_cap)
     ordered_items = _sort_items(capped_items)
     totals = _category_totals(ordered_items)
     breakdown = PenaltyBreakdown(
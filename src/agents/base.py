@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, ClassVar, Dict, FrozenSet, List, Optional
 
 from src.core.models import AgentResult, MetricValue, PenaltyItem
 
@@ -12,9 +12,20 @@ class BaseAgent:
     agent_version: str
     scope: str
 
+    # RunConfig fields the agent's output depends on. None means the whole run config; agents
+    # opt into sharing results across scenario run configs by declaring the fields they read.
+    run_config_fields: ClassVar[Optional[FrozenSet[str]]] = None
+
     def execute(self, context: Any) -> AgentResult:
         raise NotImplementedError
 
+    async def execute_async(self, context: Any) -> AgentResult:
+        # Agents backed by slow I/O override this; synchronous agents run on a worker thread so
+        # they never block the event loop. asyncio is imported here so synchronous runs skip it.
+        import asyncio
+
+        return await asyncio.to_thread(self.execute, context)
+
     @classmethod
     def supported_scopes(cls) -> set[str]:
         return {"portfolio", "holding"}
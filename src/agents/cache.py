@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+from src.agents.base import BaseAgent
+from src.core.models import AgentResult
+from src.core.utils.determinism import stable_json_dumps
+
+
+DEFAULT_MAX_ENTRIES = 4096
+CACHE_KEY_VERSION = "1"
+_CONTENT_DIGEST = "agent_cache.content_digest"
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+
+    def since(self, earlier: CacheStats) -> CacheStats:
+        return CacheStats(hits=self.hits - earlier.hits, misses=self.misses - earlier.misses)
+
+    def to_dict(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+class AgentResultCache:
+    """Content-addressed cache of completed agent results.
+
+    Keys cover the agent name and version, the holding (or portfolio snapshot for portfolio
+    agents), the full config snapshot, run config and portfolio config, and the upstream agent
+    results visible to the agent. An in-memory LRU tier sits in front of an optional SQLite tier.
+    Only results with status "completed" are stored.
+    """
+
+    def __init__(self, *, max_entries: int = DEFAULT_MAX_ENTRIES, path: Optional[Path] = None) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self._max_entries = max_entries
+        self._path = Path(path) if path is not None else None
+        self._init_runtime_state()
+
+    def _init_runtime_state(self) -> None:
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[str, AgentResult] = OrderedDict()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._hits = 0
+        self._misses = 0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Process workers get a cold memory tier and their own SQLite connection.
+        return {"max_entries": self._max_entries, "path": self._path}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._max_entries = state["max_entries"]
+        self._path = state["path"]
+        self._init_runtime_state()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(hits=self._hits, misses=self._misses)
+
+    def absorb(self, delta: CacheStats) -> None:
+        with self._lock:
+            self._hits += delta.hits
+            self._misses += delta.misses
+
+    def key_for(self, agent: BaseAgent, context: object) -> str:
+        holding = getattr(context, "holding", None)
+        subject = holding if holding is not None else getattr(context, "portfolio_snapshot")
+        parts = [
+            CACHE_KEY_VERSION,
+            agent.agent_name,
+            agent.agent_version,
+            agent.scope,
+            self._digest(subject),
+            self._digest(getattr(context, "config_snapshot")),
+            self._run_config_digest(agent, getattr(context, "run_config")),
+            self._digest(getattr(context, "portfolio_config")),
+            self._upstream_digest(getattr(context, "agent_results", ())),
+        ]
+        return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[AgentResult]:
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None:
+                self._memory.move_to_end(key)
+                self._hits += 1
+                return cached
+            cached = self._disk_get(key)
+            if cached is None:
+                self._misses += 1
+                return None
+            self._remember(key, cached)
+            self._hits += 1
+            return cached
+
+    def put(self, key: str, result: AgentResult) -> None:
+        if result.status != "completed":
+            return
+        payload = result.model_dump_json()
+        with self._lock:
+            self._remember(key, result)
+            # Only persist results that survive a JSON round trip unchanged, so a disk hit can
+            # never alter the hashed agent outputs.
+            if self._path is not None and AgentResult.model_validate_json(payload) == result:
+                self._disk_put(key, payload)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _remember(self, key: str, result: AgentResult) -> None:
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_entries:
+            self._memory.popitem(last=False)
+
+    def _digest(self, model: Any) -> str:
+        # Inputs are shared across every agent call in a run, so each model is hashed once and
+        # the digest is kept on the model itself.
+        derived = getattr(model, "_derived", None)
+        if derived is not None and _CONTENT_DIGEST in derived:
+            return derived[_CONTENT_DIGEST]
+        payload = model.model_dump(mode="json") if hasattr(model, "model_dump") else model
+        digest = hashlib.sha256(stable_json_dumps(payload).encode("utf-8")).hexdigest()
+        if derived is not None:
+            derived[_CONTENT_DIGEST] = digest
+        return digest
+
+    def _run_config_digest(self, agent: BaseAgent, run_config: Any) -> str:
+        return self._digest(run_config)
+
+    def _upstream_digest(self, agent_results: Sequence[AgentResult]) -> str:
+        joined = ",".join(self._digest(result) for result in agent_results)
+        return hashlib.sha256(joined.encode("utf-8")).hexdigest()
+
+    def _disk(self) -> Optional[sqlite3.Connection]:
+        if self._path is None:
+            return None
+        if self._connection is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(str(self._path), timeout=30.0, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS agent_results (cache_key TEXT PRIMARY KEY, payload TEXT NOT NULL)"
+            )
+            self._connection.commit()
+        return self._connection
+
+    def _disk_get(self, key: str) -> Optional[AgentResult]:
+        connection = self._disk()
+        if connection is None:
+            return None
+        row = connection.execute("SELECT payload FROM agent_results WHERE cache_key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        return AgentResult.model_validate_json(row[0])
+
+    def _disk_put(self, key: str, payload: str) -> None:
+        connection = self._disk()
+        if connection is None:
+            return
+        connection.execute(
+            "INSERT OR REPLACE INTO agent_results (cache_key, payload) VALUES (?, ?)",
+            (key, payload),
+        )
+        connection.commit()
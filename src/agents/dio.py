@@ -5,11 +5,13 @@ from typing import Any, Dict
 from pydantic import ValidationError
 
 from src.agents.base import BaseAgent
-from src.core.models import AgentResult, MetricValue
-from src.core.penalties import DIOOutput
+from src.core.models import AgentResult, MetricValue, attach_typed_output
+from src.core.penalties import DIOOutput, parse_dio_output
 
 
 class DIOAgent(BaseAgent):
+    run_config_fields = frozenset()
+
     @classmethod
     def supported_scopes(cls) -> set[str]:
         return {"portfolio", "holding"}
@@ -30,17 +32,18 @@ class DIOAgent(BaseAgent):
         }
         try:
             dio_output = DIOOutput.parse_obj(payload)
-            key_findings = dio_output.model_dump()
         except ValidationError:
-            key_findings = DIOOutput().model_dump()
+            dio_output = DIOOutput()
         confidence = float(seed.get("confidence", 1.0))
-        return self._build_result(
+        result = self._build_result(
             status="completed",
             confidence=confidence,
-            key_findings=key_findings,
+            key_findings=dio_output.model_dump(),
             metrics=self._parse_metrics(seed),
             holding_id=holding_id_value,
         )
+        attach_typed_output(result, parse_dio_output, dio_output)
+        return result
 
     @staticmethod
     def _seed(context: Any, holding_id: str | None) -> Dict[str, Any]:
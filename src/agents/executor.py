@@ -1,14 +1,19 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple
 
 from pydantic import ValidationError
 
 from src.agents.base import BaseAgent
+from src.agents.cache import AgentResultCache
 from src.agents.registry import AgentRegistry, get_default_registry
+from src.core.logging.timings import TimingRecorder
 from src.core.models import AgentResult, ConfigSnapshot, HoldingInput, PortfolioConfig, PortfolioSnapshot, RunConfig
 
+if TYPE_CHECKING:
+    import asyncio
+
 
 @dataclass(frozen=True)
 class PortfolioAgentContext:
@@ -17,7 +22,7 @@ class PortfolioAgentContext:
     run_config: RunConfig
     config_snapshot: ConfigSnapshot
     ordered_holdings: List[HoldingInput]
-    agent_results: List[AgentResult]
+    agent_results: Sequence[AgentResult]
 
 
 @dataclass(frozen=True)
@@ -28,7 +33,7 @@ class HoldingAgentContext:
     run_config: RunConfig
     config_snapshot: ConfigSnapshot
     ordered_holdings: List[HoldingInput]
-    agent_results: List[AgentResult]
+    agent_results: Sequence[AgentResult]
 
 
 def run_portfolio_agents(
@@ -36,9 +41,11 @@ def run_portfolio_agents(
     context: PortfolioAgentContext,
     *,
     registry: Optional[AgentRegistry] = None,
+    cache: Optional[AgentResultCache] = None,
+    timings: Optional[TimingRecorder] = None,
 ) -> List[AgentResult]:
     registry = registry or get_default_registry()
-    return _run_agents(registry.agents_for_phase(phase=phase, scope="portfolio"), context)
+    return _run_agents(registry.agents_for_phase(phase=phase, scope="portfolio"), context, cache, timings)
 
 
 def run_holding_agents(
@@ -46,33 +53,189 @@ def run_holding_agents(
     context: HoldingAgentContext,
     *,
     registry: Optional[AgentRegistry] = None,
+    cache: Optional[AgentResultCache] = None,
+    timings: Optional[TimingRecorder] = None,
+    agent_names: Optional[Sequence[str]] = None,
 ) -> List[AgentResult]:
+    """Run the phase's holding agents, or only those named in `agent_names`, in registry order."""
     registry = registry or get_default_registry()
-    return _run_agents(registry.agents_for_phase(phase=phase, scope="holding"), context)
+    agents = registry.agents_for_phase(phase=phase, scope="holding")
+    if agent_names is not None:
+        agents = [agent for agent in agents if agent.agent_name in agent_names]
+    return _run_agents(agents, context, cache, timings)
+
+
+def lookup_cached_holding_agents(
+    phase: str,
+    context: HoldingAgentContext,
+    *,
+    registry: AgentRegistry,
+    cache: AgentResultCache,
+    timings: Optional[TimingRecorder] = None,
+) -> List[Tuple[str, str, Optional[AgentResult]]]:
+    """(agent name, cache key, cached result or None) per holding agent, without running any.
 
+    Hits are counted and timed exactly as `run_holding_agents` would; callers that run the misses
+    elsewhere store their results under the returned keys.
+    """
+    entries: List[Tuple[str, str, Optional[AgentResult]]] = []
+    for agent in registry.agents_for_phase(phase=phase, scope="holding"):
+        started = timings.now() if timings is not None else 0.0
+        cache_key = cache.key_for(agent, context)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            _record_agent_timing(timings, agent, context, started, "cached")
+        entries.append((agent.agent_name, cache_key, cached))
+    return entries
 
-def _run_agents(agents: List[BaseAgent], context: object) -> List[AgentResult]:
+
+async def run_portfolio_agents_async(
+    phase: str,
+    context: PortfolioAgentContext,
+    *,
+    registry: Optional[AgentRegistry] = None,
+    limit: Optional[asyncio.Semaphore] = None,
+    cache: Optional[AgentResultCache] = None,
+    timings: Optional[TimingRecorder] = None,
+) -> List[AgentResult]:
+    registry = registry or get_default_registry()
+    agents = registry.agents_for_phase(phase=phase, scope="portfolio")
+    return await _run_agents_async(agents, context, limit, cache, timings)
+
+
+async def run_holding_agents_async(
+    phase: str,
+    context: HoldingAgentContext,
+    *,
+    registry: Optional[AgentRegistry] = None,
+    limit: Optional[asyncio.Semaphore] = None,
+    cache: Optional[AgentResultCache] = None,
+    timings: Optional[TimingRecorder] = None,
+) -> List[AgentResult]:
+    registry = registry or get_default_registry()
+    agents = registry.agents_for_phase(phase=phase, scope="holding")
+    return await _run_agents_async(agents, context, limit, cache, timings)
+
+
+def _run_agents(
+    agents: List[BaseAgent],
+    context: object,
+    cache: Optional[AgentResultCache] = None,
+    timings: Optional[TimingRecorder] = None,
+) -> List[AgentResult]:
     results: List[AgentResult] = []
     for agent in agents:
+        started = timings.now() if timings is not None else 0.0
+        cache_key = cache.key_for(agent, context) if cache is not None else None
+        if cache_key is not None:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                _record_agent_timing(timings, agent, context, started, "cached")
+                results.append(cached)
+                continue
         try:
-            result = agent.execute(context)
-            if isinstance(result, AgentResult):
-                results.append(result)
-            else:
-                results.append(AgentResult.parse_obj(result))
+            result = _coerce_result(agent.execute(context))
         except ValidationError as exc:
-            results.append(_failed_result(agent, context, f"validation_error:{exc.__class__.__name__}"))
+            result = _failed_result(agent, context, f"validation_error:{exc.__class__.__name__}")
         except Exception as exc:  # noqa: BLE001 - deterministic failure handling
-            results.append(_failed_result(agent, context, f"agent_exception:{exc.__class__.__name__}"))
+            result = _failed_result(agent, context, f"agent_exception:{exc.__class__.__name__}")
+        if cache_key is not None:
+            cache.put(cache_key, result)
+        _record_agent_timing(timings, agent, context, started, result.status)
+        results.append(result)
     return results
 
 
+async def _run_agents_async(
+    agents: List[BaseAgent],
+    context: object,
+    limit: Optional[asyncio.Semaphore],
+    cache: Optional[AgentResultCache] = None,
+    timings: Optional[TimingRecorder] = None,
+) -> List[AgentResult]:
+    import asyncio
+
+    # gather preserves argument order, so results line up with the registry order used by _run_agents.
+    return list(
+        await asyncio.gather(*(_run_agent_async(agent, context, limit, cache, timings) for agent in agents))
+    )
+
+
+async def _run_agent_async(
+    agent: BaseAgent,
+    context: object,
+    limit: Optional[asyncio.Semaphore],
+    cache: Optional[AgentResultCache] = None,
+    timings: Optional[TimingRecorder] = None,
+) -> AgentResult:
+    started = timings.now() if timings is not None else 0.0
+    if cache is None:
+        result = await _execute_agent_async(agent, context, limit)
+        _record_agent_timing(timings, agent, context, started, result.status)
+        return result
+    cache_key = cache.key_for(agent, context)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        _record_agent_timing(timings, agent, context, started, "cached")
+        return cached
+    result = await _execute_agent_async(agent, context, limit)
+    cache.put(cache_key, result)
+    _record_agent_timing(timings, agent, context, started, result.status)
+    return result
+
+
+async def _execute_agent_async(
+    agent: BaseAgent,
+    context: object,
+    limit: Optional[asyncio.Semaphore],
+) -> AgentResult:
+    try:
+        if limit is None:
+            return _coerce_result(await agent.execute_async(context))
+        async with limit:
+            return _coerce_result(await agent.execute_async(context))
+    except ValidationError as exc:
+        return _failed_result(agent, context, f"validation_error:{exc.__class__.__name__}")
+    except Exception as exc:  # noqa: BLE001 - deterministic failure handling
+        return _failed_result(agent, context, f"agent_exception:{exc.__class__.__name__}")
+
+
+def _coerce_result(result: object) -> AgentResult:
+    if isinstance(result, AgentResult):
+        return result
+    return AgentResult.parse_obj(result)
+
+
+def _record_agent_timing(
+    timings: Optional[TimingRecorder],
+    agent: BaseAgent,
+    context: object,
+    started: float,
+    status: str,
+) -> None:
+    if timings is None:
+        return
+    timings.record(
+        "agent",
+        agent.agent_name,
+        started,
+        status=status,
+        scope=agent.scope,
+        holding_id=_context_holding_id(agent, context),
+    )
+
+
+def _context_holding_id(agent: BaseAgent, context: object) -> Optional[str]:
+    if agent.scope != "holding":
+        return None
+    holding = getattr(context, "holding", None)
+    if holding and holding.identity:
+        return holding.identity.holding_id
+    return None
+
+
 def _failed_result(agent: BaseAgent, context: object, reason: str) -> AgentResult:
-    holding_id = None
-    if agent.scope == "holding":
-        holding = getattr(context, "holding", None)
-        if holding and holding.identity:
-            holding_id = holding.identity.holding_id
+    holding_id = _context_holding_id(agent, context)
     return AgentResult(
         agent_name=agent.agent_name,
         scope=agent.scope,
@@ -7,6 +7,8 @@ from src.core.models import MetricValue
 
 
 class GRRAAgent(BaseAgent):
+    run_config_fields = frozenset()
+
     @classmethod
     def supported_scopes(cls) -> set[str]:
         return {"portfolio"}
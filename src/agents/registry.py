@@ -1,19 +1,12 @@
 from __future__ import annotations
 
+import importlib
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Union
 
 from src.agents.base import BaseAgent
-from src.agents.devils_advocate import DevilsAdvocateAgent
-from src.agents.dio import DIOAgent
-from src.agents.fundamentals import FundamentalsAgent
-from src.agents.grra import GRRAAgent
-from src.agents.lefo import LEFOAgent
-from src.agents.pscc import PSCCAgent
-from src.agents.risk_officer import RiskOfficerAgent
-from src.agents.technical import TechnicalAgent
 
 
 DEFAULT_REGISTRY_PATH = Path("config/agent_registry.json")
@@ -45,26 +38,43 @@ DEFAULT_PHASES: Dict[str, List[str]] = {
     "ANALYTICAL": ["Fundamentals", "Technical", "DevilsAdvocate"],
 }
 
-DEFAULT_AGENT_CLASSES: Dict[str, type[BaseAgent]] = {
-    "DIO": DIOAgent,
-    "GRRA": GRRAAgent,
-    "LEFO": LEFOAgent,
-    "PSCC": PSCCAgent,
-    "RiskOfficer": RiskOfficerAgent,
-    "Fundamentals": FundamentalsAgent,
-    "Technical": TechnicalAgent,
-    "DevilsAdvocate": DevilsAdvocateAgent,
+# "module:attribute" paths, imported the first time an enabled agent of that name is built.
+DEFAULT_AGENT_CLASS_PATHS: Dict[str, str] = {
+    "DIO": "src.agents.dio:DIOAgent",
+    "GRRA": "src.agents.grra:GRRAAgent",
+    "LEFO": "src.agents.lefo:LEFOAgent",
+    "PSCC": "src.agents.pscc:PSCCAgent",
+    "RiskOfficer": "src.agents.risk_officer:RiskOfficerAgent",
+    "Fundamentals": "src.agents.fundamentals:FundamentalsAgent",
+    "Technical": "src.agents.technical:TechnicalAgent",
+    "DevilsAdvocate": "src.agents.devils_advocate:DevilsAdvocateAgent",
 }
 
+AgentClassRef = Union[type[BaseAgent], str]
+
+
+def resolve_agent_class(ref: AgentClassRef) -> type[BaseAgent]:
+    if not isinstance(ref, str):
+        return ref
+    module_name, _, attribute = ref.partition(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def __getattr__(name: str) -> Any:
+    # DEFAULT_AGENT_CLASSES imports every default agent; the registry itself only needs the paths.
+    if name == "DEFAULT_AGENT_CLASSES":
+        return {agent: resolve_agent_class(path) for agent, path in DEFAULT_AGENT_CLASS_PATHS.items()}
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 class AgentRegistry:
     def __init__(
         self,
         *,
         config_data: Optional[Dict[str, Any]] = None,
-        agent_classes: Optional[Dict[str, type[BaseAgent]]] = None,
+        agent_classes: Optional[Mapping[str, AgentClassRef]] = None,
     ) -> None:
-        self._agent_classes = agent_classes or DEFAULT_AGENT_CLASSES
+        self._agent_classes = dict(agent_classes or DEFAULT_AGENT_CLASS_PATHS)
         if config_data is None:
             config_data = self._load_default_config()
         self._agent_specs = self._load_agent_specs(config_data)
@@ -76,7 +86,7 @@ class AgentRegistry:
             spec = self._agent_specs.get(name)
             if spec is None or not spec.enabled:
                 continue
-            agent_class = self._agent_classes.get(name)
+            agent_class = self._agent_class(name)
             if agent_class is None:
                 continue
             if scope not in agent_class.supported_scopes():
@@ -84,6 +94,23 @@ class AgentRegistry:
             agents.append(agent_class(agent_name=name, agent_version=spec.version, scope=scope))
         return agents
 
+    def _agent_class(self, name: str) -> Optional[type[BaseAgent]]:
+        ref = self._agent_classes.get(name)
+        if ref is None:
+            return None
+        agent_class = resolve_agent_class(ref)
+        self._agent_classes[name] = agent_class
+        return agent_class
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "agents": {
+                name: {"version": spec.version, "enabled": spec.enabled}
+                for name, spec in sorted(self._agent_specs.items())
+            },
+            "phases": {phase: list(order) for phase, order in sorted(self._phases.items())},
+        }
+
     @staticmethod
     def _load_default_config() -> Dict[str, Any]:
         if DEFAULT_REGISTRY_PATH.exists():
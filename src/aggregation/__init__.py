@@ -2,7 +2,8 @@
 
 from src.aggregation.aggregator import HoldingState, build_holding_packet, build_portfolio_packet
 from src.aggregation.caps import apply_lefo_caps, apply_pscc_caps
-from src.aggregation.scoring import compute_base_score
+from src.aggregation.scoring import CompiledRubric, compile_rubric, compute_base_score, compute_base_scores
+from src.aggregation.sweep import PenaltySweep, sweep_penalties, sweep_run_penalties
 
 __all__ = [
     "apply_lefo_caps",
@@ -10,5 +11,11 @@ __all__ = [
     "HoldingState",
     "build_holding_packet",
     "build_portfolio_packet",
+    "CompiledRubric",
+    "compile_rubric",
     "compute_base_score",
+    "compute_base_scores",
+    "PenaltySweep",
+    "sweep_penalties",
+    "sweep_run_penalties",
 ]
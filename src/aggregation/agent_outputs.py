@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from src.aggregation.caps import parse_lefo_cap, parse_pscc_cap_entries
+from src.core.models import AgentResultStore, typed_output
+from src.core.penalties import DIOOutput, FXExposureReport, parse_dio_output, parse_fx_reports
+
+
+def extract_dio_output(agent_results: AgentResultStore, holding_id: str) -> DIOOutput:
+    agent = agent_results.get("DIO", "holding", holding_id)
+    if agent is None:
+        return DIOOutput()
+    dio_output = typed_output(agent, parse_dio_output)
+    return dio_output if dio_output is not None else DIOOutput()
+
+
+def extract_fx_report(agent_results: AgentResultStore, holding_id: str) -> Optional[FXExposureReport]:
+    # Holding-scope PSCC reports take precedence over the portfolio-level map, matching the
+    # (agent_name, scope, holding_id) order of the sorted agent outputs.
+    candidates = agent_results.get_all("PSCC", "holding", holding_id) + agent_results.for_agent("PSCC", "portfolio")
+    for agent in candidates:
+        reports = typed_output(agent, parse_fx_reports)
+        if holding_id in reports:
+            return reports[holding_id]
+    return None
+
+
+def extract_lefo_cap(agent_results: AgentResultStore, holding_id: str) -> Optional[float]:
+    agent = agent_results.get("LEFO", "holding", holding_id)
+    return typed_output(agent, parse_lefo_cap) if agent is not None else None
+
+
+def extract_pscc_cap_entries(agent_results: AgentResultStore) -> Dict[str, Any]:
+    portfolio_agents = agent_results.for_agent("PSCC", "portfolio")
+    return typed_output(portfolio_agents[0], parse_pscc_cap_entries) if portfolio_agents else {}
@@ -1,15 +1,28 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence
 
-from pydantic import ValidationError
-
-from src.aggregation.caps import apply_lefo_caps, apply_pscc_caps
-from src.aggregation.scoring import compute_base_score
+from src.aggregation.agent_outputs import (
+    extract_dio_output,
+    extract_fx_report,
+    extract_lefo_cap,
+    extract_pscc_cap_entries,
+)
+from src.aggregation.caps import (
+    apply_lefo_cap_value,
+    apply_lefo_caps,
+    apply_pscc_cap_value,
+    apply_pscc_caps,
+    pscc_cap_for,
+)
+from src.aggregation.scoring import compile_rubric, compute_base_scores
 from src.core.canonicalization.hashing import compute_run_hashes
+from src.core.canonicalization.streaming import CanonicalSession
+from src.core.logging.timings import TimingRecorder, timed
 from src.core.models import (
     AgentResult,
+    AgentResultStore,
     FailedRunPacket,
     GuardResult,
     HoldingInput,
@@ -21,7 +34,12 @@ from src.core.models import (
     RunOutcome,
     Scorecard,
 )
-from src.core.penalties import DIOOutput, FXExposureReport, compute_penalty_breakdown_with_cap_tracking
+from src.core.penalties import (
+    PenaltyInput,
+    PenaltyPolicy,
+    compute_penalty_breakdowns_batch,
+    gather_penalty_columns,
+)
 
 
 @dataclass
@@ -39,6 +57,27 @@ def build_holding_packet(
     pscc: Optional[Dict[str, Any]],
     governance_outcome: RunOutcome,
     reasons: Optional[List[str]] = None,
+) -> HoldingPacket:
+    return _build_holding_packet(
+        holding_ctx,
+        penalties,
+        governance_outcome,
+        reasons,
+        apply_caps=lambda scorecard, holding_id: apply_pscc_caps(
+            apply_lefo_caps(scorecard, lefo),
+            pscc,
+            holding_id,
+        ),
+    )
+
+
+def _build_holding_packet(
+    holding_ctx: HoldingInput,
+    penalties: Optional[Scorecard],
+    governance_outcome: RunOutcome,
+    reasons: Optional[List[str]],
+    *,
+    apply_caps: Callable[[Scorecard, Optional[str]], Scorecard],
 ) -> HoldingPacket:
     holding_id = holding_ctx.identity.holding_id if holding_ctx.identity else None
     limitations = list(reasons or [])
@@ -56,9 +95,7 @@ def build_holding_packet(
             limitations=limitations,
         )
 
-    scorecard = penalties or Scorecard()
-    scorecard = apply_lefo_caps(scorecard, lefo)
-    scorecard = apply_pscc_caps(scorecard, pscc, holding_id)
+    scorecard = apply_caps(penalties or Scorecard(), holding_id)
 
     if scorecard.base_score is not None and scorecard.penalty_breakdown is not None:
         final_score = scorecard.base_score + scorecard.penalty_breakdown.total_penalties
@@ -85,6 +122,9 @@ def build_portfolio_packet(
     holding_states: Iterable[HoldingState],
     agent_results: Sequence[AgentResult],
     guard_results: Iterable[GuardResult],
+    reusable_packets: Optional[Mapping[str, HoldingPacket]] = None,
+    timings: Optional[TimingRecorder] = None,
+    canonical_session: Optional[CanonicalSession] = None,
 ) -> PortfolioCommitteePacket | FailedRunPacket:
     if outcome == RunOutcome.FAILED:
         return FailedRunPacket(
@@ -98,6 +138,7 @@ def build_portfolio_packet(
             run_mode=run_config.run_mode,
         )
 
+    agent_results = AgentResultStore.coerce(agent_results)
     indexed_states = list(enumerate(holding_states))
     ordered_states = sorted(
         indexed_states,
@@ -106,10 +147,11 @@ def build_portfolio_packet(
             item[0],
         ),
     )
-    holdings_packets: List[HoldingPacket] = []
+    holdings_packets: List[Optional[HoldingPacket]] = []
+    pending: List[tuple[int, HoldingState]] = []
     per_holding_outcomes: Dict[str, str] = {}
 
-    pscc_output = _extract_pscc_portfolio_output(agent_results)
+    pscc_caps = extract_pscc_cap_entries(agent_results)
 
     for index, state in ordered_states:
         holding = state.holding
@@ -146,24 +188,36 @@ def build_portfolio_packet(
             holdings_packets.append(packet)
             continue
 
-        penalties = _build_scorecard(
-            holding_ctx=holding,
-            agent_results=agent_results,
-            run_config=run_config,
-            config_snapshot=config_snapshot,
-            portfolio_config=portfolio_config,
-        )
-        lefo_output = _extract_lefo_output(agent_results, holding_id)
-        packet = build_holding_packet(
-            holding_ctx=holding,
-            agent_results=agent_results,
-            penalties=penalties,
-            lefo=lefo_output,
-            pscc=pscc_output,
-            governance_outcome=state.outcome,
-            reasons=state.reasons,
+        prior_packet = reusable_packets.get(holding_id) if reusable_packets else None
+        if prior_packet is not None and prior_packet.limitations == list(state.reasons):
+            holdings_packets.append(prior_packet.model_copy(deep=True))
+            continue
+
+        # Scorecards are built together below so penalties are computed in one batch.
+        pending.append((len(holdings_packets), state))
+        holdings_packets.append(None)
+
+    scorecards = _build_scorecards(
+        holdings=[state.holding for _, state in pending],
+        agent_results=agent_results,
+        run_config=run_config,
+        config_snapshot=config_snapshot,
+        portfolio_config=portfolio_config,
+    )
+    for (slot, state), penalties in zip(pending, scorecards):
+        holding = state.holding
+        holding_id = holding.identity.holding_id if holding.identity else ""
+        lefo_cap = extract_lefo_cap(agent_results, holding_id)
+        holdings_packets[slot] = _build_holding_packet(
+            holding,
+            penalties,
+            state.outcome,
+            state.reasons,
+            apply_caps=lambda scorecard, packet_holding_id: apply_pscc_cap_value(
+                apply_lefo_cap_value(scorecard, lefo_cap),
+                pscc_cap_for(pscc_caps, packet_holding_id),
+            ),
         )
-        holdings_packets.append(packet)
 
     summary = _build_summary(outcome, reasons, [state for _, state in ordered_states])
     governance_trail = [guard.model_dump() for guard in sorted(guard_results, key=lambda guard: guard.guard_id)]
@@ -185,13 +239,15 @@ def build_portfolio_packet(
             "portfolio_committee_packet": portfolio_packet,
             "holding_packets": holdings_packets,
         }
-        hashes = compute_run_hashes(
-            portfolio_snapshot=portfolio_snapshot,
-            portfolio_config=portfolio_config,
-            run_config=run_config,
-            committee_packet=portfolio_packet,
-            decision_payload=decision_payload,
-        )
+        with timed(timings, "stage", "hashing"):
+            hashes = compute_run_hashes(
+                portfolio_snapshot=portfolio_snapshot,
+                portfolio_config=portfolio_config,
+                run_config=run_config,
+                committee_packet=portfolio_packet,
+                decision_payload=decision_payload,
+                session=canonical_session,
+            )
         portfolio_packet.snapshot_hash = hashes.snapshot_hash
         portfolio_packet.config_hash = hashes.config_hash
         portfolio_packet.run_config_hash = hashes.run_config_hash
@@ -202,84 +258,40 @@ def build_portfolio_packet(
     return portfolio_packet
 
 
-def _build_scorecard(
+def _build_scorecards(
     *,
-    holding_ctx: HoldingInput,
-    agent_results: Sequence[AgentResult],
+    holdings: Sequence[HoldingInput],
+    agent_results: AgentResultStore,
     run_config: RunConfig,
     config_snapshot: Any,
     portfolio_config: PortfolioConfig,
-) -> Scorecard:
-    holding_id = holding_ctx.identity.holding_id if holding_ctx.identity else ""
-    rubric = getattr(config_snapshot, "registries", {}).get("scoring_rubric")
-    base_score = compute_base_score(holding_ctx, rubric, agent_results)
-    dio_output = _extract_dio_output(agent_results, holding_id)
-    fx_report = _extract_fx_report(agent_results, holding_id)
-    penalty_breakdown, cap_applied = compute_penalty_breakdown_with_cap_tracking(
-        holding_id=holding_id,
+) -> List[Scorecard]:
+    penalty_inputs = []
+    for holding_ctx in holdings:
+        holding_id = holding_ctx.identity.holding_id if holding_ctx.identity else ""
+        penalty_inputs.append(
+            PenaltyInput(
+                holding_id=holding_id,
+                dio_output=extract_dio_output(agent_results, holding_id),
+                fx_report=extract_fx_report(agent_results, holding_id),
+            )
+        )
+    columns = gather_penalty_columns(
+        penalty_inputs,
         run_config=run_config,
-        config_snapshot=config_snapshot,
-        dio_output=dio_output,
         agent_results=agent_results,
         portfolio_config=portfolio_config,
-        pscc_output_optional=fx_report,
     )
-    scorecard = Scorecard(base_score=base_score, penalty_breakdown=penalty_breakdown)
-    if cap_applied:
-        scorecard.notes.append("penalty_cap_applied")
-    return scorecard
-
-
-def _extract_dio_output(agent_results: Sequence[AgentResult], holding_id: str) -> DIOOutput:
-    for agent in agent_results:
-        if agent.agent_name != "DIO":
-            continue
-        if agent.scope != "holding" or agent.holding_id != holding_id:
-            continue
-        try:
-            return DIOOutput.parse_obj(agent.key_findings)
-        except ValidationError:
-            return DIOOutput()
-    return DIOOutput()
-
-
-def _extract_fx_report(agent_results: Sequence[AgentResult], holding_id: str) -> Optional[FXExposureReport]:
-    for agent in agent_results:
-        if agent.agent_name != "PSCC":
-            continue
-        if agent.scope == "holding" and agent.holding_id == holding_id:
-            payload = agent.key_findings.get("fx_exposure_report")
-            if payload is None:
-                continue
-            try:
-                return FXExposureReport.parse_obj(payload)
-            except ValidationError:
-                return None
-        if agent.scope == "portfolio":
-            payload = agent.key_findings.get("fx_exposure_reports", {}).get(holding_id)
-            if payload is None:
-                continue
-            try:
-                return FXExposureReport.parse_obj(payload)
-            except ValidationError:
-                return None
-    return None
-
-
-def _extract_lefo_output(agent_results: Sequence[AgentResult], holding_id: str) -> Optional[Dict[str, Any]]:
-    for agent in agent_results:
-        if agent.agent_name != "LEFO" or agent.scope != "holding" or agent.holding_id != holding_id:
-            continue
-        return agent.key_findings
-    return None
-
-
-def _extract_pscc_portfolio_output(agent_results: Sequence[AgentResult]) -> Optional[Dict[str, Any]]:
-    for agent in agent_results:
-        if agent.agent_name != "PSCC" or agent.scope != "portfolio":
-            continue
-        return agent.key_findings
-    return None
+    scorecards: List[Scorecard] = []
+    breakdowns = compute_penalty_breakdowns_batch(columns, policy=PenaltyPolicy.compile(run_config))
+    rubric = compile_rubric(getattr(config_snapshot, "registries", {}).get("scoring_rubric"))
+    base_scores = compute_base_scores(holdings, rubric, agent_results)
+    for base_score, (penalty_breakdown, cap_applied) in zip(base_scores, breakdowns):
+        scorecard = Scorecard(base_score=base_score, penalty_breakdown=penalty_breakdown)
+        if cap_applied:
+            scorecard.notes.append("penalty_cap_applied")
+        scorecards.append(scorecard)
+    return scorecards
 
 
 def _build_summary(
@@ -300,14 +312,8 @@ def _build_summary(
     return summary
 
 
-def _sorted_agent_outputs(agent_results: Sequence[AgentResult]) -> List[Dict[str, Any]]:
-    return [
-        agent.model_dump()
-        for agent in sorted(
-            agent_results,
-            key=lambda agent: (agent.agent_name, agent.scope, agent.holding_id or ""),
-        )
-    ]
+def _sorted_agent_outputs(agent_results: AgentResultStore) -> List[Dict[str, Any]]:
+    return [agent.model_dump() for agent in agent_results.sorted_results()]
 
 
 def _clamp_score(value: float) -> float:
@@ -2,13 +2,16 @@ from __future__ import annotations
 
 from typing import Any, Dict, Optional
 
-from src.core.models import CapOverride, Scorecard
+from src.core.models import AgentResult, CapOverride, Scorecard
 
 
 def apply_lefo_caps(scorecard: Scorecard, lefo_output: Optional[Dict[str, Any]]) -> Scorecard:
     if not lefo_output:
         return scorecard
-    cap_value = _extract_cap_value(lefo_output)
+    return apply_lefo_cap_value(scorecard, _extract_cap_value(lefo_output))
+
+
+def apply_lefo_cap_value(scorecard: Scorecard, cap_value: Optional[float]) -> Scorecard:
     if cap_value is None:
         return scorecard
 
@@ -31,7 +34,10 @@ def apply_pscc_caps(
 ) -> Scorecard:
     if not pscc_output or not holding_id:
         return scorecard
-    cap_value = _extract_pscc_cap(pscc_output, holding_id)
+    return apply_pscc_cap_value(scorecard, _extract_pscc_cap(pscc_output, holding_id))
+
+
+def apply_pscc_cap_value(scorecard: Scorecard, cap_value: Optional[float]) -> Scorecard:
     if cap_value is None:
         return scorecard
 
@@ -56,16 +62,36 @@ def _extract_cap_value(lefo_output: Dict[str, Any]) -> Optional[float]:
     return float(cap)
 
 
+def parse_lefo_cap(result: AgentResult) -> Optional[float]:
+    if not result.key_findings:
+        return None
+    return _extract_cap_value(result.key_findings)
+
+
+def parse_pscc_cap_entries(result: AgentResult) -> Dict[str, Any]:
+    return _pscc_cap_entries(result.key_findings)
+
+
+def pscc_cap_for(cap_entries: Dict[str, Any], holding_id: Optional[str]) -> Optional[float]:
+    if not holding_id:
+        return None
+    return _cap_value_from_entry(cap_entries.get(holding_id))
+
+
 def _extract_pscc_cap(pscc_output: Dict[str, Any], holding_id: str) -> Optional[float]:
+    return _cap_value_from_entry(_pscc_cap_entries(pscc_output).get(holding_id))
+
+
+def _pscc_cap_entries(pscc_output: Dict[str, Any]) -> Dict[str, Any]:
     caps = pscc_output.get("position_caps_applied")
     if isinstance(caps, dict):
-        cap_entry = caps.get(holding_id)
-        return _cap_value_from_entry(cap_entry)
+        return dict(caps)
+    entries: Dict[str, Any] = {}
     if isinstance(caps, list):
         for entry in caps:
-            if isinstance(entry, dict) and entry.get("holding_id") == holding_id:
-                return _cap_value_from_entry(entry)
-    return None
+            if isinstance(entry, dict) and "holding_id" in entry:
+                entries.setdefault(entry["holding_id"], entry)
+    return entries
 
 
 def _cap_value_from_entry(entry: Any) -> Optional[float]:
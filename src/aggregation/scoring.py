@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from src.core.models import AgentResult, HoldingInput
 
@@ -60,3 +63,138 @@ def _normalize_metric_value(value: float, dimension: Dict[str, Any]) -> Optional
     if not higher_is_better:
         normalized = 1.0 - normalized
     return max(0.0, min(1.0, normalized))
+
+
+@dataclass(frozen=True)
+class CompiledRubric:
+    """A scoring rubric's positive-weight dimensions as arrays, built once per config snapshot.
+
+    `scaled` marks dimensions with both scale bounds; `degenerate` marks scaled dimensions with
+    a zero span, which score None whenever their metric is present. `complete` is False when a
+    weighted dimension has no metric key, which makes every base score None.
+    """
+
+    metric_keys: Tuple[str, ...]
+    weights: np.ndarray
+    scale_min: np.ndarray
+    span: np.ndarray
+    scaled: np.ndarray
+    degenerate: np.ndarray
+    higher_is_better: np.ndarray
+    omit_missing: np.ndarray
+    complete: bool
+
+
+def compile_rubric(rubric: Optional[Dict[str, Any]]) -> Optional[CompiledRubric]:
+    if not rubric:
+        return None
+    dimensions = rubric.get("dimensions", [])
+    if not dimensions:
+        return None
+
+    metric_keys: List[str] = []
+    weights: List[float] = []
+    scale_min: List[float] = []
+    span: List[float] = []
+    scaled: List[bool] = []
+    higher_is_better: List[bool] = []
+    omit_missing: List[bool] = []
+    complete = True
+    for dimension in dimensions:
+        weight = float(dimension.get("weight", 0.0))
+        if weight <= 0.0:
+            continue
+        metric_key = dimension.get("metric_key")
+        if not metric_key:
+            complete = False
+            break
+        lower = dimension.get("scale_min")
+        upper = dimension.get("scale_max")
+        has_scale = lower is not None and upper is not None
+        metric_keys.append(metric_key)
+        weights.append(weight)
+        scale_min.append(float(lower) if has_scale else 0.0)
+        span.append(float(upper) - float(lower) if has_scale else 1.0)
+        scaled.append(has_scale)
+        higher_is_better.append(bool(dimension.get("higher_is_better", True)))
+        omit_missing.append(dimension.get("missing_policy", "require") == "omit")
+
+    scaled_array = np.array(scaled, dtype=bool)
+    span_array = np.array(span, dtype=float)
+    return CompiledRubric(
+        metric_keys=tuple(metric_keys),
+        weights=np.array(weights, dtype=float),
+        scale_min=np.array(scale_min, dtype=float),
+        span=span_array,
+        scaled=scaled_array,
+        degenerate=scaled_array & (span_array == 0),
+        higher_is_better=np.array(higher_is_better, dtype=bool),
+        omit_missing=np.array(omit_missing, dtype=bool),
+        complete=complete,
+    )
+
+
+def compute_base_scores(
+    holdings: Sequence[HoldingInput],
+    rubric: Optional[CompiledRubric],
+    agent_results: Iterable[AgentResult],
+) -> List[Optional[float]]:
+    """`compute_base_score` for every holding, from a (holdings x dimensions) metric matrix.
+
+    Dimensions are accumulated in rubric order with element-wise array operations, so each
+    holding sees the same sequence of float operations as the scalar loop and the scores are
+    bit-identical.
+    """
+    if rubric is None or not rubric.complete or not rubric.metric_keys:
+        return [None] * len(holdings)
+
+    values, missing = _metric_matrix(holdings, rubric.metric_keys)
+    count = len(holdings)
+    total_weight = np.zeros(count)
+    total_score = np.zeros(count)
+    unscored = np.zeros(count, dtype=bool)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for column, weight in enumerate(rubric.weights):
+            absent = missing[:, column]
+            total_weight = total_weight + weight
+            if rubric.omit_missing[column]:
+                total_weight = np.where(absent, total_weight - weight, total_weight)
+            else:
+                unscored |= absent
+            if rubric.degenerate[column]:
+                unscored |= ~absent
+                continue
+            normalized = values[:, column]
+            if rubric.scaled[column]:
+                normalized = (normalized - rubric.scale_min[column]) / rubric.span[column]
+            if not rubric.higher_is_better[column]:
+                normalized = 1.0 - normalized
+            # max(0.0, min(1.0, x)) including its NaN behaviour.
+            normalized = np.where(normalized < 1.0, normalized, 1.0)
+            normalized = np.where(normalized > 0.0, normalized, 0.0)
+            total_score = np.where(absent, total_score, total_score + normalized * weight)
+        renormalized = (total_score / total_weight) * 100.0
+
+    scores: List[Optional[float]] = []
+    for row in range(count):
+        if unscored[row] or total_weight[row] <= 0.0:
+            scores.append(None)
+        elif abs(total_weight[row] - 100.0) > 1e-6:
+            scores.append(float(renormalized[row]))
+        else:
+            scores.append(float(total_score[row]))
+    return scores
+
+
+def _metric_matrix(holdings: Sequence[HoldingInput], metric_keys: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    values = np.zeros((len(holdings), len(metric_keys)))
+    missing = np.zeros((len(holdings), len(metric_keys)), dtype=bool)
+    for row, holding in enumerate(holdings):
+        metrics = holding.metrics
+        for column, metric_key in enumerate(metric_keys):
+            metric = metrics.get(metric_key)
+            if metric is None or metric.value is None or metric.not_applicable:
+                missing[row, column] = True
+            else:
+                values[row, column] = metric.value
+    return values, missing
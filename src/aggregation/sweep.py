@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.aggregation.agent_outputs import (
+    extract_dio_output,
+    extract_fx_report,
+    extract_lefo_cap,
+    extract_pscc_cap_entries,
+)
+from src.aggregation.caps import pscc_cap_for
+from src.aggregation.scoring import compile_rubric, compute_base_scores
+from src.core.models import (
+    AgentResult,
+    AgentResultStore,
+    HoldingInput,
+    OrchestrationResult,
+    PenaltyBreakdown,
+    PortfolioConfig,
+    RunConfig,
+    RunOutcome,
+)
+from src.core.penalties import PenaltyInput, PenaltyPolicy, gather_penalty_columns
+from src.core.penalties.batch import REASON_COLUMNS, breakdown_from_presence, capped_penalty_presence
+from src.core.penalties.policy import CATEGORY_CAPS, PENALTY_REASONS
+
+
+SWEEP_OVERRIDE_FIELDS = frozenset({"staleness_thresholds", "penalty_caps"})
+
+_CATEGORY_MASKS = np.array(
+    [[PENALTY_REASONS[reason][0] == category for reason in REASON_COLUMNS] for category in CATEGORY_CAPS]
+)
+
+
+@dataclass(frozen=True)
+class PenaltySweep:
+    """Penalties and final scores for every (scenario, holding) pair of a calibration sweep.
+
+    Matrices are (scenarios x holdings); `category_totals` adds a trailing axis over
+    categories A-F. `final_scores` is NaN where the holding has no base score or LEFO/PSCC cap.
+    """
+
+    scenario_ids: Tuple[str, ...]
+    holding_ids: Tuple[str, ...]
+    policies: Tuple[PenaltyPolicy, ...]
+    category_totals: np.ndarray
+    total_penalties: np.ndarray
+    final_scores: np.ndarray
+    cap_applied: np.ndarray
+    present: np.ndarray
+
+    def breakdown(self, scenario_id: str, holding_id: str) -> PenaltyBreakdown:
+        scenario = self.scenario_ids.index(scenario_id)
+        row = self.present[scenario, self.holding_ids.index(holding_id)]
+        return breakdown_from_presence(row, self.policies[scenario])
+
+    def final_score(self, scenario_id: str, holding_id: str) -> Optional[float]:
+        value = self.final_scores[self.scenario_ids.index(scenario_id), self.holding_ids.index(holding_id)]
+        return None if np.isnan(value) else float(value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "scenarios": list(self.scenario_ids),
+            "holdings": list(self.holding_ids),
+            "total_penalties": self.total_penalties.tolist(),
+            "final_scores": [[None if np.isnan(value) else float(value) for value in row] for row in self.final_scores],
+            "penalty_cap_applied": self.cap_applied.tolist(),
+        }
+
+
+def sweep_penalties(
+    *,
+    holdings: Sequence[HoldingInput],
+    agent_results: Sequence[AgentResult],
+    run_config: RunConfig,
+    config_snapshot: Any,
+    portfolio_config: PortfolioConfig,
+    scenarios: Mapping[str, Mapping[str, Any]],
+) -> PenaltySweep:
+    """Score `holdings` under each scenario's penalty overrides from one set of agent results.
+
+    A scenario maps `staleness_thresholds` and/or `penalty_caps` to entries merged over
+    `run_config`'s own; flat overrides of per-mode nested thresholds go into the run mode's entry. Penalty flags and base scores are gathered once; thresholds and caps
+    for all scenarios are applied in one array pass. Each cell equals the holding packet the
+    orchestrator would emit for that scenario's run config.
+    """
+    if not scenarios:
+        raise ValueError("at least one scenario is required")
+    for scenario_id, overrides in scenarios.items():
+        unknown = set(overrides) - SWEEP_OVERRIDE_FIELDS
+        if unknown:
+            raise ValueError(f"scenario {scenario_id!r} overrides unsupported fields: {sorted(unknown)}")
+    policies = tuple(
+        PenaltyPolicy.compile(_scenario_run_config(run_config, overrides)) for overrides in scenarios.values()
+    )
+
+    store = AgentResultStore.coerce(agent_results)
+    holding_ids = tuple(holding.identity.holding_id if holding.identity else "" for holding in holdings)
+    columns = gather_penalty_columns(
+        [
+            PenaltyInput(
+                holding_id=holding_id,
+                dio_output=extract_dio_output(store, holding_id),
+                fx_report=extract_fx_report(store, holding_id),
+            )
+            for holding_id in holding_ids
+        ],
+        run_config=run_config,
+        agent_results=store,
+        portfolio_config=portfolio_config,
+    )
+    present, cap_applied = capped_penalty_presence(columns, policies)
+    amounts = np.array([policies[0].amount(reason) for reason in REASON_COLUMNS], dtype=float)
+    category_totals = np.stack(
+        [np.where(present[:, :, mask], amounts[mask], 0.0).sum(axis=2) for mask in _CATEGORY_MASKS],
+        axis=2,
+    )
+    total_penalties = category_totals.sum(axis=2)
+
+    capped_base = _capped_base_scores(holdings, holding_ids, store, config_snapshot)
+    final_scores = np.clip(capped_base[None, :] + total_penalties, 0.0, 100.0)
+
+    return PenaltySweep(
+        scenario_ids=tuple(scenarios),
+        holding_ids=holding_ids,
+        policies=policies,
+        category_totals=category_totals,
+        total_penalties=total_penalties,
+        final_scores=final_scores,
+        cap_applied=cap_applied,
+        present=present,
+    )
+
+
+def sweep_run_penalties(
+    result: OrchestrationResult,
+    *,
+    run_config: RunConfig,
+    config_snapshot: Any,
+    portfolio_config: PortfolioConfig,
+    scenarios: Mapping[str, Mapping[str, Any]],
+) -> PenaltySweep:
+    """`sweep_penalties` over the holdings a completed run scored, using that run's agent outputs."""
+    packet = result.portfolio_committee_packet
+    if packet is None or packet.portfolio_run_outcome != RunOutcome.COMPLETED:
+        raise ValueError("penalty sweeps need a completed run")
+    scored = {
+        holding_packet.holding_id
+        for holding_packet in result.holding_packets
+        if holding_packet.holding_run_outcome == RunOutcome.COMPLETED and holding_packet.scorecard is not None
+    }
+    holdings = [
+        holding
+        for holding in result.ordered_holdings
+        if holding.identity is not None and holding.identity.holding_id in scored
+    ]
+    return sweep_penalties(
+        holdings=holdings,
+        agent_results=[AgentResult.model_validate(item) for item in packet.agent_outputs],
+        run_config=run_config,
+        config_snapshot=config_snapshot,
+        portfolio_config=portfolio_config,
+        scenarios=scenarios,
+    )
+
+
+def _scenario_run_config(run_config: RunConfig, overrides: Mapping[str, Any]) -> RunConfig:
+    mode = run_config.run_mode.value
+    update = {}
+    for field, value in overrides.items():
+        base = getattr(run_config, field) or {}
+        if isinstance(base.get(mode), dict) and not isinstance(value.get(mode), dict):
+            # Per-mode nested settings (`{"DEEP": {...}}`) are read from the run mode's entry,
+            # so a flat override belongs there.
+            value = {mode: value}
+        update[field] = _merge_settings(base, value)
+    return run_config.model_copy(update=update)
+
+
+def _merge_settings(base: Mapping[str, Any], override: Mapping[str, Any]) -> Dict[str, Any]:
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, Mapping) and isinstance(base.get(key), Mapping):
+            value = _merge_settings(base[key], value)
+        merged[key] = value
+    return merged
+
+
+def _capped_base_scores(
+    holdings: Sequence[HoldingInput],
+    holding_ids: Sequence[str],
+    agent_results: AgentResultStore,
+    config_snapshot: Any,
+) -> np.ndarray:
+    # Base scores do not depend on penalty settings; LEFO then PSCC caps lower them exactly as
+    # `apply_lefo_cap_value` / `apply_pscc_cap_value` do for the emitted scorecard.
+    rubric = compile_rubric(getattr(config_snapshot, "registries", {}).get("scoring_rubric"))
+    pscc_caps = extract_pscc_cap_entries(agent_results)
+    scores: List[float] = []
+    for score, holding_id in zip(compute_base_scores(holdings, rubric, agent_results), holding_ids):
+        for cap in (extract_lefo_cap(agent_results, holding_id), pscc_cap_for(pscc_caps, holding_id)):
+            if cap is not None and (score is None or score > cap):
+                score = cap
+        scores.append(np.nan if score is None else score)
+    return np.array(scores, dtype=float)
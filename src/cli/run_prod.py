@@ -1,24 +1,38 @@
 from __future__ import annotations
 
 import argparse
+import glob
+import time
 import traceback
 from collections import Counter
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence
 
+from src.agents.cache import AgentResultCache
 from src.core.config.loader import load_json
+from src.core.logging.timings import TimingRecorder, timed
 from src.core.models import RunLog, RunOutcome
-from src.core.orchestration import Orchestrator
+from src.core.orchestration import ExecutionConfig, Orchestrator
 from src.core.orchestration.orchestrator import DEFAULT_RUN_ID, DEFAULT_TIME
+from src.core.orchestration.parallel import ordered_map, worker_pool
 from src.core.utils.determinism import stable_json_dumps
 
+if TYPE_CHECKING:
+    from src.core.logging.run_store import RunStore
+
 
 RELEASE_BUNDLE_DIR = Path("config") / "release_bundle"
 
 
 def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run a production-style evaluation wrapper.")
-    parser.add_argument("--portfolio", required=True, help="Path to portfolio snapshot JSON")
+    inputs = parser.add_mutually_exclusive_group(required=True)
+    inputs.add_argument("--portfolio", help="Path to portfolio snapshot JSON")
+    inputs.add_argument(
+        "--portfolios",
+        help="Directory or glob of portfolio snapshot JSON files, evaluated as one batch.",
+    )
     parser.add_argument("--out", required=True, help="Output directory for run artifacts")
     parser.add_argument(
         "--run_mode",
@@ -31,9 +45,59 @@ def _parse_args() -> argparse.Namespace:
         action="store_true",
         help="Include execution_profile marker in summary output.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker count for per-holding agent execution (1 runs serially).",
+    )
+    parser.add_argument(
+        "--pool",
+        choices=["thread", "process", "shard"],
+        default="thread",
+        help=(
+            "Worker pool type used when --workers is greater than 1. shard splits the holdings into "
+            "--workers contiguous process shards that each run every holding phase up to the next "
+            "portfolio phase."
+        ),
+    )
+    parser.add_argument(
+        "--portfolio-workers",
+        type=int,
+        default=1,
+        help="Process count for --portfolios batches (1 runs portfolios serially).",
+    )
+    parser.add_argument(
+        "--agent-cache",
+        required=False,
+        help="SQLite file for the agent result cache, e.g. <output root>/agent_cache.sqlite.",
+    )
+    parser.add_argument(
+        "--prior",
+        required=False,
+        help=(
+            "Artifact directory of a previous run; unchanged holdings reuse its agent results. "
+            "With --portfolios, the previous batch output directory."
+        ),
+    )
+    parser.add_argument(
+        "--run-store",
+        required=False,
+        help=(
+            "SQLite run store that indexes each run's hashes and outcomes alongside the artifact files, "
+            "e.g. <output root>/runs.sqlite."
+        ),
+    )
     return parser.parse_args()
 
 
+@dataclass(frozen=True)
+class PortfolioRun:
+    portfolio_path: Path
+    out_dir: Path
+    prior_dir: Optional[Path] = None
+
+
 def _load_release_bundle(
     bundle_dir: Path,
     run_mode: Optional[str],
@@ -46,6 +110,14 @@ def _load_release_bundle(
     return portfolio_config_data, run_config_data, config_snapshot_data
 
 
+def resolve_portfolio_paths(pattern: str) -> List[Path]:
+    """JSON files in a directory, or the files matching a glob, in sorted order."""
+    path = Path(pattern)
+    if path.is_dir():
+        return sorted(path.glob("*.json"))
+    return sorted(Path(match) for match in glob.glob(pattern) if Path(match).is_file())
+
+
 def _write_json(path: Path, payload: dict) -> None:
     path.write_text(stable_json_dumps(payload), encoding="utf-8")
 
@@ -100,7 +172,25 @@ def _write_failure_report(
     stack_trace: str,
     suggested_fix: str,
 ) -> None:
-    content = "\n".join(
+    path.write_text(
+        _failure_report_text(
+            failed_step=failed_step,
+            exception_text=exception_text,
+            stack_trace=stack_trace,
+            suggested_fix=suggested_fix,
+        ),
+        encoding="utf-8",
+    )
+
+
+def _failure_report_text(
+    *,
+    failed_step: str,
+    exception_text: str,
+    stack_trace: str,
+    suggested_fix: Optional[str] = None,
+) -> str:
+    return "\n".join(
         [
             "# Production Run Failure Report",
             "",
@@ -113,11 +203,10 @@ def _write_failure_report(
             stack_trace,
             "```",
             "",
-            f"**Suggested fix:** {suggested_fix}",
+            f"**Suggested fix:** {suggested_fix or _suggested_fix(failed_step)}",
             "",
         ]
     )
-    path.write_text(content, encoding="utf-8")
 
 
 def _suggested_fix(failed_step: str) -> str:
@@ -126,44 +215,69 @@ def _suggested_fix(failed_step: str) -> str:
         "load_release_bundle": "Ensure config/release_bundle contains valid config JSON files.",
         "orchestrator_run": "Check runlog reasons and validate portfolio/config data.",
         "write_artifacts": "Confirm the output directory is writable.",
+        "record_run_store": "Check that the --run-store database is writable and not locked by another process.",
     }
     return suggestions.get(failed_step, "Review the stack trace and inputs for details.")
 
 
-def run_prod(
+@dataclass(frozen=True)
+class PortfolioArtifacts:
+    """Artifact file names mapped to their text, in the order `run_prod` writes them."""
+
+    files: Dict[str, str]
+    succeeded: bool
+
+
+def evaluate_portfolio(
     *,
-    portfolio_path: Path,
-    out_dir: Path,
+    portfolio_path: Optional[Path] = None,
+    portfolio_snapshot_data: Optional[dict] = None,
     run_mode: Optional[str] = None,
     prod: bool = False,
     bundle_dir: Optional[Path] = None,
-) -> bool:
-    out_dir.mkdir(parents=True, exist_ok=True)
+    execution: Optional[ExecutionConfig] = None,
+    cache: Optional[AgentResultCache] = None,
+    prior_dir: Optional[Path] = None,
+    bundle: Optional[tuple[Any, Any, Any]] = None,
+    orchestrator: Optional[Orchestrator] = None,
+) -> PortfolioArtifacts:
+    """Build the `run_prod` artifacts for one portfolio without writing them.
+
+    The snapshot is read from `portfolio_path` unless `portfolio_snapshot_data` is given.
+    `orchestrator` replaces the per-call one (and its `execution`/`cache`) for long-lived callers.
+    """
     bundle_dir = bundle_dir or RELEASE_BUNDLE_DIR
 
     failed_step = "init"
     exception: Optional[BaseException] = None
     stack_trace = ""
     result = None
-    portfolio_snapshot_data: dict = {}
     errors: list = []
     run_id = DEFAULT_RUN_ID
+    timings = TimingRecorder()
+    files: Dict[str, str] = {}
 
     try:
         failed_step = "load_portfolio"
-        portfolio_snapshot_data = load_json(portfolio_path)
+        if portfolio_snapshot_data is None:
+            portfolio_snapshot_data = {}
+            with timed(timings, "stage", "load_portfolio"):
+                portfolio_snapshot_data = load_json(portfolio_path)
         failed_step = "load_release_bundle"
-        portfolio_config_data, run_config_data, config_snapshot_data = _load_release_bundle(
-            bundle_dir,
-            run_mode,
-        )
+        if bundle is None:
+            with timed(timings, "stage", "load_release_bundle"):
+                bundle = _load_release_bundle(bundle_dir, run_mode)
+        portfolio_config_data, run_config_data, config_snapshot_data = bundle
         failed_step = "orchestrator_run"
-        orchestrator = Orchestrator(now_func=lambda: DEFAULT_TIME)
+        if orchestrator is None:
+            orchestrator = Orchestrator(now_func=lambda: DEFAULT_TIME, execution=execution, cache=cache)
         result = orchestrator.run(
             portfolio_snapshot_data=portfolio_snapshot_data,
             portfolio_config_data=portfolio_config_data,
             run_config_data=run_config_data,
             config_snapshot_data=config_snapshot_data,
+            prior=prior_dir,
+            timings=timings,
         )
         run_id = result.run_log.run_id
     except Exception as exc:  # noqa: BLE001 - capture for failure report
@@ -188,7 +302,7 @@ def run_prod(
         outcome = RunOutcome.FAILED.value
 
     try:
-        _write_json(out_dir / "runlog.json", runlog_payload)
+        files["runlog.json"] = stable_json_dumps(runlog_payload)
         summary_payload = _build_summary(
             run_id=run_id,
             portfolio_id=portfolio_id,
@@ -197,35 +311,231 @@ def run_prod(
             errors=errors,
             prod=prod,
         )
-        _write_json(out_dir / "summary.json", summary_payload)
+        files["summary.json"] = stable_json_dumps(summary_payload)
 
         if result and result.packet:
-            _write_json(out_dir / "output_packet.json", result.packet.model_dump(mode="json"))
+            files["output_packet.json"] = stable_json_dumps(result.packet.model_dump(mode="json"))
+        # Durations vary run to run, so they stay out of runlog.json and the hashed packet.
+        files["timings.json"] = stable_json_dumps(timings.to_dict())
     except Exception as exc:  # noqa: BLE001 - ensure failure report even on write errors
         failed_step = "write_artifacts"
         exception = exc
         stack_trace = traceback.format_exc()
 
     if exception or (result and result.outcome == RunOutcome.FAILED):
-        failure_path = out_dir / "failure_report.md"
-        _write_failure_report(
-            failure_path,
+        files["failure_report.md"] = _failure_report_text(
             failed_step=failed_step,
             exception_text=repr(exception) if exception else "None",
             stack_trace=stack_trace or "N/A (no exception captured)",
-            suggested_fix=_suggested_fix(failed_step),
         )
 
-    return exception is None and bool(result) and result.outcome != RunOutcome.FAILED
+    succeeded = exception is None and bool(result) and result.outcome != RunOutcome.FAILED
+    return PortfolioArtifacts(files=files, succeeded=succeeded)
+
+
+def run_prod(
+    *,
+    portfolio_path: Path,
+    out_dir: Path,
+    run_mode: Optional[str] = None,
+    prod: bool = False,
+    bundle_dir: Optional[Path] = None,
+    execution: Optional[ExecutionConfig] = None,
+    cache: Optional[AgentResultCache] = None,
+    prior_dir: Optional[Path] = None,
+    bundle: Optional[tuple[dict, dict, dict]] = None,
+    run_store: Optional[RunStore] = None,
+) -> bool:
+    """Evaluate one portfolio; `bundle` is an already loaded release bundle (see `run_prod_batch`)."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    artifacts = evaluate_portfolio(
+        portfolio_path=portfolio_path,
+        run_mode=run_mode,
+        prod=prod,
+        bundle_dir=bundle_dir,
+        execution=execution,
+        cache=cache,
+        prior_dir=prior_dir,
+        bundle=bundle,
+    )
+    try:
+        for name, text in artifacts.files.items():
+            (out_dir / name).write_text(text, encoding="utf-8")
+    except Exception as exc:  # noqa: BLE001 - ensure failure report even on write errors
+        _write_failure_report(
+            out_dir / "failure_report.md",
+            failed_step="write_artifacts",
+            exception_text=repr(exc),
+            stack_trace=traceback.format_exc(),
+            suggested_fix=_suggested_fix("write_artifacts"),
+        )
+        return False
+    if run_store is not None and not _record_in_run_store(
+        out_dir, lambda: run_store.record(artifacts.files, artifact_dir=out_dir)
+    ):
+        return False
+    return artifacts.succeeded
+
+
+def _record_in_run_store(report_dir: Path, record: Callable[[], Any]) -> bool:
+    # Runs only after the artifact files are on disk, so a store failure never loses them.
+    try:
+        record()
+    except Exception as exc:  # noqa: BLE001 - the artifacts stay; the failure is reported
+        _write_failure_report(
+            report_dir / "failure_report.md",
+            failed_step="record_run_store",
+            exception_text=repr(exc),
+            stack_trace=traceback.format_exc(),
+            suggested_fix=_suggested_fix("record_run_store"),
+        )
+        return False
+    return True
+
+
+# Set once per batch worker process, so the release bundle is sent to each worker once.
+_BATCH_WORKER: Dict[str, Any] = {}
+
+
+def _init_batch_worker(options: Dict[str, Any]) -> None:
+    _BATCH_WORKER.clear()
+    _BATCH_WORKER.update(options)
+
+
+def _run_batch_portfolio(portfolio_run: PortfolioRun) -> Dict[str, Any]:
+    started = time.perf_counter()
+    succeeded = run_prod(
+        portfolio_path=portfolio_run.portfolio_path,
+        out_dir=portfolio_run.out_dir,
+        prior_dir=portfolio_run.prior_dir,
+        **_BATCH_WORKER,
+    )
+    duration_ms = (time.perf_counter() - started) * 1000.0
+    summary_path = portfolio_run.out_dir / "summary.json"
+    summary = load_json(summary_path) if summary_path.exists() else {}
+    return {
+        "portfolio": portfolio_run.out_dir.name,
+        "portfolio_path": str(portfolio_run.portfolio_path),
+        "portfolio_id": summary.get("portfolio_id"),
+        "outcome": summary.get("outcome", RunOutcome.FAILED.value),
+        "counts_by_outcome": summary.get("counts_by_outcome", {}),
+        "succeeded": succeeded,
+        "duration_ms": round(duration_ms, 3),
+    }
+
+
+def run_prod_batch(
+    *,
+    portfolio_paths: Sequence[Path],
+    out_dir: Path,
+    run_mode: Optional[str] = None,
+    prod: bool = False,
+    bundle_dir: Optional[Path] = None,
+    portfolio_workers: int = 1,
+    execution: Optional[ExecutionConfig] = None,
+    cache: Optional[AgentResultCache] = None,
+    prior_root: Optional[Path] = None,
+    run_store: Optional[RunStore] = None,
+) -> bool:
+    """Evaluate many portfolios against one release bundle load.
+
+    Each portfolio's artifacts go to `out_dir/<file stem>/` exactly as `run_prod` writes them,
+    and `out_dir/batch_summary.json` lists every portfolio's outcome and wall time in input
+    order. With `portfolio_workers > 1`, portfolios run on a process pool whose workers each
+    receive the parsed bundle once. `run_store` records the whole batch in one transaction
+    once every portfolio has finished.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    started = time.perf_counter()
+    stems = [path.stem for path in portfolio_paths]
+    duplicates = sorted({stem for stem in stems if stems.count(stem) > 1})
+    if duplicates:
+        raise ValueError(f"duplicate_portfolio_names:{','.join(duplicates)}")
+
+    try:
+        bundle = _load_release_bundle(bundle_dir or RELEASE_BUNDLE_DIR, run_mode)
+    except Exception as exc:  # noqa: BLE001 - capture for failure report
+        _write_json(out_dir / "batch_summary.json", _build_batch_summary([], errors=[str(exc)], prod=prod))
+        _write_failure_report(
+            out_dir / "failure_report.md",
+            failed_step="load_release_bundle",
+            exception_text=repr(exc),
+            stack_trace=traceback.format_exc(),
+            suggested_fix=_suggested_fix("load_release_bundle"),
+        )
+        return False
+
+    portfolio_runs = [
+        PortfolioRun(
+            portfolio_path=path,
+            out_dir=out_dir / path.stem,
+            prior_dir=prior_root / path.stem if prior_root is not None else None,
+        )
+        for path in portfolio_paths
+    ]
+    options = {"prod": prod, "execution": execution, "cache": cache, "bundle": bundle}
+    pool = ExecutionConfig(max_workers=max(1, portfolio_workers), pool="process")
+    # ordered_map runs a lone task in this process, so it needs the options too.
+    _init_batch_worker(options)
+    with worker_pool(pool, initializer=_init_batch_worker, initargs=(options,)) as executor:
+        entries = ordered_map(_run_batch_portfolio, portfolio_runs, executor=executor, config=pool)
+    recorded = run_store is None or _record_in_run_store(
+        out_dir,
+        lambda: run_store.import_artifact_dirs([portfolio_run.out_dir for portfolio_run in portfolio_runs]),
+    )
+
+    errors = [] if recorded else ["run_store_record_failed"]
+    summary = _build_batch_summary(entries, errors=errors, prod=prod)
+    summary["duration_ms"] = round((time.perf_counter() - started) * 1000.0, 3)
+    _write_json(out_dir / "batch_summary.json", summary)
+    return recorded and all(entry["succeeded"] for entry in entries)
+
+
+def _build_batch_summary(entries: List[Dict[str, Any]], *, errors: list, prod: bool) -> dict:
+    outcomes: Counter[str] = Counter(entry["outcome"] for entry in entries)
+    summary = {
+        "portfolio_count": len(entries),
+        "counts_by_outcome": dict(sorted(outcomes.items())),
+        "failed_portfolios": [entry["portfolio"] for entry in entries if not entry["succeeded"]],
+        "portfolios": entries,
+        "errors": errors,
+    }
+    if prod:
+        summary["execution_profile"] = "PROD"
+    return summary
 
 
 def main() -> None:
     args = _parse_args()
+    execution = ExecutionConfig(max_workers=args.workers, pool=args.pool)
+    cache = AgentResultCache(path=Path(args.agent_cache)) if args.agent_cache else None
+    run_store = None
+    if args.run_store:
+        from src.core.logging.run_store import RunStore
+
+        run_store = RunStore(Path(args.run_store))
+    if args.portfolios:
+        run_prod_batch(
+            portfolio_paths=resolve_portfolio_paths(args.portfolios),
+            out_dir=Path(args.out),
+            run_mode=args.run_mode,
+            prod=args.prod,
+            portfolio_workers=args.portfolio_workers,
+            execution=execution,
+            cache=cache,
+            prior_root=Path(args.prior) if args.prior else None,
+            run_store=run_store,
+        )
+        return
     run_prod(
         portfolio_path=Path(args.portfolio),
         out_dir=Path(args.out),
         run_mode=args.run_mode,
         prod=args.prod,
+        execution=execution,
+        cache=cache,
+        prior_dir=Path(args.prior) if args.prior else None,
+        run_store=run_store,
     )
 
 
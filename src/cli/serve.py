@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer, ThreadingHTTPServer
+from pathlib import Path
+from socketserver import ThreadingMixIn, UnixStreamServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from pydantic import ValidationError
+
+from src.agents.cache import AgentResultCache
+from src.cli.run_prod import RELEASE_BUNDLE_DIR, PortfolioArtifacts, _load_release_bundle, evaluate_portfolio
+from src.core.models import ConfigSnapshot, PortfolioConfig, RunConfig
+from src.core.orchestration import ExecutionConfig, Orchestrator
+from src.core.orchestration.orchestrator import DEFAULT_TIME
+from src.core.utils.determinism import stable_json_dumps
+from src.release.manifest import verify_manifest
+
+
+MANIFEST_NAME = "release_manifest.json"
+RUN_MODES = ("DEEP", "FAST")
+
+
+@dataclass
+class WarmBundle:
+    """A verified release bundle, parsed once, with the orchestrator that evaluates against it."""
+
+    release_id: str
+    manifest_sha256: str
+    manifest_stat: Tuple[int, int]
+    bundle_dir: Path
+    orchestrator: Orchestrator
+    _parsed: Dict[Optional[str], Tuple[Any, Any, Any]] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def inputs(self, run_mode: Optional[str]) -> Tuple[Any, Any, Any]:
+        # Parsed per run mode on first use; the orchestrator accepts parsed models as-is.
+        with self._lock:
+            if run_mode not in self._parsed:
+                self._parsed[run_mode] = _parse_bundle(_load_release_bundle(self.bundle_dir, run_mode))
+            return self._parsed[run_mode]
+
+
+class EvaluationService:
+    """Evaluates portfolio snapshots against a warm release bundle.
+
+    The bundle's configs, the agent and guard registries and the agent result cache live for
+    the life of the service. At most `workers` evaluations run at once. Each request first
+    checks `release_manifest.json`; when it changed and the bundle verifies against it, the
+    bundle is reloaded, otherwise the previous bundle keeps serving and `reload_error` is set.
+    """
+
+    def __init__(
+        self,
+        *,
+        bundle_dir: Optional[Path] = None,
+        workers: int = 1,
+        execution: Optional[ExecutionConfig] = None,
+        cache: Optional[AgentResultCache] = None,
+        prod: bool = False,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self._bundle_dir = bundle_dir or RELEASE_BUNDLE_DIR
+        self._workers = workers
+        self._execution = execution
+        self._cache = cache if cache is not None else AgentResultCache()
+        self._prod = prod
+        self._slots = threading.BoundedSemaphore(workers)
+        self._reload_lock = threading.Lock()
+        self.reload_error: Optional[str] = None
+        self._bundle = self._load_bundle()
+
+    @property
+    def bundle(self) -> WarmBundle:
+        return self._bundle
+
+    def evaluate(
+        self,
+        portfolio_snapshot_data: Any,
+        *,
+        run_mode: Optional[str] = None,
+        prod: Optional[bool] = None,
+    ) -> Tuple[WarmBundle, PortfolioArtifacts]:
+        if run_mode is not None and run_mode not in RUN_MODES:
+            raise ValueError(f"run_mode must be one of {', '.join(RUN_MODES)}")
+        bundle = self.refresh()
+        with self._slots:
+            artifacts = evaluate_portfolio(
+                portfolio_snapshot_data=portfolio_snapshot_data,
+                prod=self._prod if prod is None else prod,
+                bundle=bundle.inputs(run_mode),
+                orchestrator=bundle.orchestrator,
+            )
+        return bundle, artifacts
+
+    def refresh(self) -> WarmBundle:
+        """The current bundle, reloaded first if the manifest changed on disk."""
+        if _manifest_stat(self._bundle_dir) == self._bundle.manifest_stat:
+            return self._bundle
+        with self._reload_lock:
+            current = self._bundle
+            if _manifest_stat(self._bundle_dir) != current.manifest_stat:
+                try:
+                    self._bundle = self._load_bundle()
+                    self.reload_error = None
+                except Exception as exc:  # noqa: BLE001 - any bad manifest keeps the previous bundle serving
+                    self.reload_error = str(exc) or type(exc).__name__
+                    # Remember the failed manifest so it is not re-verified on every request.
+                    current.manifest_stat = _manifest_stat(self._bundle_dir)
+            return self._bundle
+
+    def health(self) -> Dict[str, Any]:
+        bundle = self._bundle
+        return {
+            "status": "ok",
+            "release_id": bundle.release_id,
+            "manifest_sha256": bundle.manifest_sha256,
+            "workers": self._workers,
+            "reload_error": self.reload_error,
+        }
+
+    def _load_bundle(self) -> WarmBundle:
+        manifest_path = self._bundle_dir / MANIFEST_NAME
+        stat = _manifest_stat(self._bundle_dir)
+        raw = manifest_path.read_bytes()
+        manifest = json.loads(raw)
+        ok, violations = verify_manifest(self._bundle_dir, manifest)
+        if not ok:
+            raise ValueError("; ".join(violations))
+        bundle = WarmBundle(
+            release_id=manifest["release_id"],
+            manifest_sha256=hashlib.sha256(raw).hexdigest(),
+            manifest_stat=stat,
+            bundle_dir=self._bundle_dir,
+            orchestrator=Orchestrator(now_func=lambda: DEFAULT_TIME, execution=self._execution, cache=self._cache),
+        )
+        bundle.inputs(None)
+        return bundle
+
+
+def _manifest_stat(bundle_dir: Path) -> Tuple[int, int]:
+    try:
+        stat = (bundle_dir / MANIFEST_NAME).stat()
+    except FileNotFoundError:
+        return (0, 0)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _parse_bundle(bundle: Tuple[dict, dict, dict]) -> Tuple[Any, Any, Any]:
+    # Invalid configs stay raw so the orchestrator reports them exactly as `run_prod` would.
+    parsed = []
+    for model, data in zip((PortfolioConfig, RunConfig, ConfigSnapshot), bundle):
+        try:
+            parsed.append(model.parse_obj(data))
+        except ValidationError:
+            parsed.append(data)
+    return tuple(parsed)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "dd11-serve"
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def service(self) -> EvaluationService:
+        return self.server.service  # type: ignore[attr-defined]
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        if urlsplit(self.path).path != "/health":
+            self._send(HTTPStatus.NOT_FOUND, {"error": "not_found"})
+            return
+        self.service.refresh()
+        self._send(HTTPStatus.OK, self.service.health())
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        url = urlsplit(self.path)
+        if url.path != "/evaluate":
+            self._send(HTTPStatus.NOT_FOUND, {"error": "not_found"})
+            return
+        query = parse_qs(url.query)
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self._send(HTTPStatus.BAD_REQUEST, {"error": "invalid_content_length"})
+            return
+        try:
+            snapshot = json.loads(self.rfile.read(length) or b"null")
+        except ValueError as exc:
+            self._send(HTTPStatus.BAD_REQUEST, {"error": f"invalid_json:{exc}"})
+            return
+        prod = query["prod"][-1] in ("1", "true") if "prod" in query else None
+        try:
+            bundle, artifacts = self.service.evaluate(snapshot, run_mode=query.get("run_mode", [None])[-1], prod=prod)
+        except ValueError as exc:
+            self._send(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
+            return
+        self._send(
+            HTTPStatus.OK,
+            {"release_id": bundle.release_id, "succeeded": artifacts.succeeded, "artifacts": artifacts.files},
+        )
+
+    def _send(self, status: HTTPStatus, payload: Dict[str, Any]) -> None:
+        body = stable_json_dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self) -> str:
+        return str(self.client_address[0]) if self.client_address else "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - http.server signature
+        pass
+
+
+class _UnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+    daemon_threads = True
+
+
+def build_server(
+    service: EvaluationService,
+    *,
+    host: str = "127.0.0.1",
+    port: int = 8711,
+    socket_path: Optional[Path] = None,
+) -> HTTPServer | _UnixHTTPServer:
+    """An HTTP server for `service` on `host:port`, or on a Unix socket when `socket_path` is set."""
+    if socket_path is not None:
+        if socket_path.exists():
+            os.unlink(socket_path)
+        server: Any = _UnixHTTPServer(str(socket_path), _Handler)
+    else:
+        server = ThreadingHTTPServer((host, port), _Handler)
+        server.daemon_threads = True
+    server.service = service
+    return server
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Serve portfolio evaluations against a warm release bundle.")
+    parser.add_argument("--bundle", default=str(RELEASE_BUNDLE_DIR), help="Release bundle directory.")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on.")
+    parser.add_argument("--port", type=int, default=8711, help="Port to listen on.")
+    parser.add_argument("--socket", required=False, help="Unix socket path; replaces --host/--port.")
+    parser.add_argument("--workers", type=int, default=4, help="Maximum concurrent evaluations.")
+    parser.add_argument(
+        "--agent-workers",
+        type=int,
+        default=1,
+        help="Worker count for per-holding agent execution inside one evaluation.",
+    )
+    parser.add_argument("--prod", action="store_true", help="Include execution_profile marker in summaries.")
+    parser.add_argument(
+        "--agent-cache",
+        required=False,
+        help="SQLite file backing the agent result cache.",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+    service = EvaluationService(
+        bundle_dir=Path(args.bundle),
+        workers=args.workers,
+        execution=ExecutionConfig(max_workers=args.agent_workers),
+        cache=AgentResultCache(path=Path(args.agent_cache)) if args.agent_cache else None,
+        prod=args.prod,
+    )
+    server = build_server(
+        service,
+        host=args.host,
+        port=args.port,
+        socket_path=Path(args.socket) if args.socket else None,
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -9,29 +9,41 @@ from src.core.canonicalization.hashing import (
     compute_run_hashes,
     hash_committee_packet,
     hash_decision_payload,
+    hash_holding_packet,
     hash_portfolio_config,
     hash_portfolio_snapshot,
     hash_run_config,
     hash_run_hash,
+    packet_hash_session,
     replay_hashes_ignore_timestamps,
     replay_hashes_match,
     sha256_text,
 )
+from src.core.canonicalization.streaming import CanonicalSession, canonical_sha256, write_canonical_json
+from src.core.canonicalization.verify import CanonicalVerification, find_ordering_violations, verify_canonical
 
 __all__ = [
+    "CanonicalSession",
+    "CanonicalVerification",
     "RunHashes",
     "canonical_json_dumps",
+    "canonical_sha256",
     "canonicalization_idempotent",
     "canonicalize_payload",
     "compute_run_hashes",
     "detect_ordering_violations",
+    "find_ordering_violations",
     "hash_committee_packet",
     "hash_decision_payload",
+    "hash_holding_packet",
     "hash_portfolio_config",
     "hash_portfolio_snapshot",
     "hash_run_config",
     "hash_run_hash",
+    "packet_hash_session",
     "replay_hashes_ignore_timestamps",
     "replay_hashes_match",
     "sha256_text",
+    "verify_canonical",
+    "write_canonical_json",
 ]
@@ -2,15 +2,19 @@ from __future__ import annotations
 
 import hashlib
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from src.core.canonicalization.canonicalize import canonical_json_dumps, canonicalize_payload
-from src.core.models import (
-    PortfolioConfig,
-    PortfolioCommitteePacket,
-    PortfolioSnapshot,
-    RunConfig,
-)
+from src.core.canonicalization.streaming import CanonicalSession, canonical_sha256
+
+if TYPE_CHECKING:
+    from src.core.models import (
+        HoldingPacket,
+        PortfolioConfig,
+        PortfolioCommitteePacket,
+        PortfolioSnapshot,
+        RunConfig,
+    )
 
 
 @dataclass(frozen=True)
@@ -27,29 +31,44 @@ def sha256_text(payload: str) -> str:
     return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 
-def hash_portfolio_snapshot(snapshot: PortfolioSnapshot) -> str:
+def hash_portfolio_snapshot(snapshot: PortfolioSnapshot, *, session: Optional[CanonicalSession] = None) -> str:
     # Hash input: canonical PortfolioSnapshot (decision-significant snapshot state).
-    return _hash_payload(snapshot)
+    return _hash_payload(snapshot, session)
 
 
-def hash_portfolio_config(config: PortfolioConfig) -> str:
+def hash_portfolio_config(config: PortfolioConfig, *, session: Optional[CanonicalSession] = None) -> str:
     # Hash input: canonical PortfolioConfig (portfolio-level config inputs).
-    return _hash_payload(config)
+    return _hash_payload(config, session)
 
 
-def hash_run_config(run_config: RunConfig) -> str:
+def hash_run_config(run_config: RunConfig, *, session: Optional[CanonicalSession] = None) -> str:
     # Hash input: canonical RunConfig (runtime policy/config inputs).
-    return _hash_payload(run_config)
+    return _hash_payload(run_config, session)
 
 
-def hash_committee_packet(packet: PortfolioCommitteePacket) -> str:
+def hash_committee_packet(packet: PortfolioCommitteePacket, *, session: Optional[CanonicalSession] = None) -> str:
     # Hash input: canonical PortfolioCommitteePacket (ordered committee output packet).
-    return _hash_payload(packet)
+    return _hash_payload(packet, session)
+
 
+def hash_holding_packet(packet: HoldingPacket, *, session: Optional[CanonicalSession] = None) -> str:
+    # Hash input: canonical HoldingPacket (replay per-holding comparison).
+    return _hash_payload(packet, session)
 
-def hash_decision_payload(payload: Any) -> str:
+
+def hash_decision_payload(payload: Any, *, session: Optional[CanonicalSession] = None) -> str:
     # Hash input: canonical decision payload (portfolio committee packet + holding packets).
-    return _hash_payload(payload)
+    return _hash_payload(payload, session)
+
+
+def packet_hash_session() -> CanonicalSession:
+    # The committee packet and holding packets recur across the committee and decision hashes;
+    # input models are memoized so canonical forms computed by G7 are reused.
+    from src.core.models import HoldingPacket, PortfolioCommitteePacket, PortfolioConfig, PortfolioSnapshot, RunConfig
+
+    return CanonicalSession(
+        memo_types=(PortfolioCommitteePacket, HoldingPacket, PortfolioSnapshot, PortfolioConfig, RunConfig)
+    )
 
 
 def compute_run_hashes(
@@ -59,13 +78,15 @@ def compute_run_hashes(
     run_config: RunConfig,
     committee_packet: PortfolioCommitteePacket,
     decision_payload: Any,
+    session: Optional[CanonicalSession] = None,
 ) -> RunHashes:
     # Hash inputs are the canonicalized decision-significant inputs and outputs defined by DD-07.
-    snapshot_hash = hash_portfolio_snapshot(portfolio_snapshot)
-    config_hash = hash_portfolio_config(portfolio_config)
-    run_config_hash = hash_run_config(run_config)
-    committee_packet_hash = hash_committee_packet(committee_packet)
-    decision_hash = hash_decision_payload(decision_payload)
+    session = session or packet_hash_session()
+    snapshot_hash = hash_portfolio_snapshot(portfolio_snapshot, session=session)
+    config_hash = hash_portfolio_config(portfolio_config, session=session)
+    run_config_hash = hash_run_config(run_config, session=session)
+    committee_packet_hash = hash_committee_packet(committee_packet, session=session)
+    decision_hash = hash_decision_payload(decision_payload, session=session)
     run_hash = hash_run_hash(
         snapshot_hash=snapshot_hash,
         config_hash=config_hash,
@@ -111,5 +132,8 @@ def replay_hashes_ignore_timestamps(payload_a: Any, payload_b: Any) -> bool:
     return replay_hashes_match(payload_a, payload_b)
 
 
-def _hash_payload(payload: Any) -> str:
-    return sha256_text(canonical_json_dumps(payload))
+def _hash_payload(payload: Any, session: Optional[CanonicalSession] = None) -> str:
+    # Same digest as sha256_text(canonical_json_dumps(payload)), without materializing the text.
+    if session is not None:
+        return session.sha256(payload)
+    return canonical_sha256(payload)
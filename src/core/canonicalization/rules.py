@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple
 
 
 EXCLUDED_FIELDS = {
@@ -29,65 +29,65 @@ TRIM_FIELDS = {
 }
 
 
-def sort_holdings(items: Iterable[Dict[str, Any]]) -> Optional[Tuple[Dict[str, Any], ...]]:
-    return tuple(
-        sorted(
-            items,
-            key=lambda item: (
-                (item.get("identity") or {}).get("holding_id")
-                or item.get("holding_id")
-                or ""
-            ),
-        )
+def _holding_order_key(item: Dict[str, Any]) -> Any:
+    return (item.get("identity") or {}).get("holding_id") or item.get("holding_id") or ""
+
+
+def _agent_output_order_key(item: Dict[str, Any]) -> Any:
+    return item.get("agent_name", "")
+
+
+def _penalty_item_order_key(item: Dict[str, Any]) -> Any:
+    return (
+        item.get("category", ""),
+        item.get("reason", ""),
+        item.get("source_agent", ""),
+    )
+
+
+def _concentration_breach_order_key(item: Dict[str, Any]) -> Any:
+    return (
+        item.get("breach_type", ""),
+        item.get("identifier", ""),
+    )
+
+
+def _guard_event_order_key(item: Dict[str, Any]) -> Any:
+    return item.get("guard_id", "")
+
+
+def _veto_log_order_key(item: Dict[str, Any]) -> Any:
+    return (
+        item.get("sequence_number", 0),
+        item.get("agent_name", ""),
+        item.get("rule_id", ""),
     )
 
 
+def sort_holdings(items: Iterable[Dict[str, Any]]) -> Optional[Tuple[Dict[str, Any], ...]]:
+    return tuple(sorted(items, key=_holding_order_key))
+
+
 def sort_agent_outputs(items: Iterable[Dict[str, Any]]) -> Optional[Tuple[Dict[str, Any], ...]]:
-    return tuple(sorted(items, key=lambda item: item.get("agent_name", "")))
+    return tuple(sorted(items, key=_agent_output_order_key))
 
 
 def sort_penalty_items(items: Iterable[Dict[str, Any]]) -> Optional[Tuple[Dict[str, Any], ...]]:
-    return tuple(
-        sorted(
-            items,
-            key=lambda item: (
-                item.get("category", ""),
-                item.get("reason", ""),
-                item.get("source_agent", ""),
-            ),
-        )
-    )
+    return tuple(sorted(items, key=_penalty_item_order_key))
 
 
 def sort_concentration_breaches(items: Iterable[Dict[str, Any]]) -> Optional[Tuple[Dict[str, Any], ...]]:
-    return tuple(
-        sorted(
-            items,
-            key=lambda item: (
-                item.get("breach_type", ""),
-                item.get("identifier", ""),
-            ),
-        )
-    )
+    return tuple(sorted(items, key=_concentration_breach_order_key))
 
 
 def sort_guard_events(items: Iterable[Dict[str, Any]]) -> Optional[Tuple[Dict[str, Any], ...]]:
-    return tuple(sorted(items, key=lambda item: item.get("guard_id", "")))
+    return tuple(sorted(items, key=_guard_event_order_key))
 
 
 def sort_veto_logs(items: Iterable[Dict[str, Any]]) -> Optional[Tuple[Dict[str, Any], ...]]:
     if any(item.get("sequence_number") is None for item in items):
         return None
-    return tuple(
-        sorted(
-            items,
-            key=lambda item: (
-                item.get("sequence_number", 0),
-                item.get("agent_name", ""),
-                item.get("rule_id", ""),
-            ),
-        )
-    )
+    return tuple(sorted(items, key=_veto_log_order_key))
 
 
 ORDERING_RULES: Dict[str, Callable[[Iterable[Dict[str, Any]]], Optional[Tuple[Dict[str, Any], ...]]]] = {
@@ -99,3 +99,42 @@ ORDERING_RULES: Dict[str, Callable[[Iterable[Dict[str, Any]]], Optional[Tuple[Di
     "guard_results": sort_guard_events,
     "veto_logs": sort_veto_logs,
 }
+
+# Sort keys behind ORDERING_RULES, so order can be verified without re-sorting.
+ORDERING_KEYS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "holdings": _holding_order_key,
+    "agent_outputs": _agent_output_order_key,
+    "penalty_items": _penalty_item_order_key,
+    "concentration_breaches": _concentration_breach_order_key,
+    "governance_trail": _guard_event_order_key,
+    "guard_results": _guard_event_order_key,
+    "veto_logs": _veto_log_order_key,
+}
+
+_REQUIRED_ORDER_FIELDS: Dict[str, str] = {
+    "veto_logs": "sequence_number",
+}
+
+
+def ordering_state(parent_key: str, items: Sequence[Dict[str, Any]]) -> Optional[bool]:
+    """Whether canonical `items` already follow their ordering rule, or None if the rule rejects them.
+
+    A stable sort leaves a list unchanged exactly when its keys never decrease, so one pass over
+    adjacent keys matches comparing the list with `ORDERING_RULES[parent_key](items)`.
+    """
+    order_key = ORDERING_KEYS.get(parent_key)
+    if order_key is None:
+        ordered = ORDERING_RULES[parent_key](items)
+        if ordered is None:
+            return None
+        return list(ordered) == list(items)
+    required = _REQUIRED_ORDER_FIELDS.get(parent_key)
+    if required is not None and any(item.get(required) is None for item in items):
+        return None
+    previous: Any = None
+    for index, item in enumerate(items):
+        current = order_key(item)
+        if index and current < previous:
+            return False
+        previous = current
+    return True
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from src.core.canonicalization.canonicalize import EXCLUDE, _canonicalize_value, _format_decimal, _format_float
+from src.core.canonicalization.rules import EXCLUDED_FIELDS, ORDERING_RULES, TRIM_FIELDS
+
+
+DEFAULT_CHUNK_CHARS = 64 * 1024
+
+_WALKABLE_MODELS: Dict[type, bool] = {}
+
+
+class _Canonical:
+    # A value that is already canonical (an ordered list materialized for its sort rule).
+    # `sources` maps canonical items back to session-memoized models.
+    __slots__ = ("value", "sources")
+
+    def __init__(self, value: Any, sources: Optional[Dict[int, BaseModel]] = None) -> None:
+        self.value = value
+        self.sources = sources or {}
+
+
+class CanonicalSession:
+    """Memoizes canonical encodings of model subtrees across the hashes of one run.
+
+    Instances of `memo_types` are encoded once; every later occurrence (the committee packet
+    inside the decision payload, holding packets inside and beside it) reuses the same text, so
+    digests are unchanged. Models must not be mutated while a session is in use.
+    """
+
+    def __init__(self, memo_types: Tuple[type, ...] = (BaseModel,)) -> None:
+        self._memo_types = memo_types
+        self._texts: Dict[int, Tuple[BaseModel, str]] = {}
+        self._canonical: Dict[int, Tuple[BaseModel, Any]] = {}
+        self._digests: Dict[int, Tuple[BaseModel, str]] = {}
+
+    def memoizes(self, value: Any) -> bool:
+        return isinstance(value, self._memo_types)
+
+    def sha256(self, payload: Any) -> str:
+        if not self.memoizes(payload):
+            return canonical_sha256(payload, session=self)
+        entry = self._digests.get(id(payload))
+        if entry is None:
+            entry = (payload, hashlib.sha256(self.encoded(payload).encode("utf-8")).hexdigest())
+            self._digests[id(payload)] = entry
+        return entry[1]
+
+    def encoded(self, model: BaseModel) -> str:
+        entry = self._texts.get(id(model))
+        if entry is not None:
+            return entry[1]
+        parts: List[str] = []
+        encoder = _StreamingEncoder(parts.append, DEFAULT_CHUNK_CHARS, self)
+        canonical = self._canonical.get(id(model))
+        if canonical is not None:
+            encoder._write_canonical(canonical[1])
+        else:
+            encoder._write_mapping(_model_items(model))
+        encoder.flush()
+        text = "".join(parts)
+        self._texts[id(model)] = (model, text)
+        return text
+
+    def canonical(self, model: BaseModel) -> Any:
+        entry = self._canonical.get(id(model))
+        if entry is None:
+            entry = (model, _canonicalize_value(model, parent_key=None))
+            self._canonical[id(model)] = entry
+        return entry[1]
+
+    def remember(self, model: BaseModel, canonical: Any) -> None:
+        # Keeps a canonical form computed elsewhere (the G7 verifier) for later hashing.
+        self._canonical.setdefault(id(model), (model, canonical))
+
+
+def write_canonical_json(
+    payload: Any,
+    sink: Callable[[str], None],
+    *,
+    chunk_chars: int = DEFAULT_CHUNK_CHARS,
+    session: Optional[CanonicalSession] = None,
+) -> None:
+    """Stream the DD-07 canonical JSON of `payload` into `sink`.
+
+    Byte-identical to `canonical_json_dumps`, but models and dicts are walked once with
+    exclusions, trimming and ordering applied on the fly instead of building a canonical copy.
+    Only lists governed by `ORDERING_RULES` are materialized, since their sort keys are defined
+    over canonical items.
+    """
+    encoder = _StreamingEncoder(sink, chunk_chars, session)
+    encoder.write(_resolve(payload, None, session), None)
+    encoder.flush()
+
+
+def canonical_sha256(payload: Any, *, session: Optional[CanonicalSession] = None) -> str:
+    digest = hashlib.sha256()
+    write_canonical_json(payload, lambda chunk: digest.update(chunk.encode("utf-8")), session=session)
+    return digest.hexdigest()
+
+
+def _resolve(value: Any, parent_key: Optional[str], session: Optional[CanonicalSession] = None) -> Any:
+    if isinstance(value, float) and (math.isnan(value) or math.isinf(value)):
+        return EXCLUDE
+    if isinstance(value, (list, tuple)) and parent_key and parent_key in ORDERING_RULES:
+        normalized = []
+        sources: Dict[int, BaseModel] = {}
+        for item in value:
+            if session is not None and session.memoizes(item):
+                canonical_item = session.canonical(item)
+                sources[id(canonical_item)] = item
+            else:
+                canonical_item = _canonicalize_value(item, parent_key=None)
+            if canonical_item is not EXCLUDE:
+                normalized.append(canonical_item)
+        ordered = ORDERING_RULES[parent_key]([item for item in normalized if isinstance(item, dict)])
+        if ordered is None:
+            return EXCLUDE
+        return _Canonical(list(ordered), sources)
+    return value
+
+
+def _model_items(model: BaseModel) -> Iterable[Tuple[str, Any]]:
+    model_class = type(model)
+    walkable = _WALKABLE_MODELS.get(model_class)
+    if walkable is None:
+        decorators = model_class.__pydantic_decorators__
+        walkable = not (
+            decorators.field_serializers
+            or decorators.model_serializers
+            or decorators.computed_fields
+            or any(info.exclude for info in model_class.model_fields.values())
+        )
+        _WALKABLE_MODELS[model_class] = walkable
+    if not walkable or model.__pydantic_extra__:
+        return model.model_dump().items()
+    return ((name, getattr(model, name)) for name in model_class.model_fields)
+
+
+def _json_string(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+class _StreamingEncoder:
+    def __init__(
+        self,
+        sink: Callable[[str], None],
+        chunk_chars: int,
+        session: Optional[CanonicalSession] = None,
+    ) -> None:
+        self._sink = sink
+        self._session = session
+        self._chunk_chars = max(1, chunk_chars)
+        self._parts: List[str] = []
+        self._pending = 0
+
+    def flush(self) -> None:
+        if self._parts:
+            self._sink("".join(self._parts))
+            self._parts = []
+            self._pending = 0
+
+    def _put(self, text: str) -> None:
+        self._parts.append(text)
+        self._pending += len(text)
+        if self._pending >= self._chunk_chars:
+            self.flush()
+
+    def write(self, value: Any, parent_key: Optional[str]) -> None:
+        # `value` has already been through `_resolve`, so it is not excluded.
+        if isinstance(value, _Canonical):
+            self._write_canonical(value.value, value.sources)
+        elif isinstance(value, BaseModel):
+            if self._session is not None and self._session.memoizes(value):
+                self._put(self._session.encoded(value))
+            else:
+                self._write_mapping(_model_items(value))
+        elif isinstance(value, dict):
+            self._write_mapping(value.items())
+        elif isinstance(value, (list, tuple)):
+            self._put("[")
+            first = True
+            for item in value:
+                resolved = _resolve(item, None, self._session)
+                if resolved is EXCLUDE:
+                    continue
+                if not first:
+                    self._put(",")
+                first = False
+                self.write(resolved, None)
+            self._put("]")
+        elif isinstance(value, str) and parent_key in TRIM_FIELDS:
+            self._put(_json_string(value.strip()))
+        elif isinstance(value, datetime):
+            self._put(_json_string(value.isoformat()))
+        else:
+            self._put(_encode_scalar(value))
+
+    def _write_mapping(self, items: Iterable[Tuple[Any, Any]]) -> None:
+        entries = []
+        for key, value in items:
+            if key in EXCLUDED_FIELDS:
+                continue
+            resolved = _resolve(value, key, self._session)
+            if resolved is EXCLUDE:
+                continue
+            entries.append((key, resolved))
+        entries.sort(key=lambda entry: entry[0])
+        self._put("{")
+        for index, (key, value) in enumerate(entries):
+            self._put(f",{_json_string(key)}:" if index else f"{_json_string(key)}:")
+            self.write(value, key)
+        self._put("}")
+
+    def _write_canonical(self, value: Any, sources: Optional[Dict[int, BaseModel]] = None) -> None:
+        if sources and id(value) in sources:
+            self._put(self._session.encoded(sources[id(value)]))
+        elif isinstance(value, dict):
+            self._put("{")
+            for index, key in enumerate(sorted(value.keys())):
+                self._put(f",{_json_string(key)}:" if index else f"{_json_string(key)}:")
+                self._write_canonical(value[key])
+            self._put("}")
+        elif isinstance(value, list):
+            self._put("[")
+            for index, item in enumerate(value):
+                if index:
+                    self._put(",")
+                self._write_canonical(item, sources)
+            self._put("]")
+        else:
+            self._put(_encode_scalar(value))
+
+
+def _encode_scalar(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        return _format_float(value)
+    if isinstance(value, Decimal):
+        return _format_decimal(value)
+    if isinstance(value, datetime):
+        return _json_string(value.isoformat())
+    return _json_string(value)
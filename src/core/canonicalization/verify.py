@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Iterable, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from src.core.canonicalization.canonicalize import EXCLUDE, canonicalization_idempotent
+from src.core.canonicalization.rules import (
+    EXCLUDED_FIELDS,
+    ORDERING_RULES,
+    TRIM_FIELDS,
+    ordering_state,
+)
+from src.core.canonicalization.streaming import CanonicalSession, _model_items
+
+
+# (parent, key or index, is_index); rendered only when a violation is reported.
+_Path = Optional[Tuple[Any, Any, bool]]
+
+
+@dataclass(frozen=True)
+class CanonicalVerification:
+    canonical: Any
+    ordering_violations: List[str]
+    idempotent: bool
+
+
+def verify_canonical(payload: Any, *, session: Optional[CanonicalSession] = None) -> CanonicalVerification:
+    """Canonicalize `payload` once, collecting ordering violations and checking idempotence.
+
+    Reports the same paths as `detect_ordering_violations(payload.model_dump())` and the same
+    verdict as `canonicalization_idempotent`, but ordered lists are checked in one pass over
+    adjacent sort keys instead of being re-sorted, and the canonical form is built once. When
+    `session` memoizes `payload`, the canonical form is kept for hashing later in the run.
+    """
+    verifier = _Verifier()
+    canonical = verifier.canonical(payload, None, None)
+    if isinstance(canonical, (dict, list)):
+        idempotent = _is_fixed_point(canonical, None)
+    else:
+        idempotent = canonicalization_idempotent(payload)
+    if session is not None and session.memoizes(payload):
+        session.remember(payload, canonical)
+    return CanonicalVerification(
+        canonical=canonical,
+        ordering_violations=verifier.violations,
+        idempotent=idempotent,
+    )
+
+
+def find_ordering_violations(payload: Any) -> List[str]:
+    """`detect_ordering_violations` without dumping models; only ordered lists are canonicalized."""
+    verifier = _Verifier()
+    verifier.scan(payload, None, None)
+    return verifier.violations
+
+
+class _Verifier:
+    def __init__(self) -> None:
+        self.violations: List[Any] = []
+
+    def canonical(self, value: Any, parent_key: Optional[str], path: _Path) -> Any:
+        # Mirrors `_canonicalize_value`.
+        if isinstance(value, BaseModel):
+            return self._mapping(_model_items(value), path, build=True)
+        if isinstance(value, dict):
+            return self._mapping(value.items(), path, build=True)
+        if isinstance(value, (list, tuple)):
+            return self._list(value, parent_key, path, build=True)
+        if isinstance(value, str) and parent_key in TRIM_FIELDS:
+            return value.strip()
+        if isinstance(value, datetime):
+            return value.isoformat()
+        if isinstance(value, float) and (math.isnan(value) or math.isinf(value)):
+            return EXCLUDE
+        return value
+
+    def scan(self, value: Any, parent_key: Optional[str], path: _Path) -> None:
+        if isinstance(value, BaseModel):
+            self._mapping(_model_items(value), path, build=False)
+        elif isinstance(value, dict):
+            self._mapping(value.items(), path, build=False)
+        elif isinstance(value, (list, tuple)):
+            self._list(value, parent_key, path, build=False)
+
+    def _mapping(self, items: Iterable[Tuple[Any, Any]], path: _Path, *, build: bool) -> Any:
+        canonical = {}
+        for key, value in items:
+            if key in EXCLUDED_FIELDS:
+                continue
+            if not build:
+                self.scan(value, key, (path, key, False))
+                continue
+            canonical_value = self.canonical(value, key, (path, key, False))
+            if canonical_value is not EXCLUDE:
+                canonical[key] = canonical_value
+        return canonical
+
+    def _list(self, values: Iterable[Any], parent_key: Optional[str], path: _Path, *, build: bool) -> Any:
+        ordered_key = parent_key if parent_key and parent_key in ORDERING_RULES else None
+        if ordered_key is None and not build:
+            for index, item in enumerate(values):
+                self.scan(item, None, (path, index, True))
+            return None
+
+        # Reported ahead of violations nested in the items, as `detect_ordering_violations` does.
+        slot = len(self.violations)
+        normalized: List[Any] = []
+        raw_dicts = True
+        for index, item in enumerate(values):
+            raw_dicts = raw_dicts and isinstance(item, (dict, BaseModel))
+            canonical_item = self.canonical(item, None, (path, index, True))
+            if canonical_item is not EXCLUDE:
+                normalized.append(canonical_item)
+        if ordered_key is None:
+            return normalized
+
+        items = [item for item in normalized if isinstance(item, dict)]
+        state = ordering_state(ordered_key, items)
+        if not raw_dicts or not state:
+            self.violations.insert(slot, _render(path))
+        if state is None:
+            return EXCLUDE
+        if state:
+            return items
+        return list(ORDERING_RULES[ordered_key](items))
+
+
+def _render(path: _Path) -> Any:
+    segments = []
+    while path is not None:
+        path, segment, is_index = path
+        segments.append((segment, is_index))
+    rendered: Any = ""
+    for segment, is_index in reversed(segments):
+        if is_index:
+            rendered = f"{rendered}[{segment}]"
+        else:
+            rendered = f"{rendered}.{segment}" if rendered else segment
+    return rendered
+
+
+def _is_fixed_point(value: Any, parent_key: Optional[str]) -> bool:
+    # True when canonicalizing `value` again would return an equal value.
+    if isinstance(value, dict):
+        return all(key not in EXCLUDED_FIELDS and _is_fixed_point(nested, key) for key, nested in value.items())
+    if isinstance(value, list):
+        if not all(_is_fixed_point(item, None) for item in value):
+            return False
+        if parent_key and parent_key in ORDERING_RULES:
+            return all(isinstance(item, dict) for item in value) and ordering_state(parent_key, value) is True
+        return True
+    if isinstance(value, (tuple, BaseModel, datetime)):
+        return False
+    if isinstance(value, str) and parent_key in TRIM_FIELDS:
+        return value == value.strip()
+    if isinstance(value, float):
+        return not (math.isnan(value) or math.isinf(value))
+    return True
@@ -4,10 +4,10 @@ import hashlib
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from src.core.config.bundle import ConfigBundle
-from src.schemas.models import ConfigSnapshot, PortfolioConfig, PortfolioSnapshot, RunConfig
+if TYPE_CHECKING:
+    from src.core.config.bundle import ConfigBundle
 
 
 @dataclass(frozen=True)
@@ -40,6 +40,10 @@ def load_manifest(path: Optional[Path]) -> Optional[Dict[str, str]]:
 
 
 def load_bundle(bundle_dir: Path) -> ConfigBundle:
+    # Deferred: most callers only need `load_json`, not the schema models.
+    from src.core.config.bundle import ConfigBundle
+    from src.schemas.models import ConfigSnapshot, PortfolioConfig, PortfolioSnapshot, RunConfig
+
     snapshot_data = load_json(bundle_dir / "portfolio_snapshot.json")
     portfolio_config_data = load_json(bundle_dir / "portfolio_config.json")
     run_config_data = load_json(bundle_dir / "run_config.json")
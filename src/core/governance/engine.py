@@ -1,14 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Iterable, List
-
-from pydantic import ValidationError
+from typing import Dict, Iterable, List, Sequence
 
 from src.aggregation import HoldingState
 from src.core.guards.base import GuardScope, GuardViolation
-from src.core.models import AgentResult, HoldingInput, RunConfig, RunOutcome
-from src.core.penalties import DIOOutput
+from src.core.models import AgentResult, AgentResultStore, HoldingInput, RunConfig, RunOutcome, typed_output
+from src.core.penalties import parse_dio_output
 
 
 @dataclass(frozen=True)
@@ -34,11 +32,12 @@ class GovernanceEngine:
         self,
         *,
         ordered_holdings: List[HoldingInput],
-        agent_results: List[AgentResult],
+        agent_results: Sequence[AgentResult],
         guard_results: Iterable,
         guard_violations: List[GuardViolation],
         run_config: RunConfig,
     ) -> GovernanceDecision:
+        agent_results = AgentResultStore.coerce(agent_results)
         holding_states = self._initialize_holdings(ordered_holdings)
         holding_ids = [self._holding_id_for(index, holding) for index, holding in enumerate(ordered_holdings)]
         holding_reasons = {holding_id: [] for holding_id in holding_ids}
@@ -121,29 +120,24 @@ class GovernanceEngine:
         return False
 
     @staticmethod
-    def _dio_portfolio_veto(agent_results: Iterable[AgentResult]) -> bool:
-        for agent in agent_results:
-            if agent.agent_name != "DIO" or agent.scope != "portfolio":
-                continue
-            if GovernanceEngine._dio_output_veto(agent.key_findings):
+    def _dio_portfolio_veto(agent_results: AgentResultStore) -> bool:
+        for agent in agent_results.for_agent("DIO", "portfolio"):
+            if GovernanceEngine._dio_output_veto(agent):
                 return True
         return False
 
     @staticmethod
-    def _dio_holding_vetoes(agent_results: Iterable[AgentResult]) -> Dict[str, bool]:
+    def _dio_holding_vetoes(agent_results: AgentResultStore) -> Dict[str, bool]:
         vetoes: Dict[str, bool] = {}
-        for agent in agent_results:
-            if agent.agent_name != "DIO" or agent.scope != "holding":
-                continue
+        for agent in agent_results.for_agent("DIO", "holding"):
             holding_id = agent.holding_id or ""
-            vetoes[holding_id] = GovernanceEngine._dio_output_veto(agent.key_findings)
+            vetoes[holding_id] = GovernanceEngine._dio_output_veto(agent)
         return vetoes
 
     @staticmethod
-    def _dio_output_veto(payload: Dict[str, object]) -> bool:
-        try:
-            dio_output = DIOOutput.parse_obj(payload)
-        except ValidationError:
+    def _dio_output_veto(agent: AgentResult) -> bool:
+        dio_output = typed_output(agent, parse_dio_output)
+        if dio_output is None:
             return False
         if dio_output.integrity_veto_triggered:
             return True
@@ -156,22 +150,18 @@ class GovernanceEngine:
         return False
 
     @staticmethod
-    def _grra_short_circuit(agent_results: Iterable[AgentResult], run_config: RunConfig) -> bool:
+    def _grra_short_circuit(agent_results: AgentResultStore, run_config: RunConfig) -> bool:
         if run_config.do_not_trade_flag:
             return True
-        for agent in agent_results:
-            if agent.agent_name != "GRRA" or agent.scope != "portfolio":
-                continue
+        for agent in agent_results.for_agent("GRRA", "portfolio"):
             if agent.key_findings.get("do_not_trade_flag") is True:
                 return True
         return False
 
     @staticmethod
-    def _risk_officer_vetoes(agent_results: Iterable[AgentResult]) -> List[str]:
+    def _risk_officer_vetoes(agent_results: AgentResultStore) -> List[str]:
         vetoed: List[str] = []
-        for agent in agent_results:
-            if agent.agent_name != "RiskOfficer" or agent.scope != "holding":
-                continue
+        for agent in agent_results.for_agent("RiskOfficer", "holding"):
             if agent.veto_flags:
                 vetoed.append(agent.holding_id or "")
         return vetoed
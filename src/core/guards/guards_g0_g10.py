@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 from src.core.guards.base import (
     Guard,
@@ -13,6 +13,7 @@ from src.core.guards.base import (
 )
 from src.core.models import (
     AgentResult,
+    AgentResultStore,
     ConfigSnapshot,
     HoldingInput,
     PortfolioConfig,
@@ -21,7 +22,7 @@ from src.core.models import (
     RunOutcome,
 )
 from src.schemas.models import AgentResult as AgentResultSchema
-from src.core.canonicalization import canonicalization_idempotent, detect_ordering_violations
+from src.core.canonicalization import CanonicalSession, find_ordering_violations, verify_canonical
 
 
 @dataclass
@@ -33,9 +34,10 @@ class GuardContext:
     manifest: Optional[Dict[str, str]]
     config_hashes: Dict[str, str]
     ordered_holdings: List[HoldingInput]
-    agent_results: List[AgentResult]
+    agent_results: Sequence[AgentResult]
     portfolio_outcome: Optional[RunOutcome] = None
     schema_errors: List[str] = field(default_factory=list)
+    canonical_session: Optional[CanonicalSession] = None
 
 
 class G0InputSchemaGuard(Guard):
@@ -227,8 +229,8 @@ class G6GovernancePrecedenceGuard(Guard):
         if context.portfolio_outcome in {RunOutcome.FAILED, RunOutcome.VETOED}:
             return GuardEvaluation(result=pass_result(self.guard_id))
 
-        for agent in context.agent_results:
-            if agent.agent_name == "GRRA" and agent.key_findings.get("do_not_trade_flag") is True:
+        for agent in AgentResultStore.coerce(context.agent_results).for_agent("GRRA"):
+            if agent.key_findings.get("do_not_trade_flag") is True:
                 return GuardEvaluation(
                     result=fail_result(self.guard_id, RunOutcome.SHORT_CIRCUITED, ["grra_do_not_trade"]),
                 )
@@ -245,21 +247,19 @@ class G7DeterminismGuard(Guard):
 
     def evaluate(self, *, context: GuardContext) -> GuardEvaluation:
         violations: List[str] = []
-        snapshot_payload = context.portfolio_snapshot.model_dump()
-        snapshot_ordering = detect_ordering_violations(snapshot_payload)
-        if snapshot_ordering:
+        session = context.canonical_session
+        snapshot = verify_canonical(context.portfolio_snapshot, session=session)
+        if snapshot.ordering_violations:
             violations.append("determinism_order_violation")
 
-        agent_payload = {"agent_outputs": [agent.model_dump() for agent in context.agent_results]}
-        agent_ordering = detect_ordering_violations(agent_payload)
-        if agent_ordering:
+        if find_ordering_violations({"agent_outputs": list(context.agent_results)}):
             violations.append("determinism_order_violation")
 
-        if not canonicalization_idempotent(snapshot_payload):
+        if not snapshot.idempotent:
             violations.append("determinism_hash_instability")
-        if not canonicalization_idempotent(context.portfolio_config.model_dump()):
+        if not verify_canonical(context.portfolio_config, session=session).idempotent:
             violations.append("determinism_hash_instability")
-        if not canonicalization_idempotent(context.run_config.model_dump()):
+        if not verify_canonical(context.run_config, session=session).idempotent:
             violations.append("determinism_hash_instability")
 
         if violations:
@@ -1,3 +1,4 @@
 from src.core.logging.runlog import RunLogBuilder
+from src.core.logging.timings import TimingRecord, TimingRecorder, timed
 
-__all__ = ["RunLogBuilder"]
+__all__ = ["RunLogBuilder", "TimingRecord", "TimingRecorder", "timed"]
@@ -0,0 +1,316 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from src.core.utils.determinism import stable_json_dumps
+
+
+RUN_ARTIFACT_NAMES = ("summary.json", "runlog.json", "output_packet.json")
+HASH_FIELDS = ("run_hash", "snapshot_hash", "config_hash", "run_config_hash", "committee_packet_hash", "decision_hash")
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS runs (
+        run_key INTEGER PRIMARY KEY AUTOINCREMENT,
+        run_id TEXT NOT NULL,
+        portfolio_id TEXT,
+        outcome TEXT NOT NULL,
+        status TEXT,
+        started_at_utc TEXT,
+        ended_at_utc TEXT,
+        recorded_at_utc TEXT NOT NULL,
+        artifact_dir TEXT,
+        config_fingerprint TEXT,
+        run_hash TEXT,
+        snapshot_hash TEXT,
+        config_hash TEXT,
+        run_config_hash TEXT,
+        committee_packet_hash TEXT,
+        decision_hash TEXT,
+        counts_by_outcome TEXT NOT NULL,
+        reasons TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS holding_outcomes (
+        run_key INTEGER NOT NULL REFERENCES runs (run_key) ON DELETE CASCADE,
+        holding_index INTEGER NOT NULL,
+        holding_id TEXT,
+        outcome TEXT NOT NULL,
+        base_score REAL,
+        final_score REAL,
+        scorecard TEXT,
+        PRIMARY KEY (run_key, holding_index)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS runs_by_portfolio ON runs (portfolio_id, outcome, recorded_at_utc)",
+    "CREATE INDEX IF NOT EXISTS runs_by_recorded_at ON runs (recorded_at_utc)",
+    "CREATE INDEX IF NOT EXISTS runs_by_run_hash ON runs (run_hash)",
+    "CREATE INDEX IF NOT EXISTS holdings_by_id ON holding_outcomes (holding_id, outcome)",
+)
+
+_RUN_COLUMNS = (
+    "run_id",
+    "portfolio_id",
+    "outcome",
+    "status",
+    "started_at_utc",
+    "ended_at_utc",
+    "recorded_at_utc",
+    "artifact_dir",
+    "config_fingerprint",
+    *HASH_FIELDS,
+    "counts_by_outcome",
+    "reasons",
+)
+
+
+@dataclass(frozen=True)
+class StoredRun:
+    run_key: int
+    run_id: str
+    portfolio_id: Optional[str]
+    outcome: str
+    status: Optional[str]
+    started_at_utc: Optional[str]
+    ended_at_utc: Optional[str]
+    recorded_at_utc: str
+    artifact_dir: Optional[str]
+    config_fingerprint: Optional[str]
+    hashes: Dict[str, Optional[str]]
+    counts_by_outcome: Dict[str, int]
+    reasons: List[str]
+
+
+@dataclass(frozen=True)
+class StoredHolding:
+    run_key: int
+    holding_index: int
+    holding_id: Optional[str]
+    outcome: str
+    base_score: Optional[float]
+    final_score: Optional[float]
+    scorecard: Optional[Dict[str, Any]]
+
+
+def _utc_text(moment: datetime) -> str:
+    # Naive datetimes are taken as UTC; one fixed format keeps text comparisons chronological.
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def read_run_artifacts(artifact_dir: Path) -> Dict[str, str]:
+    """The `run_prod` files of one artifact directory that the store records, by file name."""
+    return {
+        name: (artifact_dir / name).read_text(encoding="utf-8")
+        for name in RUN_ARTIFACT_NAMES
+        if (artifact_dir / name).exists()
+    }
+
+
+class RunStore:
+    """SQLite index of evaluated runs: hashes, outcomes, per-holding outcomes and scorecards.
+
+    Runs are recorded from the artifact files `run_prod` writes (`summary.json`, `runlog.json`
+    and `output_packet.json`), so existing artifact directories can be imported the same way.
+    `run_id` is not unique across runs; each recorded run gets its own `run_key`.
+    """
+
+    def __init__(self, path: Union[Path, str], *, now_func: Optional[Callable[[], datetime]] = None) -> None:
+        self._path = path
+        self._now_func = now_func or (lambda: datetime.now(timezone.utc))
+        self._lock = threading.Lock()
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(path), timeout=30.0, check_same_thread=False)
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        with self._connection:
+            for statement in _SCHEMA:
+                self._connection.execute(statement)
+
+    def record(
+        self,
+        files: Mapping[str, str],
+        *,
+        artifact_dir: Optional[Path] = None,
+        recorded_at: Optional[datetime] = None,
+    ) -> int:
+        return self.record_many([(files, artifact_dir)], recorded_at=recorded_at)[0]
+
+    def record_many(
+        self,
+        runs: Iterable[Tuple[Mapping[str, str], Optional[Path]]],
+        *,
+        recorded_at: Optional[datetime] = None,
+    ) -> List[int]:
+        """Record `(files, artifact_dir)` pairs in one transaction; returns their run keys in order."""
+        recorded_at_utc = _utc_text(recorded_at or self._now_func())
+        rows = [self._rows_for(files, artifact_dir, recorded_at_utc) for files, artifact_dir in runs]
+        placeholders = ", ".join("?" for _ in _RUN_COLUMNS)
+        run_keys: List[int] = []
+        with self._lock, self._connection:
+            for run_row, _ in rows:
+                cursor = self._connection.execute(
+                    f"INSERT INTO runs ({', '.join(_RUN_COLUMNS)}) VALUES ({placeholders})",
+                    run_row,
+                )
+                run_keys.append(int(cursor.lastrowid))
+            self._connection.executemany(
+                "INSERT INTO holding_outcomes (run_key, holding_index, holding_id, outcome, base_score, final_score, "
+                "scorecard) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (run_key, *holding_row)
+                    for run_key, (_, holding_rows) in zip(run_keys, rows)
+                    for holding_row in holding_rows
+                ],
+            )
+        return run_keys
+
+    def import_artifact_dirs(self, artifact_dirs: Sequence[Path], *, recorded_at: Optional[datetime] = None) -> List[int]:
+        """Record existing `run_prod` artifact directories; ones without a summary.json are skipped."""
+        return self.record_many(
+            [
+                (read_run_artifacts(Path(artifact_dir)), Path(artifact_dir))
+                for artifact_dir in artifact_dirs
+                if (Path(artifact_dir) / "summary.json").exists()
+            ],
+            recorded_at=recorded_at,
+        )
+
+    def find_runs(
+        self,
+        *,
+        portfolio_id: Optional[str] = None,
+        outcome: Optional[str] = None,
+        run_hash: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[StoredRun]:
+        """Runs matching every given filter, newest first; `since`/`until` bound the recording time."""
+        clauses: List[str] = []
+        params: List[Any] = []
+        for column, value in (("portfolio_id", portfolio_id), ("outcome", outcome), ("run_hash", run_hash)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            clauses.append("recorded_at_utc >= ?")
+            params.append(_utc_text(since))
+        if until is not None:
+            clauses.append("recorded_at_utc < ?")
+            params.append(_utc_text(until))
+        query = f"SELECT run_key, {', '.join(_RUN_COLUMNS)} FROM runs"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY recorded_at_utc DESC, run_key DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._connection.execute(query, params).fetchall()
+        return [self._stored_run(row) for row in rows]
+
+    def has_run_hash(self, run_hash: str) -> bool:
+        with self._lock:
+            row = self._connection.execute("SELECT 1 FROM runs WHERE run_hash = ? LIMIT 1", (run_hash,)).fetchone()
+        return row is not None
+
+    def holdings_for_run(self, run_key: int) -> List[StoredHolding]:
+        return self._holdings("WHERE run_key = ? ORDER BY holding_index", (run_key,))
+
+    def holding_history(self, holding_id: str, *, outcome: Optional[str] = None) -> List[StoredHolding]:
+        """Every recorded outcome of `holding_id`, oldest run first."""
+        if outcome is None:
+            return self._holdings("WHERE holding_id = ? ORDER BY run_key", (holding_id,))
+        return self._holdings("WHERE holding_id = ? AND outcome = ? ORDER BY run_key", (holding_id, outcome))
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _holdings(self, where: str, params: Tuple[Any, ...]) -> List[StoredHolding]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT run_key, holding_index, holding_id, outcome, base_score, final_score, scorecard "
+                f"FROM holding_outcomes {where}",
+                params,
+            ).fetchall()
+        return [
+            StoredHolding(
+                run_key=row[0],
+                holding_index=row[1],
+                holding_id=row[2],
+                outcome=row[3],
+                base_score=row[4],
+                final_score=row[5],
+                scorecard=json.loads(row[6]) if row[6] is not None else None,
+            )
+            for row in rows
+        ]
+
+    @staticmethod
+    def _rows_for(
+        files: Mapping[str, str],
+        artifact_dir: Optional[Path],
+        recorded_at_utc: str,
+    ) -> Tuple[Tuple[Any, ...], List[Tuple[Any, ...]]]:
+        summary = json.loads(files["summary.json"])
+        runlog = json.loads(files["runlog.json"]) if "runlog.json" in files else {}
+        packet = json.loads(files["output_packet.json"]) if "output_packet.json" in files else {}
+        run_row = (
+            summary.get("run_id") or runlog.get("run_id") or "",
+            summary.get("portfolio_id") or packet.get("portfolio_id"),
+            summary.get("outcome") or runlog.get("outcome"),
+            runlog.get("status"),
+            runlog.get("started_at_utc"),
+            runlog.get("ended_at_utc"),
+            recorded_at_utc,
+            str(artifact_dir) if artifact_dir is not None else None,
+            runlog.get("config_fingerprint"),
+            *(packet.get(field) for field in HASH_FIELDS),
+            stable_json_dumps(summary.get("counts_by_outcome", {})),
+            stable_json_dumps(runlog.get("reasons", summary.get("errors", []))),
+        )
+        holding_rows = []
+        # Failed-run packets carry no holdings.
+        for index, holding in enumerate(packet.get("holdings", [])):
+            scorecard = holding.get("scorecard")
+            identity = holding.get("identity") or {}
+            holding_rows.append(
+                (
+                    index,
+                    holding.get("holding_id") or identity.get("holding_id"),
+                    holding.get("holding_run_outcome") or holding.get("outcome"),
+                    scorecard.get("base_score") if scorecard else None,
+                    scorecard.get("final_score") if scorecard else None,
+                    stable_json_dumps(scorecard) if scorecard is not None else None,
+                )
+            )
+        return run_row, holding_rows
+
+    @staticmethod
+    def _stored_run(row: Sequence[Any]) -> StoredRun:
+        values = dict(zip(("run_key", *_RUN_COLUMNS), row))
+        return StoredRun(
+            run_key=values["run_key"],
+            run_id=values["run_id"],
+            portfolio_id=values["portfolio_id"],
+            outcome=values["outcome"],
+            status=values["status"],
+            started_at_utc=values["started_at_utc"],
+            ended_at_utc=values["ended_at_utc"],
+            recorded_at_utc=values["recorded_at_utc"],
+            artifact_dir=values["artifact_dir"],
+            config_fingerprint=values["config_fingerprint"],
+            hashes={field: values[field] for field in HASH_FIELDS},
+            counts_by_outcome=json.loads(values["counts_by_outcome"]),
+            reasons=json.loads(values["reasons"]),
+        )
@@ -15,6 +15,10 @@ class RunLogBuilder:
     outcome: RunOutcome = RunOutcome.COMPLETED
     status: str = "in_progress"
     reasons: List[str] = field(default_factory=list)
+    agent_cache: Optional[Dict[str, int]] = None
+    config_fingerprint: Optional[str] = None
+    holding_fingerprints: Optional[Dict[str, str]] = None
+    reused_holdings: Optional[List[str]] = None
 
     def add_reason(self, reason: str) -> None:
         if reason and reason not in self.reasons:
@@ -29,6 +33,16 @@ class RunLogBuilder:
         if status is not None:
             self.status = status
 
+    def record_agent_cache(self, stats: Dict[str, int]) -> None:
+        self.agent_cache = dict(stats)
+
+    def record_fingerprints(self, config_fingerprint: str, holding_fingerprints: Dict[str, str]) -> None:
+        self.config_fingerprint = config_fingerprint
+        self.holding_fingerprints = dict(holding_fingerprints)
+
+    def record_reused_holdings(self, holding_ids: List[str]) -> None:
+        self.reused_holdings = sorted(holding_ids)
+
     def finish(self) -> RunLog:
         return RunLog(
             run_id=self.run_id,
@@ -38,4 +52,8 @@ class RunLogBuilder:
             outcome=self.outcome,
             reasons=self.reasons,
             config_hashes=self.config_hashes,
+            agent_cache=self.agent_cache,
+            config_fingerprint=self.config_fingerprint,
+            holding_fingerprints=self.holding_fingerprints,
+            reused_holdings=self.reused_holdings,
         )
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import Any, Callable, ContextManager, Dict, Iterable, Iterator, List, Optional
+
+
+TIMING_KINDS = ("stage", "phase", "agent", "guard")
+
+
+@dataclass(frozen=True)
+class TimingRecord:
+    # Follows the legacy AgentExecutionRecord shape, with a monotonic duration in place of
+    # wall-clock start and end times.
+    kind: str
+    name: str
+    duration_ms: float
+    status: Optional[str] = None
+    scope: Optional[str] = None
+    holding_id: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {"name": self.name, "duration_ms": round(self.duration_ms, 3)}
+        for key in ("status", "scope", "holding_id"):
+            value = getattr(self, key)
+            if value is not None:
+                payload[key] = value
+        return payload
+
+
+class TimingRecorder:
+    """Per-run latency breakdown by stage, phase, agent and guard.
+
+    Durations come from a monotonic clock and are kept out of RunLog and the hashed packets;
+    run_prod writes them to a separate timings.json.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._records: List[TimingRecord] = []
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Process workers start empty; their records travel back with each batch.
+        return {"clock": self._clock}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(clock=state["clock"])
+
+    def now(self) -> float:
+        return self._clock()
+
+    def record(
+        self,
+        kind: str,
+        name: str,
+        started: float,
+        *,
+        status: Optional[str] = None,
+        scope: Optional[str] = None,
+        holding_id: Optional[str] = None,
+    ) -> None:
+        if kind not in TIMING_KINDS:
+            raise ValueError(f"unknown_timing_kind:{kind}")
+        duration_ms = (self._clock() - started) * 1000.0
+        entry = TimingRecord(
+            kind=kind,
+            name=name,
+            duration_ms=duration_ms,
+            status=status,
+            scope=scope,
+            holding_id=holding_id,
+        )
+        with self._lock:
+            self._records.append(entry)
+
+    @contextmanager
+    def measure(
+        self,
+        kind: str,
+        name: str,
+        *,
+        scope: Optional[str] = None,
+        holding_id: Optional[str] = None,
+    ) -> Iterator[None]:
+        started = self._clock()
+        try:
+            yield
+        finally:
+            self.record(kind, name, started, scope=scope, holding_id=holding_id)
+
+    def mark(self) -> int:
+        with self._lock:
+            return len(self._records)
+
+    def since(self, mark: int) -> List[TimingRecord]:
+        with self._lock:
+            return list(self._records[mark:])
+
+    def absorb(self, records: Iterable[TimingRecord]) -> None:
+        with self._lock:
+            self._records.extend(records)
+
+    def records(self) -> List[TimingRecord]:
+        with self._lock:
+            return list(self._records)
+
+    def to_dict(self) -> Dict[str, Any]:
+        grouped: Dict[str, List[Dict[str, Any]]] = {f"{kind}s": [] for kind in TIMING_KINDS}
+        for entry in self.records():
+            grouped[f"{entry.kind}s"].append(entry.to_dict())
+        return {"clock": "monotonic", **grouped}
+
+
+def timed(
+    recorder: Optional[TimingRecorder],
+    kind: str,
+    name: str,
+    *,
+    scope: Optional[str] = None,
+    holding_id: Optional[str] = None,
+) -> ContextManager[None]:
+    if recorder is None:
+        return nullcontext()
+    return recorder.measure(kind, name, scope=scope, holding_id=holding_id)
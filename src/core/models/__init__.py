@@ -1,3 +1,11 @@
+from src.core.models.agent_results import (
+    AgentResultKey,
+    AgentResultStore,
+    TypedOutputParser,
+    agent_result_key,
+    attach_typed_output,
+    typed_output,
+)
 from src.core.models.schemas import (
     AgentResult,
     CapOverride,
@@ -29,6 +37,8 @@ from src.core.models.schemas import (
 
 __all__ = [
     "AgentResult",
+    "AgentResultKey",
+    "AgentResultStore",
     "CapOverride",
     "CommitteePacket",
     "CompletedRunPacket",
@@ -54,4 +64,8 @@ __all__ = [
     "Scorecard",
     "ShortCircuitRunPacket",
     "SourceRef",
+    "TypedOutputParser",
+    "agent_result_key",
+    "attach_typed_output",
+    "typed_output",
 ]
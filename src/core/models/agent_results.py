@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar, overload
+
+from src.core.models.schemas import AgentResult
+
+
+AgentResultKey = Tuple[str, str, str]
+TypedOutputParser = Callable[[AgentResult], Any]
+
+_T = TypeVar("_T")
+
+
+def typed_output(result: AgentResult, parser: Callable[[AgentResult], _T]) -> _T:
+    """The typed view `parser` makes of `result` (DIOOutput, FX reports, cap tables), parsed once.
+
+    Views live on the result itself, so they travel with it and are dropped when a field is
+    reassigned or the result is copied. Results are treated as immutable once emitted.
+    """
+    derived = result._derived
+    if parser not in derived:
+        derived[parser] = parser(result)
+    return derived[parser]
+
+
+def attach_typed_output(result: AgentResult, parser: Callable[[AgentResult], _T], value: _T) -> None:
+    result._derived[parser] = value
+
+
+def agent_result_key(result: AgentResult) -> AgentResultKey:
+    return (result.agent_name, result.scope, result.holding_id or "")
+
+
+class AgentResultStore(Sequence):
+    """Agent results in arrival order, indexed by (agent_name, scope, holding_id).
+
+    Behaves as a read-only sequence for existing consumers; lookups that used to scan the
+    whole run go through `get`, `for_agent` and `for_holding` instead.
+    """
+
+    def __init__(self, results: Iterable[AgentResult] = ()) -> None:
+        self._results: List[AgentResult] = []
+        self._by_key: Dict[AgentResultKey, List[AgentResult]] = {}
+        self._by_agent: Dict[Tuple[str, str], List[AgentResult]] = {}
+        self._by_holding: Dict[str, List[AgentResult]] = {}
+        self._sorted: Optional[List[AgentResult]] = None
+        self.extend(results)
+
+    @classmethod
+    def coerce(cls, results: Iterable[AgentResult]) -> AgentResultStore:
+        if isinstance(results, AgentResultStore):
+            return results
+        return cls(results)
+
+    def add(self, result: AgentResult) -> None:
+        key = agent_result_key(result)
+        self._results.append(result)
+        self._by_key.setdefault(key, []).append(result)
+        self._by_agent.setdefault((result.agent_name, result.scope), []).append(result)
+        if result.scope == "holding":
+            self._by_holding.setdefault(key[2], []).append(result)
+        self._sorted = None
+
+    def extend(self, results: Iterable[AgentResult]) -> None:
+        for result in results:
+            self.add(result)
+
+    def get(self, agent_name: str, scope: str, holding_id: Optional[str] = None) -> Optional[AgentResult]:
+        matches = self._by_key.get((agent_name, scope, holding_id or ""))
+        return matches[0] if matches else None
+
+    def get_all(self, agent_name: str, scope: str, holding_id: Optional[str] = None) -> List[AgentResult]:
+        return list(self._by_key.get((agent_name, scope, holding_id or ""), []))
+
+    def for_agent(self, agent_name: str, scope: Optional[str] = None) -> List[AgentResult]:
+        if scope is not None:
+            return list(self._by_agent.get((agent_name, scope), []))
+        return [result for result in self._results if result.agent_name == agent_name]
+
+    def for_holding(self, holding_id: str) -> List[AgentResult]:
+        return list(self._by_holding.get(holding_id, []))
+
+    def sorted_results(self) -> List[AgentResult]:
+        if self._sorted is None:
+            self._sorted = sorted(self._results, key=agent_result_key)
+        return list(self._sorted)
+
+    @overload
+    def __getitem__(self, index: int) -> AgentResult: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[AgentResult]: ...
+
+    def __getitem__(self, index):
+        return self._results[index]
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __iter__(self) -> Iterator[AgentResult]:
+        return iter(self._results)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, AgentResultStore):
+            return self._results == other._results
+        if isinstance(other, list):
+            return self._results == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"AgentResultStore({self._results!r})"
@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field, root_validator
+from pydantic import BaseModel, Field, PrivateAttr, root_validator
 
 
 class StrictBaseModel(BaseModel):
@@ -13,6 +13,30 @@ class StrictBaseModel(BaseModel):
         validate_by_name = True
         populate_by_name = True
 
+    # Values derived from the fields (typed views, content digests), keyed by what derived them.
+    # Dropped when a field is assigned or the model is copied, and ignored by equality.
+    _derived: Dict[Any, Any] = PrivateAttr(default_factory=dict)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            self._derived = {}
+
+    def __copy__(self) -> Any:
+        copied = super().__copy__()
+        copied._derived = {}
+        return copied
+
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> Any:
+        copied = super().__deepcopy__(memo)
+        copied._derived = {}
+        return copied
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        return type(self) is type(other) and self.__dict__ == other.__dict__
+
 
 class RunMode(str, Enum):
     FAST = "FAST"
@@ -147,6 +171,10 @@ class RunLog(StrictBaseModel):
     outcome: RunOutcome
     reasons: List[str]
     config_hashes: Dict[str, str]
+    agent_cache: Optional[Dict[str, int]] = None
+    config_fingerprint: Optional[str] = None
+    holding_fingerprints: Optional[Dict[str, str]] = None
+    reused_holdings: Optional[List[str]] = None
 
 
 class FailedRunPacket(StrictBaseModel):
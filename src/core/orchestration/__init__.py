@@ -1,3 +1,17 @@
+from typing import Any
+
+from src.core.orchestration.incremental import PriorRun
 from src.core.orchestration.orchestrator import Orchestrator
+from src.core.orchestration.parallel import ExecutionConfig
+from src.core.orchestration.scenarios import ScenarioRunner
+
+__all__ = ["AsyncOrchestrator", "ExecutionConfig", "Orchestrator", "PriorRun", "ScenarioRunner"]
+
+
+def __getattr__(name: str) -> Any:
+    # AsyncOrchestrator needs asyncio, which synchronous runs never load.
+    if name == "AsyncOrchestrator":
+        from src.core.orchestration.async_orchestrator import AsyncOrchestrator
 
-__all__ = ["Orchestrator"]
+        return AsyncOrchestrator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
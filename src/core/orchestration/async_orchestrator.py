@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+from src.agents.cache import AgentResultCache
+from src.agents.registry import AgentRegistry
+from src.core.logging.timings import TimingRecorder, timed
+from src.core.models import AgentResultStore, OrchestrationResult
+from src.core.orchestration.incremental import HoldingReuse, PriorRunSource, reuse_for
+from src.core.orchestration.orchestrator import Orchestrator, _RunState
+
+
+DEFAULT_MAX_CONCURRENCY = 16
+
+
+class AsyncOrchestrator(Orchestrator):
+    """Runs the same pipeline as `Orchestrator` with agents awaited on one event loop.
+
+    Agents call `execute_async`, so I/O-bound agents overlap across phases and holdings while
+    the dependency graph, gates and merge order stay those of the sync path.
+    """
+
+    def __init__(
+        self,
+        now_func: Optional[Callable[[], datetime]] = None,
+        registry: Optional[AgentRegistry] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        cache: Optional[AgentResultCache] = None,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        super().__init__(now_func=now_func, registry=registry, cache=cache)
+        self._max_concurrency = max_concurrency
+
+    async def run(  # type: ignore[override]
+        self,
+        *,
+        portfolio_snapshot_data: Dict[str, object],
+        portfolio_config_data: Dict[str, object],
+        run_config_data: Dict[str, object],
+        config_snapshot_data: Dict[str, object],
+        manifest_data: Optional[Dict[str, str]] = None,
+        config_hashes: Optional[Dict[str, str]] = None,
+        run_id: Optional[str] = None,
+        prior: Optional[PriorRunSource] = None,
+        timings: Optional[TimingRecorder] = None,
+    ) -> OrchestrationResult:
+        state = self._begin_run(
+            portfolio_snapshot_data=portfolio_snapshot_data,
+            portfolio_config_data=portfolio_config_data,
+            run_config_data=run_config_data,
+            config_snapshot_data=config_snapshot_data,
+            manifest_data=manifest_data,
+            config_hashes=config_hashes,
+            run_id=run_id,
+            timings=timings,
+        )
+        if isinstance(state, OrchestrationResult):
+            return state
+        reuse = reuse_for(prior, state.fingerprints)
+        cache_before = self._cache.stats() if self._cache is not None else None
+        with timed(timings, "stage", "agents"):
+            agent_results = await self._run_agents_async(state, reuse)
+        self._record_cache_stats(state, cache_before)
+        return self._complete_run(state, agent_results, reuse)
+
+    async def _run_agents_async(self, state: _RunState, reuse: Optional[HoldingReuse] = None) -> AgentResultStore:
+        scheduler = self._build_scheduler(state.parsed, state.guard_violations, reuse, state.timings)
+        results = await scheduler.run_async(limit=asyncio.Semaphore(self._max_concurrency))
+        self._record_reuse(state, scheduler, reuse)
+        return AgentResultStore(self._sorted_agents(results))
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Union
+
+from src.agents.registry import AgentRegistry
+from src.core.models import (
+    AgentResult,
+    AgentResultStore,
+    ConfigSnapshot,
+    HoldingInput,
+    HoldingPacket,
+    OrchestrationResult,
+    PortfolioCommitteePacket,
+    PortfolioConfig,
+    RunConfig,
+    RunLog,
+    RunOutcome,
+)
+from src.core.utils.determinism import stable_json_dumps
+
+
+PRIOR_RUNLOG_FILENAME = "runlog.json"
+PRIOR_PACKET_FILENAME = "output_packet.json"
+
+
+def _digest(payload: Any) -> str:
+    return hashlib.sha256(stable_json_dumps(payload).encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class InputFingerprints:
+    config: str
+    holdings: Dict[str, str]
+
+
+def fingerprint_inputs(
+    *,
+    portfolio_config: PortfolioConfig,
+    run_config: RunConfig,
+    config_snapshot: ConfigSnapshot,
+    ordered_holdings: Sequence[HoldingInput],
+    registry: AgentRegistry,
+) -> InputFingerprints:
+    config = _digest(
+        {
+            "portfolio_config": portfolio_config.model_dump(mode="json"),
+            "run_config": run_config.model_dump(mode="json"),
+            "config_snapshot": config_snapshot.model_dump(mode="json"),
+            "agent_registry": registry.describe(),
+        }
+    )
+    holdings = {
+        holding.identity.holding_id: _digest(holding.model_dump(mode="json"))
+        for holding in ordered_holdings
+        if holding.identity and holding.identity.holding_id
+    }
+    return InputFingerprints(config=config, holdings=holdings)
+
+
+@dataclass(frozen=True)
+class HoldingReuse:
+    """Prior agent results and packets that an incremental run may reuse for unchanged holdings."""
+
+    holding_ids: FrozenSet[str]
+    agent_results: AgentResultStore
+    holding_packets: Dict[str, HoldingPacket] = field(default_factory=dict)
+
+    def results_for(
+        self,
+        holding_id: str,
+        agent_names: Sequence[str],
+        view: Sequence[AgentResult],
+    ) -> Optional[List[AgentResult]]:
+        # A holding phase is only reused when everything it would see upstream, including
+        # portfolio-level results recomputed this run, matches what it saw last time.
+        if holding_id not in self.holding_ids:
+            return None
+        for upstream in view:
+            if self.agent_results.get(upstream.agent_name, upstream.scope, upstream.holding_id) != upstream:
+                return None
+        results: List[AgentResult] = []
+        for name in agent_names:
+            prior = self.agent_results.get_all(name, "holding", holding_id)
+            if not prior:
+                return None
+            results.extend(prior)
+        return results
+
+    def reusable_packets(self, agent_results: AgentResultStore) -> Dict[str, HoldingPacket]:
+        # Scorecards read the holding's own results plus portfolio-level outputs (PSCC caps and
+        # FX reports), so packets carry over only when both are unchanged.
+        if self._portfolio_outputs(agent_results) != self._portfolio_outputs(self.agent_results):
+            return {}
+        return {
+            holding_id: packet
+            for holding_id, packet in self.holding_packets.items()
+            if holding_id in self.holding_ids
+            and agent_results.for_holding(holding_id) == self.agent_results.for_holding(holding_id)
+        }
+
+    @staticmethod
+    def _portfolio_outputs(agent_results: AgentResultStore) -> List[AgentResult]:
+        return [result for result in agent_results.sorted_results() if result.scope == "portfolio"]
+
+
+@dataclass(frozen=True)
+class PriorRun:
+    """A previous completed run, as the baseline for an incremental re-run."""
+
+    fingerprints: Optional[InputFingerprints]
+    agent_results: AgentResultStore
+    holding_packets: Dict[str, HoldingPacket]
+
+    @classmethod
+    def empty(cls) -> PriorRun:
+        return cls(fingerprints=None, agent_results=AgentResultStore(), holding_packets={})
+
+    @classmethod
+    def from_result(cls, result: OrchestrationResult) -> PriorRun:
+        return cls._from_artifacts(result.run_log, result.portfolio_committee_packet)
+
+    @classmethod
+    def load(cls, artifact_dir: Path) -> PriorRun:
+        artifact_dir = Path(artifact_dir)
+        runlog_path = artifact_dir / PRIOR_RUNLOG_FILENAME
+        packet_path = artifact_dir / PRIOR_PACKET_FILENAME
+        if not runlog_path.exists() or not packet_path.exists():
+            return cls.empty()
+        run_log = RunLog.model_validate(json.loads(runlog_path.read_text(encoding="utf-8")))
+        packet_data = json.loads(packet_path.read_text(encoding="utf-8"))
+        if "holdings" not in packet_data:
+            return cls.empty()
+        return cls._from_artifacts(run_log, PortfolioCommitteePacket.model_validate(packet_data))
+
+    @classmethod
+    def coerce(cls, prior: PriorRunSource) -> PriorRun:
+        if isinstance(prior, PriorRun):
+            return prior
+        if isinstance(prior, OrchestrationResult):
+            return cls.from_result(prior)
+        return cls.load(Path(prior))
+
+    @classmethod
+    def _from_artifacts(cls, run_log: RunLog, packet: Optional[PortfolioCommitteePacket]) -> PriorRun:
+        if packet is None or packet.portfolio_run_outcome != RunOutcome.COMPLETED:
+            return cls.empty()
+        if run_log.config_fingerprint is None or run_log.holding_fingerprints is None:
+            return cls.empty()
+        return cls(
+            fingerprints=InputFingerprints(
+                config=run_log.config_fingerprint,
+                holdings=dict(run_log.holding_fingerprints),
+            ),
+            agent_results=AgentResultStore(AgentResult.model_validate(item) for item in packet.agent_outputs),
+            holding_packets={
+                holding.holding_id: holding
+                for holding in packet.holdings
+                if holding.holding_id and holding.holding_run_outcome == RunOutcome.COMPLETED
+            },
+        )
+
+    def plan_reuse(self, fingerprints: InputFingerprints) -> Optional[HoldingReuse]:
+        if self.fingerprints is None or self.fingerprints.config != fingerprints.config:
+            return None
+        holding_ids = frozenset(
+            holding_id
+            for holding_id, fingerprint in fingerprints.holdings.items()
+            if self.fingerprints.holdings.get(holding_id) == fingerprint
+            and self._completed_cleanly(holding_id)
+        )
+        if not holding_ids:
+            return None
+        return HoldingReuse(
+            holding_ids=holding_ids,
+            agent_results=self.agent_results,
+            holding_packets=self.holding_packets,
+        )
+
+    def _completed_cleanly(self, holding_id: str) -> bool:
+        results = self.agent_results.for_holding(holding_id)
+        return bool(results) and all(result.status == "completed" for result in results)
+
+
+PriorRunSource = Union[PriorRun, OrchestrationResult, Path, str]
+
+
+def reuse_for(prior: Optional[PriorRunSource], fingerprints: InputFingerprints) -> Optional[HoldingReuse]:
+    if prior is None:
+        return None
+    return PriorRun.coerce(prior).plan_reuse(fingerprints)
+
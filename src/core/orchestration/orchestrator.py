@@ -1,35 +1,52 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Callable, Dict, Iterable, List, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional
 
 from pydantic import ValidationError
 
 from src.aggregation import HoldingState, build_portfolio_packet
-from src.agents.executor import HoldingAgentContext, PortfolioAgentContext, run_holding_agents, run_portfolio_agents
+from src.agents.cache import AgentResultCache, CacheStats
 from src.agents.registry import AgentRegistry, get_default_registry
+from src.core.canonicalization import CanonicalSession, packet_hash_session
 from src.core.governance.engine import GovernanceEngine
 from src.core.guards.base import GuardScope, GuardViolation, fail_result, pass_result
 from src.core.guards.guards_g0_g10 import GuardContext
 from src.core.guards.registry import build_guard_registry
 from src.core.logging.runlog import RunLogBuilder
+from src.core.logging.timings import TimingRecorder, timed
 from src.core.models import (
     AgentResult,
+    AgentResultStore,
     ConfigSnapshot,
     FailedRunPacket,
     GuardResult,
     HoldingInput,
+    HoldingPacket,
     OrchestrationResult,
     PortfolioCommitteePacket,
     PortfolioConfig,
     PortfolioSnapshot,
     RunConfig,
     RunOutcome,
+    typed_output,
 )
-from src.core.penalties import DIOOutput
+from src.core.orchestration.incremental import (
+    HoldingReuse,
+    InputFingerprints,
+    PriorRunSource,
+    fingerprint_inputs,
+    reuse_for,
+)
+from src.core.orchestration.parallel import SERIAL_EXECUTION, ExecutionConfig
+from src.core.orchestration.scheduler import PhaseRuntime, PhaseScheduler, PhaseStep
+from src.core.penalties import parse_dio_output
 from src.core.utils.determinism import stable_sort_holdings
 
+if TYPE_CHECKING:
+    from src.core.orchestration.workqueue import WorkQueue
+
 
 DEFAULT_RUN_ID = "local-run"
 DEFAULT_TIME = datetime(2025, 1, 1, tzinfo=timezone.utc)
@@ -44,14 +61,34 @@ class _ParsedInputs:
     ordered_holdings: List[HoldingInput]
 
 
+@dataclass
+class _RunState:
+    run_id: str
+    parsed: _ParsedInputs
+    runlog: RunLogBuilder
+    manifest: Optional[Dict[str, str]]
+    config_hashes: Dict[str, str]
+    guard_results: List[GuardResult]
+    guard_violations: List[GuardViolation]
+    fingerprints: InputFingerprints
+    timings: Optional[TimingRecorder] = None
+    canonical_session: CanonicalSession = field(default_factory=packet_hash_session)
+
+
 class Orchestrator:
     def __init__(
         self,
         now_func: Optional[Callable[[], datetime]] = None,
         registry: Optional[AgentRegistry] = None,
+        execution: Optional[ExecutionConfig] = None,
+        cache: Optional[AgentResultCache] = None,
+        work_queue: Optional[WorkQueue] = None,
     ) -> None:
         self._now_func = now_func or (lambda: DEFAULT_TIME)
         self._registry = registry or get_default_registry()
+        self._execution = execution or SERIAL_EXECUTION
+        self._cache = cache
+        self._work_queue = work_queue
         self._guards = build_guard_registry()
         self._governance = GovernanceEngine()
 
@@ -65,7 +102,47 @@ class Orchestrator:
         manifest_data: Optional[Dict[str, str]] = None,
         config_hashes: Optional[Dict[str, str]] = None,
         run_id: Optional[str] = None,
+        prior: Optional[PriorRunSource] = None,
+        timings: Optional[TimingRecorder] = None,
     ) -> OrchestrationResult:
+        """Run the pipeline; with `prior`, unchanged holdings reuse that run's agent results.
+
+        `prior` is a completed `OrchestrationResult`, a `PriorRun`, or a run_prod artifact
+        directory. Reuse requires identical config fingerprints; holdings whose canonical input
+        hash changed, and everything downstream of changed portfolio-level results, are recomputed.
+        `timings` collects per-stage, phase, agent and guard durations outside the run log.
+        """
+        state = self._begin_run(
+            portfolio_snapshot_data=portfolio_snapshot_data,
+            portfolio_config_data=portfolio_config_data,
+            run_config_data=run_config_data,
+            config_snapshot_data=config_snapshot_data,
+            manifest_data=manifest_data,
+            config_hashes=config_hashes,
+            run_id=run_id,
+            timings=timings,
+        )
+        if isinstance(state, OrchestrationResult):
+            return state
+        reuse = reuse_for(prior, state.fingerprints)
+        cache_before = self._cache.stats() if self._cache is not None else None
+        with timed(timings, "stage", "agents"):
+            agent_results = self._run_agents(state, reuse)
+        self._record_cache_stats(state, cache_before)
+        return self._complete_run(state, agent_results, reuse)
+
+    def _begin_run(
+        self,
+        *,
+        portfolio_snapshot_data: Dict[str, object],
+        portfolio_config_data: Dict[str, object],
+        run_config_data: Dict[str, object],
+        config_snapshot_data: Dict[str, object],
+        manifest_data: Optional[Dict[str, str]],
+        config_hashes: Optional[Dict[str, str]],
+        run_id: Optional[str],
+        timings: Optional[TimingRecorder] = None,
+    ) -> OrchestrationResult | _RunState:
         run_identifier = run_id or DEFAULT_RUN_ID
         started_at = self._now_func()
         config_hashes = config_hashes or {}
@@ -75,12 +152,13 @@ class Orchestrator:
             config_hashes=config_hashes,
         )
 
-        parsed, schema_errors = self._parse_inputs(
-            portfolio_snapshot_data,
-            portfolio_config_data,
-            run_config_data,
-            config_snapshot_data,
-        )
+        with timed(timings, "stage", "parse_inputs"):
+            parsed, schema_errors = self._parse_inputs(
+                portfolio_snapshot_data,
+                portfolio_config_data,
+                run_config_data,
+                config_snapshot_data,
+            )
 
         guard_results: List[GuardResult] = []
         guard_violations: List[GuardViolation] = []
@@ -121,10 +199,12 @@ class Orchestrator:
             schema_errors=schema_errors,
         )
 
-        intake_results, intake_violations = self._run_guards(
-            guard_context,
-            {"G0", "G1", "G2", "G3", "G4"},
-        )
+        with timed(timings, "stage", "intake_guards"):
+            intake_results, intake_violations = self._run_guards(
+                guard_context,
+                {"G0", "G1", "G2", "G3", "G4"},
+                timings=timings,
+            )
         guard_results.extend(intake_results)
         guard_violations.extend(intake_violations)
 
@@ -143,8 +223,9 @@ class Orchestrator:
                 outcome=portfolio_guard_outcome,
                 reasons=guard_reasons,
                 holding_states=holding_states,
-                agent_results=[],
+                agent_results=AgentResultStore(),
                 guard_results=guard_results,
+                timings=timings,
             )
             failed_packet = packet if isinstance(packet, FailedRunPacket) else None
             committee_packet = packet if isinstance(packet, PortfolioCommitteePacket) else None
@@ -164,23 +245,59 @@ class Orchestrator:
                 ordered_holdings=parsed.ordered_holdings,
             )
 
-        agent_results = self._run_agents(parsed, guard_violations)
+        with timed(timings, "stage", "fingerprint_inputs"):
+            fingerprints = fingerprint_inputs(
+                portfolio_config=parsed.portfolio_config,
+                run_config=parsed.run_config,
+                config_snapshot=parsed.config_snapshot,
+                ordered_holdings=parsed.ordered_holdings,
+                registry=self._registry,
+            )
+        runlog.record_fingerprints(fingerprints.config, fingerprints.holdings)
+        return _RunState(
+            run_id=run_identifier,
+            parsed=parsed,
+            runlog=runlog,
+            manifest=manifest_data,
+            config_hashes=config_hashes,
+            guard_results=guard_results,
+            guard_violations=guard_violations,
+            fingerprints=fingerprints,
+            timings=timings,
+        )
+
+    def _complete_run(
+        self,
+        state: _RunState,
+        agent_results: AgentResultStore,
+        reuse: Optional[HoldingReuse] = None,
+    ) -> OrchestrationResult:
+        run_identifier = state.run_id
+        parsed = state.parsed
+        runlog = state.runlog
+        config_hashes = state.config_hashes
+        guard_results = state.guard_results
+        guard_violations = state.guard_violations
+        timings = state.timings
         guard_context = GuardContext(
             portfolio_snapshot=parsed.portfolio_snapshot,
             portfolio_config=parsed.portfolio_config,
             run_config=parsed.run_config,
             config_snapshot=parsed.config_snapshot,
-            manifest=manifest_data,
+            manifest=state.manifest,
             config_hashes=config_hashes,
             ordered_holdings=parsed.ordered_holdings,
             agent_results=agent_results,
-            schema_errors=schema_errors,
+            schema_errors=[],
+            canonical_session=state.canonical_session,
         )
 
-        post_agent_results, post_agent_violations = self._run_guards(
-            guard_context,
-            {"G5", "G6", "G7"},
-        )
+        with timed(timings, "stage", "post_agent_guards"):
+            post_agent_results, post_agent_violations = self._run_guards(
+                guard_context,
+                {"G5", "G6", "G7"},
+                timings=timings,
+            )
         guard_results.extend(post_agent_results)
         guard_violations.extend(post_agent_violations)
 
@@ -212,21 +329,24 @@ class Orchestrator:
                 ordered_holdings=parsed.ordered_holdings,
             )
 
-        governance_decision = self._governance.evaluate(
-            ordered_holdings=parsed.ordered_holdings,
-            agent_results=agent_results,
-            guard_results=guard_results,
-            guard_violations=guard_violations,
-            run_config=parsed.run_config,
-        )
+        with timed(timings, "stage", "governance"):
+            governance_decision = self._governance.evaluate(
+                ordered_holdings=parsed.ordered_holdings,
+                agent_results=agent_results,
+                guard_results=guard_results,
+                guard_violations=guard_violations,
+                run_config=parsed.run_config,
+            )
 
         if governance_decision.portfolio_outcome == RunOutcome.COMPLETED:
             holding_outcomes = [state.outcome for state in governance_decision.holding_states]
-            g9_results, g9_violations = self._run_guards(
-                guard_context,
-                {"G9"},
-                holding_outcomes=holding_outcomes,
-            )
+            with timed(timings, "stage", "portfolio_guards"):
+                g9_results, g9_violations = self._run_guards(
+                    guard_context,
+                    {"G9"},
+                    holding_outcomes=holding_outcomes,
+                    timings=timings,
+                )
             guard_results.extend(g9_results)
             guard_violations.extend(g9_violations)
             g9_outcome, g9_reasons = self._portfolio_guard_outcome(g9_results)
@@ -247,6 +367,9 @@ class Orchestrator:
             holding_states=governance_decision.holding_states,
             agent_results=agent_results,
             guard_results=guard_results,
+            reusable_packets=reuse.reusable_packets(agent_results) if reuse is not None else None,
+            timings=timings,
+            canonical_session=state.canonical_session,
         )
 
         failed_packet = packet if isinstance(packet, FailedRunPacket) else None
@@ -325,121 +448,97 @@ class Orchestrator:
             reasons.append(f"{suffix}:{message}")
         return reasons
 
-    def _run_agents(
+    def _run_agents(self, state: _RunState, reuse: Optional[HoldingReuse] = None) -> AgentResultStore:
+        scheduler = self._build_scheduler(state.parsed, state.guard_violations, reuse, state.timings)
+        results = scheduler.run()
+        self._record_reuse(state, scheduler, reuse)
+        return AgentResultStore(self._sorted_agents(results))
+
+    def _build_scheduler(
         self,
         parsed: _ParsedInputs,
         guard_violations: List[GuardViolation],
-    ) -> List[AgentResult]:
-        agent_results: List[AgentResult] = []
-        terminal_holdings = self._terminal_holdings(parsed, guard_violations)
-
-        portfolio_context = PortfolioAgentContext(
+        reuse: Optional[HoldingReuse] = None,
+        timings: Optional[TimingRecorder] = None,
+    ) -> PhaseScheduler:
+        runtime = PhaseRuntime(
             portfolio_snapshot=parsed.portfolio_snapshot,
             portfolio_config=parsed.portfolio_config,
             run_config=parsed.run_config,
             config_snapshot=parsed.config_snapshot,
             ordered_holdings=parsed.ordered_holdings,
-            agent_results=agent_results,
+            registry=self._registry,
+            cache=self._cache,
+            timings=timings,
         )
-        agent_results.extend(run_portfolio_agents("DIO", portfolio_context, registry=self._registry))
-        if self._dio_portfolio_veto(agent_results):
-            return self._sorted_agents(agent_results)
-        for index, holding in enumerate(parsed.ordered_holdings):
-            holding_id = self._holding_id_for(index, holding)
-            if holding_id in terminal_holdings:
-                continue
-            holding_context = HoldingAgentContext(
-                holding=holding,
-                portfolio_snapshot=parsed.portfolio_snapshot,
-                portfolio_config=parsed.portfolio_config,
-                run_config=parsed.run_config,
-                config_snapshot=parsed.config_snapshot,
-                ordered_holdings=parsed.ordered_holdings,
-                agent_results=agent_results,
-            )
-            agent_results.extend(run_holding_agents("DIO", holding_context, registry=self._registry))
-
-        terminal_holdings.update(self._dio_holding_vetoes(agent_results))
-
-        portfolio_context = PortfolioAgentContext(
-            portfolio_snapshot=parsed.portfolio_snapshot,
-            portfolio_config=parsed.portfolio_config,
-            run_config=parsed.run_config,
-            config_snapshot=parsed.config_snapshot,
-            ordered_holdings=parsed.ordered_holdings,
-            agent_results=agent_results,
-        )
-        agent_results.extend(run_portfolio_agents("GRRA", portfolio_context, registry=self._registry))
-        if self._grra_short_circuit(agent_results, parsed.run_config):
-            return self._sorted_agents(agent_results)
-
-        for index, holding in enumerate(parsed.ordered_holdings):
-            holding_id = self._holding_id_for(index, holding)
-            if holding_id in terminal_holdings:
-                continue
-            holding_context = HoldingAgentContext(
-                holding=holding,
-                portfolio_snapshot=parsed.portfolio_snapshot,
-                portfolio_config=parsed.portfolio_config,
-                run_config=parsed.run_config,
-                config_snapshot=parsed.config_snapshot,
-                ordered_holdings=parsed.ordered_holdings,
-                agent_results=agent_results,
-            )
-            agent_results.extend(
-                run_holding_agents("LEFO_PSCC", holding_context, registry=self._registry)
-            )
-
-        portfolio_context = PortfolioAgentContext(
-            portfolio_snapshot=parsed.portfolio_snapshot,
-            portfolio_config=parsed.portfolio_config,
-            run_config=parsed.run_config,
-            config_snapshot=parsed.config_snapshot,
-            ordered_holdings=parsed.ordered_holdings,
-            agent_results=agent_results,
+        return PhaseScheduler(
+            self._phase_steps(parsed.run_config),
+            runtime=runtime,
+            holding_ids=[
+                self._holding_id_for(index, holding) for index, holding in enumerate(parsed.ordered_holdings)
+            ],
+            terminal_holdings=self._terminal_holdings(parsed, guard_violations),
+            execution=self._execution,
+            reuse=reuse,
+            work_queue=self._work_queue,
         )
-        agent_results.extend(run_portfolio_agents("LEFO_PSCC", portfolio_context, registry=self._registry))
-
-        for index, holding in enumerate(parsed.ordered_holdings):
-            holding_id = self._holding_id_for(index, holding)
-            if holding_id in terminal_holdings:
-                continue
-            holding_context = HoldingAgentContext(
-                holding=holding,
-                portfolio_snapshot=parsed.portfolio_snapshot,
-                portfolio_config=parsed.portfolio_config,
-                run_config=parsed.run_config,
-                config_snapshot=parsed.config_snapshot,
-                ordered_holdings=parsed.ordered_holdings,
-                agent_results=agent_results,
-            )
-            agent_results.extend(run_holding_agents("RISK_OFFICER", holding_context, registry=self._registry))
-
-        terminal_holdings.update(self._risk_officer_vetoes(agent_results))
-
-        for index, holding in enumerate(parsed.ordered_holdings):
-            holding_id = self._holding_id_for(index, holding)
-            if holding_id in terminal_holdings:
-                continue
-            holding_context = HoldingAgentContext(
-                holding=holding,
-                portfolio_snapshot=parsed.portfolio_snapshot,
-                portfolio_config=parsed.portfolio_config,
-                run_config=parsed.run_config,
-                config_snapshot=parsed.config_snapshot,
-                ordered_holdings=parsed.ordered_holdings,
-                agent_results=agent_results,
-            )
-            agent_results.extend(run_holding_agents("ANALYTICAL", holding_context, registry=self._registry))
 
-        return self._sorted_agents(agent_results)
+    @staticmethod
+    def _record_reuse(state: _RunState, scheduler: PhaseScheduler, reuse: Optional[HoldingReuse]) -> None:
+        if reuse is not None:
+            state.runlog.record_reused_holdings(scheduler.reused_holdings())
+
+    def _record_cache_stats(self, state: _RunState, before: Optional[CacheStats]) -> None:
+        if self._cache is None or before is None:
+            return
+        state.runlog.record_agent_cache(self._cache.stats().since(before).to_dict())
+
+    def _phase_steps(self, run_config: RunConfig) -> List[PhaseStep]:
+        # Only the portfolio DIO veto, the GRRA short-circuit and portfolio PSCC are barriers;
+        # holding chains otherwise advance independently of each other.
+        return [
+            PhaseStep(phase="DIO", scope="portfolio", halts_run=self._dio_portfolio_veto),
+            PhaseStep(
+                phase="DIO",
+                scope="holding",
+                after=(("DIO", "portfolio"),),
+                vetoes_holdings=self._dio_holding_vetoes,
+            ),
+            PhaseStep(
+                phase="GRRA",
+                scope="portfolio",
+                after=(("DIO", "portfolio"),),
+                halts_run=lambda results: self._grra_short_circuit(results, run_config),
+            ),
+            PhaseStep(
+                phase="LEFO_PSCC",
+                scope="holding",
+                after=(("DIO", "holding"), ("GRRA", "portfolio")),
+            ),
+            PhaseStep(
+                phase="LEFO_PSCC",
+                scope="portfolio",
+                after=(("GRRA", "portfolio"), ("LEFO_PSCC", "holding")),
+            ),
+            PhaseStep(
+                phase="RISK_OFFICER",
+                scope="holding",
+                after=(("LEFO_PSCC", "holding"), ("LEFO_PSCC", "portfolio")),
+                vetoes_holdings=self._risk_officer_vetoes,
+            ),
+            PhaseStep(
+                phase="ANALYTICAL",
+                scope="holding",
+                after=(("RISK_OFFICER", "holding"),),
+            ),
+        ]
 
     @staticmethod
     def _dio_portfolio_veto(agent_results: Iterable[AgentResult]) -> bool:
         for agent in agent_results:
             if agent.agent_name != "DIO" or agent.scope != "portfolio":
                 continue
-            if Orchestrator._dio_output_veto(agent.key_findings):
+            if Orchestrator._dio_output_veto(agent):
                 return True
         return False
 
@@ -449,7 +548,7 @@ class Orchestrator:
         for agent in agent_results:
             if agent.agent_name != "DIO" or agent.scope != "holding":
                 continue
-            if Orchestrator._dio_output_veto(agent.key_findings):
+            if Orchestrator._dio_output_veto(agent):
                 if agent.holding_id:
                     vetoed.add(agent.holding_id)
         return vetoed
@@ -476,10 +575,9 @@ class Orchestrator:
         return False
 
     @staticmethod
-    def _dio_output_veto(payload: Dict[str, object]) -> bool:
-        try:
-            dio_output = DIOOutput.parse_obj(payload)
-        except ValidationError:
+    def _dio_output_veto(agent: AgentResult) -> bool:
+        dio_output = typed_output(agent, parse_dio_output)
+        if dio_output is None:
             return False
         if dio_output.integrity_veto_triggered:
             return True
@@ -530,12 +628,14 @@ class Orchestrator:
         guard_ids: set[str],
         *,
         holding_outcomes: Optional[List[RunOutcome]] = None,
+        timings: Optional[TimingRecorder] = None,
     ) -> tuple[List[GuardResult], List[GuardViolation]]:
         results: List[GuardResult] = []
         violations: List[GuardViolation] = []
         for guard in self._guards:
             if guard.guard_id not in guard_ids:
                 continue
+            started = timings.now() if timings is not None else 0.0
             if guard.guard_id == "G9":
                 if holding_outcomes is None:
                     results.append(GuardResult(guard_id="G9", status="skipped", outcome=None, reasons=[]))
@@ -543,6 +643,8 @@ class Orchestrator:
                 evaluation = guard.evaluate(context=context, holding_outcomes=holding_outcomes)
             else:
                 evaluation = guard.evaluate(context=context)
+            if timings is not None:
+                timings.record("guard", guard.guard_id, started, status=evaluation.result.status)
             results.append(evaluation.result)
             violations.extend(evaluation.violations)
         return results, violations
@@ -585,21 +687,28 @@ class Orchestrator:
         outcome: RunOutcome,
         reasons: List[str],
         holding_states: List[HoldingState],
-        agent_results: List[AgentResult],
+        agent_results: AgentResultStore,
         guard_results: List[GuardResult],
+        reusable_packets: Optional[Dict[str, HoldingPacket]] = None,
+        timings: Optional[TimingRecorder] = None,
+        canonical_session: Optional[CanonicalSession] = None,
     ) -> tuple[PortfolioCommitteePacket | FailedRunPacket, List]:
-        packet = build_portfolio_packet(
-            run_id=run_id,
-            portfolio_snapshot=parsed.portfolio_snapshot,
-            portfolio_config=parsed.portfolio_config,
-            run_config=parsed.run_config,
-            config_snapshot=parsed.config_snapshot,
-            outcome=outcome,
-            reasons=reasons,
-            holding_states=holding_states,
-            agent_results=agent_results,
-            guard_results=guard_results,
-        )
+        with timed(timings, "stage", "aggregation"):
+            packet = build_portfolio_packet(
+                run_id=run_id,
+                portfolio_snapshot=parsed.portfolio_snapshot,
+                portfolio_config=parsed.portfolio_config,
+                run_config=parsed.run_config,
+                config_snapshot=parsed.config_snapshot,
+                outcome=outcome,
+                reasons=reasons,
+                holding_states=holding_states,
+                agent_results=agent_results,
+                guard_results=guard_results,
+                reusable_packets=reusable_packets,
+                timings=timings,
+                canonical_session=canonical_session,
+            )
         holding_packets = []
         if isinstance(packet, PortfolioCommitteePacket):
             holding_packets = packet.holdings
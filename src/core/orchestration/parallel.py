@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import math
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+if TYPE_CHECKING:
+    from multiprocessing.context import BaseContext
+
+
+POOL_KINDS = ("thread", "process", "shard")
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+@dataclass(frozen=True)
+class ExecutionConfig:
+    max_workers: int = 1
+    pool: str = "thread"
+
+    def __post_init__(self) -> None:
+        if self.pool not in POOL_KINDS:
+            raise ValueError(f"unsupported_pool:{self.pool}")
+        if self.max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+
+    @property
+    def parallel(self) -> bool:
+        return self.max_workers > 1
+
+    @property
+    def uses_processes(self) -> bool:
+        # "shard" runs contiguous holding shards on a process pool instead of per-step batches.
+        return self.pool in {"process", "shard"}
+
+
+SERIAL_EXECUTION = ExecutionConfig()
+
+
+@contextmanager
+def worker_pool(
+    config: ExecutionConfig,
+    *,
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: Tuple[Any, ...] = (),
+    mp_context: Optional[BaseContext] = None,
+) -> Iterator[Optional[Executor]]:
+    if not config.parallel:
+        yield None
+        return
+    if config.uses_processes:
+        executor: Executor = ProcessPoolExecutor(
+            max_workers=config.max_workers,
+            mp_context=mp_context,
+            initializer=initializer,
+            initargs=initargs,
+        )
+    else:
+        executor = ThreadPoolExecutor(max_workers=config.max_workers)
+    try:
+        yield executor
+    finally:
+        executor.shutdown(wait=True)
+
+
+def ordered_map(
+    func: Callable[[_T], _R],
+    items: Iterable[_T],
+    *,
+    executor: Optional[Executor],
+    config: ExecutionConfig,
+) -> List[_R]:
+    # Results are always returned in input order, so merges are independent of completion order.
+    tasks: Sequence[_T] = list(items)
+    if executor is None or len(tasks) <= 1:
+        return [func(task) for task in tasks]
+    return list(executor.map(func, tasks, chunksize=task_batch_size(len(tasks), config)))
+
+
+def task_batch_size(task_count: int, config: ExecutionConfig) -> int:
+    # Process pools pickle each chunk once, so shared portfolio state is serialized per chunk
+    # rather than per holding. Threads share memory and gain nothing from batching.
+    if not config.uses_processes:
+        return 1
+    return max(1, math.ceil(task_count / (config.max_workers * 4)))
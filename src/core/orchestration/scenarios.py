@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import hashlib
+import sys
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from pydantic import ValidationError
+
+from src.agents.base import BaseAgent
+from src.agents.cache import AgentResultCache
+from src.agents.registry import AgentRegistry
+from src.core.canonicalization import hash_run_config
+from src.core.models import OrchestrationResult, RunConfig
+from src.core.orchestration.orchestrator import DEFAULT_RUN_ID, Orchestrator
+from src.core.orchestration.parallel import ExecutionConfig
+from src.core.utils.determinism import stable_json_dumps
+
+
+class ScenarioAgentCache(AgentResultCache):
+    """In-memory agent cache keyed on the run config fields each agent declares.
+
+    Agents that declare no `run_config_fields` are keyed on the whole run config, as in
+    `AgentResultCache`. Every other key part (agent, subject, config snapshot, portfolio config
+    and upstream results) is unchanged, so a result is shared only when the agent would see
+    identical inputs.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(max_entries=sys.maxsize)
+
+    def _run_config_digest(self, agent: BaseAgent, run_config: Any) -> str:
+        if agent.run_config_fields is None:
+            return super()._run_config_digest(agent, run_config)
+        fields = sorted(agent.run_config_fields)
+        if not fields:
+            return ""
+        payload = run_config.model_dump(mode="json", include=set(fields))
+        return hashlib.sha256(stable_json_dumps(payload).encode("utf-8")).hexdigest()
+
+
+class ScenarioRunner:
+    """Runs one snapshot under several run config variants, running each agent once where possible.
+
+    Every scenario is a full `Orchestrator` run with its own guards, governance, packets and
+    hashes. Agents are looked up in a shared `ScenarioAgentCache`, so an agent only re-runs for a
+    scenario when a run config field it declares (`BaseAgent.run_config_fields`) or one of its
+    upstream results differs. Process-pool workers keep their own cache copies and share nothing.
+    A manifest pins the base run config only: scenarios that change it run without `manifest_data`,
+    and their `config_hashes` carry the canonical hash of the run config they actually ran.
+    """
+
+    def __init__(
+        self,
+        now_func: Optional[Callable[[], Any]] = None,
+        registry: Optional[AgentRegistry] = None,
+        execution: Optional[ExecutionConfig] = None,
+    ) -> None:
+        self._now_func = now_func
+        self._registry = registry
+        self._execution = execution
+
+    def run(
+        self,
+        *,
+        portfolio_snapshot_data: Dict[str, object],
+        portfolio_config_data: Dict[str, object],
+        run_config_data: Dict[str, object],
+        config_snapshot_data: Dict[str, object],
+        scenarios: Mapping[str, Mapping[str, object]],
+        manifest_data: Optional[Dict[str, str]] = None,
+        config_hashes: Optional[Dict[str, str]] = None,
+        run_id: Optional[str] = None,
+    ) -> Dict[str, OrchestrationResult]:
+        """One result per scenario; each scenario's entries replace the matching `run_config_data` keys."""
+        orchestrator = Orchestrator(
+            now_func=self._now_func,
+            registry=self._registry,
+            execution=self._execution,
+            cache=ScenarioAgentCache(),
+        )
+        results: Dict[str, OrchestrationResult] = {}
+        for scenario_id, overrides in scenarios.items():
+            scenario_run_config = {**run_config_data, **overrides}
+            scenario_manifest, scenario_hashes = manifest_data, config_hashes
+            if scenario_run_config != run_config_data:
+                scenario_manifest = None
+                scenario_hashes = _scenario_config_hashes(config_hashes, scenario_run_config)
+            results[scenario_id] = orchestrator.run(
+                portfolio_snapshot_data=portfolio_snapshot_data,
+                portfolio_config_data=portfolio_config_data,
+                run_config_data=scenario_run_config,
+                config_snapshot_data=config_snapshot_data,
+                manifest_data=scenario_manifest,
+                config_hashes=scenario_hashes,
+                run_id=f"{run_id or DEFAULT_RUN_ID}:{scenario_id}",
+            )
+        return results
+
+
+def _scenario_config_hashes(
+    config_hashes: Optional[Dict[str, str]],
+    run_config_data: Dict[str, object],
+) -> Optional[Dict[str, str]]:
+    if config_hashes is None:
+        return None
+    hashes = {key: value for key, value in config_hashes.items() if key != "run_config_hash"}
+    try:
+        hashes["run_config_hash"] = hash_run_config(RunConfig.model_validate(run_config_data))
+    except ValidationError:
+        # The run fails schema validation (G0) anyway; it records no hash for an invalid config.
+        pass
+    return hashes
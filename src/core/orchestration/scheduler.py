@@ -0,0 +1,734 @@
+from __future__ import annotations
+
+import heapq
+import math
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Callable, ContextManager, Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
+
+from src.agents.cache import AgentResultCache, CacheStats
+from src.agents.executor import (
+    HoldingAgentContext,
+    PortfolioAgentContext,
+    lookup_cached_holding_agents,
+    run_holding_agents,
+    run_holding_agents_async,
+    run_portfolio_agents,
+    run_portfolio_agents_async,
+)
+from src.agents.registry import AgentRegistry
+from src.core.logging.timings import TimingRecord, TimingRecorder, timed
+from src.core.models import AgentResult, AgentResultStore, ConfigSnapshot, HoldingInput, PortfolioConfig, PortfolioSnapshot, RunConfig
+from src.core.orchestration.incremental import HoldingReuse
+from src.core.orchestration.parallel import ExecutionConfig, task_batch_size, worker_pool
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from src.core.orchestration.workqueue import WorkDispatcher, WorkQueue
+
+
+StepKey = Tuple[str, str]
+_BatchOutcome = Tuple[List[List[AgentResult]], Optional[CacheStats], List[TimingRecord]]
+# (node order, final state, results, reused from the prior run) per shard node.
+_ShardOutcome = Tuple[List[Tuple[int, str, List[AgentResult], bool]], Optional[CacheStats], List[TimingRecord]]
+
+_PENDING = "pending"
+_DONE = "done"
+_HALTED = "halted"
+_CANCELLED = "cancelled"
+
+
+@dataclass(frozen=True)
+class PhaseStep:
+    phase: str
+    scope: str
+    after: Tuple[StepKey, ...] = ()
+    halts_run: Optional[Callable[[Sequence[AgentResult]], bool]] = None
+    vetoes_holdings: Optional[Callable[[Sequence[AgentResult]], Iterable[str]]] = None
+
+    @property
+    def key(self) -> StepKey:
+        return (self.phase, self.scope)
+
+
+@dataclass(frozen=True)
+class PhaseTask:
+    phase: str
+    scope: str
+    holding_index: Optional[int]
+    view: Tuple[AgentResult, ...]
+    # Holding agents to run, by name; None runs every agent of the phase.
+    agents: Optional[Tuple[str, ...]] = None
+
+
+@dataclass(frozen=True)
+class CacheLookup:
+    """Cached results of one holding task's agents, in registry order, and the keys of the misses."""
+
+    agent_names: Tuple[str, ...]
+    hits: Dict[str, AgentResult]
+    keys: Dict[str, str]
+
+    @property
+    def missing(self) -> Tuple[str, ...]:
+        return tuple(name for name in self.agent_names if name not in self.hits)
+
+    def merged(self, executed: Sequence[AgentResult]) -> List[AgentResult]:
+        # `executed` holds the missing agents' results in registry order.
+        remaining = iter(executed)
+        return [self.hits[name] if name in self.hits else next(remaining) for name in self.agent_names]
+
+
+@dataclass(frozen=True)
+class ShardNode:
+    order: int
+    step_index: int
+    holding_index: int
+    holding_id: str
+    ancestors: Tuple[int, ...]
+    # Propagating dependencies inside the shard; ones outside it are resolved into `cancelled`.
+    propagating: Tuple[int, ...]
+    cancelled: bool = False
+
+
+@dataclass(frozen=True)
+class ShardTask:
+    """A contiguous run of holdings, each with its chain of holding nodes up to the next barrier."""
+
+    steps: Tuple[PhaseStep, ...]
+    nodes: Tuple[ShardNode, ...]
+    upstream: Dict[int, Tuple[AgentResult, ...]]
+    terminal: FrozenSet[str]
+
+
+@dataclass(frozen=True)
+class PhaseRuntime:
+    portfolio_snapshot: PortfolioSnapshot
+    portfolio_config: PortfolioConfig
+    run_config: RunConfig
+    config_snapshot: ConfigSnapshot
+    ordered_holdings: List[HoldingInput]
+    registry: AgentRegistry
+    cache: Optional[AgentResultCache] = None
+    timings: Optional[TimingRecorder] = None
+
+    def execute(self, task: PhaseTask) -> List[AgentResult]:
+        context = self._context_for(task)
+        with self._timed(task, context):
+            if isinstance(context, PortfolioAgentContext):
+                return run_portfolio_agents(
+                    task.phase,
+                    context,
+                    registry=self.registry,
+                    cache=self.cache,
+                    timings=self.timings,
+                )
+            return run_holding_agents(
+                task.phase,
+                context,
+                registry=self.registry,
+                cache=self.cache,
+                timings=self.timings,
+                agent_names=task.agents,
+            )
+
+    def lookup_cached(self, task: PhaseTask) -> CacheLookup:
+        # For holding tasks run outside this process: cache hits are served (and timed) here, and
+        # only the misses travel. A task served entirely from the cache gets its phase record here.
+        if self.cache is None:
+            raise RuntimeError("agent_cache_not_configured")
+        context = self._context_for(task)
+        started = self.timings.now() if self.timings is not None else 0.0
+        entries = lookup_cached_holding_agents(
+            task.phase,
+            context,
+            registry=self.registry,
+            cache=self.cache,
+            timings=self.timings,
+        )
+        lookup = CacheLookup(
+            agent_names=tuple(name for name, _, _ in entries),
+            hits={name: cached for name, _, cached in entries if cached is not None},
+            keys={name: key for name, key, cached in entries if cached is None},
+        )
+        if not lookup.missing and self.timings is not None:
+            holding = self.ordered_holdings[task.holding_index]
+            holding_id = holding.identity.holding_id if holding.identity else None
+            self.timings.record("phase", task.phase, started, scope=task.scope, holding_id=holding_id)
+        return lookup
+
+    async def execute_async(self, task: PhaseTask, limit: Optional[asyncio.Semaphore]) -> List[AgentResult]:
+        context = self._context_for(task)
+        with self._timed(task, context):
+            if isinstance(context, PortfolioAgentContext):
+                return await run_portfolio_agents_async(
+                    task.phase,
+                    context,
+                    registry=self.registry,
+                    limit=limit,
+                    cache=self.cache,
+                    timings=self.timings,
+                )
+            return await run_holding_agents_async(
+                task.phase,
+                context,
+                registry=self.registry,
+                limit=limit,
+                cache=self.cache,
+                timings=self.timings,
+            )
+
+    def execute_batch(self, tasks: Sequence[PhaseTask]) -> _BatchOutcome:
+        mark = self.timings.mark() if self.timings is not None else 0
+        before = self.cache.stats() if self.cache is not None else None
+        results = [self.execute(task) for task in tasks]
+        cache_delta = self.cache.stats().since(before) if before is not None else None
+        timing_records = self.timings.since(mark) if self.timings is not None else []
+        return results, cache_delta, timing_records
+
+    def execute_shard(self, shard: ShardTask, reuse: Optional[HoldingReuse] = None) -> _ShardOutcome:
+        # Mirrors PhaseScheduler._complete and _is_cancelled for holding nodes, whose vetoes
+        # and cancellations only ever affect their own holding's chain.
+        mark = self.timings.mark() if self.timings is not None else 0
+        before = self.cache.stats() if self.cache is not None else None
+        terminal = set(shard.terminal)
+        states: Dict[int, str] = {}
+        results: Dict[int, List[AgentResult]] = {}
+        outcomes: List[Tuple[int, str, List[AgentResult], bool]] = []
+        for node in shard.nodes:
+            step = shard.steps[node.step_index]
+            if (
+                node.cancelled
+                or node.holding_id in terminal
+                or any(states[order] in {_HALTED, _CANCELLED} for order in node.propagating)
+            ):
+                states[node.order] = _CANCELLED
+                results[node.order] = []
+                outcomes.append((node.order, _CANCELLED, [], False))
+                continue
+            view: List[AgentResult] = []
+            for order in node.ancestors:
+                view.extend(results[order] if order in results else shard.upstream.get(order, ()))
+            task = PhaseTask(phase=step.phase, scope=step.scope, holding_index=node.holding_index, view=tuple(view))
+            reused = (
+                reuse.results_for(node.holding_id, self.holding_agent_names(step.phase), task.view)
+                if reuse is not None
+                else None
+            )
+            node_results = list(reused) if reused is not None else self.execute(task)
+            state = _HALTED if step.halts_run is not None and step.halts_run(node_results) else _DONE
+            if step.vetoes_holdings is not None:
+                terminal.update(step.vetoes_holdings(node_results))
+            states[node.order] = state
+            results[node.order] = node_results
+            outcomes.append((node.order, state, node_results, reused is not None))
+        cache_delta = self.cache.stats().since(before) if before is not None else None
+        timing_records = self.timings.since(mark) if self.timings is not None else []
+        return outcomes, cache_delta, timing_records
+
+    def holding_agent_names(self, phase: str) -> List[str]:
+        return [agent.agent_name for agent in self.registry.agents_for_phase(phase=phase, scope="holding")]
+
+    def _timed(self, task: PhaseTask, context: PortfolioAgentContext | HoldingAgentContext) -> ContextManager[None]:
+        holding = getattr(context, "holding", None)
+        holding_id = holding.identity.holding_id if holding is not None and holding.identity else None
+        return timed(self.timings, "phase", task.phase, scope=task.scope, holding_id=holding_id)
+
+    def _context_for(self, task: PhaseTask) -> PortfolioAgentContext | HoldingAgentContext:
+        if task.holding_index is None:
+            return PortfolioAgentContext(
+                portfolio_snapshot=self.portfolio_snapshot,
+                portfolio_config=self.portfolio_config,
+                run_config=self.run_config,
+                config_snapshot=self.config_snapshot,
+                ordered_holdings=self.ordered_holdings,
+                agent_results=AgentResultStore(task.view),
+            )
+        return HoldingAgentContext(
+            holding=self.ordered_holdings[task.holding_index],
+            portfolio_snapshot=self.portfolio_snapshot,
+            portfolio_config=self.portfolio_config,
+            run_config=self.run_config,
+            config_snapshot=self.config_snapshot,
+            ordered_holdings=self.ordered_holdings,
+            agent_results=AgentResultStore(task.view),
+        )
+
+
+_INSTALLED_RUNTIME: Optional[PhaseRuntime] = None
+_INSTALLED_REUSE: Optional[HoldingReuse] = None
+
+
+def _install_runtime(runtime: PhaseRuntime, reuse: Optional[HoldingReuse] = None) -> None:
+    # Process workers receive the shared portfolio inputs once at startup; tasks then carry
+    # only a holding index and the small upstream view.
+    global _INSTALLED_RUNTIME, _INSTALLED_REUSE
+    _INSTALLED_RUNTIME = runtime
+    _INSTALLED_REUSE = reuse
+
+
+def _execute_installed_batch(tasks: Sequence[PhaseTask]) -> _BatchOutcome:
+    if _INSTALLED_RUNTIME is None:
+        raise RuntimeError("phase_runtime_not_installed")
+    return _INSTALLED_RUNTIME.execute_batch(tasks)
+
+
+def _execute_installed_shard(shard: ShardTask) -> _ShardOutcome:
+    if _INSTALLED_RUNTIME is None:
+        raise RuntimeError("phase_runtime_not_installed")
+    return _INSTALLED_RUNTIME.execute_shard(shard, _INSTALLED_REUSE)
+
+
+@dataclass
+class _Node:
+    order: int
+    step: PhaseStep
+    holding_index: Optional[int] = None
+    holding_id: Optional[str] = None
+    deps: List[int] = field(default_factory=list)
+    propagating: List[int] = field(default_factory=list)
+    dependents: List[int] = field(default_factory=list)
+    remaining: int = 0
+    ancestors: Set[int] = field(default_factory=set)
+    # `ancestors` grouped by holding index (None for portfolio nodes), built on first use once
+    # the node is fully linked, so linking H holding nodes below it stays linear.
+    ancestors_by_holding: Optional[Dict[Optional[int], List[int]]] = None
+    state: str = _PENDING
+    results: List[AgentResult] = field(default_factory=list)
+
+
+class PhaseScheduler:
+    """Runs registry phases as a per-holding dependency graph.
+
+    Holding nodes advance through their own chain as soon as their inputs are ready; portfolio
+    nodes are the only barriers. A portfolio node waits for every holding instance of the
+    holding steps it follows, and a halting portfolio node cancels everything downstream of it.
+    Results are merged in step-then-holding order, independent of completion order. With a
+    `reuse` plan, holding nodes whose prior results still apply complete without running agents.
+    The "shard" pool runs portfolio nodes here and sends each worker a contiguous range of
+    holdings, which advances every holding chain up to the next portfolio barrier in one task.
+    With a `work_queue`, ready holding nodes are sent through that transport instead of a pool.
+    """
+
+    def __init__(
+        self,
+        steps: Sequence[PhaseStep],
+        *,
+        runtime: PhaseRuntime,
+        holding_ids: Sequence[str],
+        terminal_holdings: Set[str],
+        execution: ExecutionConfig,
+        reuse: Optional[HoldingReuse] = None,
+        work_queue: Optional[WorkQueue] = None,
+    ) -> None:
+        self._runtime = runtime
+        self._execution = execution
+        self._reuse = reuse
+        self._work_queue = work_queue
+        self._terminal = set(terminal_holdings)
+        self._nodes = self._build_graph(steps, holding_ids)
+        self._phase_agents: Dict[str, List[str]] = {}
+        self._reused: Set[int] = set()
+
+    def run(self) -> AgentResultStore:
+        if self._work_queue is not None:
+            from src.core.orchestration.workqueue import WorkDispatcher
+
+            dispatcher = WorkDispatcher(self._work_queue, self._runtime)
+            try:
+                self._run_queued(dispatcher)
+            finally:
+                dispatcher.close()
+            return self._merged_results()
+        with worker_pool(
+            self._execution,
+            initializer=_install_runtime,
+            initargs=(self._runtime, self._reuse),
+        ) as executor:
+            if executor is None:
+                self._run_serial()
+            elif self._execution.pool == "shard":
+                self._run_sharded(executor)
+            else:
+                self._run_parallel(executor)
+        return self._merged_results()
+
+    async def run_async(self, *, limit: Optional[asyncio.Semaphore] = None) -> AgentResultStore:
+        # Every ready node, portfolio or holding, runs as a task on the current loop; `limit`
+        # bounds how many agents execute at once across the whole graph.
+        import asyncio
+
+        ready = self._initial_ready()
+        in_flight: Dict[asyncio.Task, int] = {}
+        while ready or in_flight:
+            while ready:
+                order = heapq.heappop(ready)
+                node = self._nodes[order]
+                if self._is_cancelled(node):
+                    node.state = _CANCELLED
+                    self._release(node, ready)
+                    continue
+                phase_task = self._task_for(node)
+                reused = self._reused_results(node, phase_task)
+                if reused is not None:
+                    self._complete(node, reused)
+                    self._release(node, ready)
+                    continue
+                task = asyncio.ensure_future(self._runtime.execute_async(phase_task, limit))
+                in_flight[task] = order
+            if not in_flight:
+                continue
+            finished, _ = await asyncio.wait(list(in_flight), return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(finished, key=lambda item: in_flight[item]):
+                node = self._nodes[in_flight.pop(task)]
+                self._complete(node, task.result())
+                self._release(node, ready)
+        return self._merged_results()
+
+    def reused_holdings(self) -> List[str]:
+        # Holdings whose every scheduled node was satisfied from the prior run.
+        reused: Dict[str, bool] = {}
+        for node in self._nodes:
+            if node.holding_id is None or node.state == _PENDING:
+                continue
+            reused[node.holding_id] = reused.get(node.holding_id, True) and node.order in self._reused
+        return sorted(holding_id for holding_id, fully_reused in reused.items() if fully_reused)
+
+    def _merged_results(self) -> AgentResultStore:
+        merged = AgentResultStore()
+        for node in self._nodes:
+            merged.extend(node.results)
+        return merged
+
+    def _build_graph(self, steps: Sequence[PhaseStep], holding_ids: Sequence[str]) -> List[_Node]:
+        nodes: List[_Node] = []
+        portfolio_nodes: Dict[StepKey, int] = {}
+        holding_nodes: Dict[StepKey, Dict[int, int]] = {}
+
+        for step in steps:
+            for dependency in step.after:
+                if dependency not in portfolio_nodes and dependency not in holding_nodes:
+                    raise ValueError(f"unknown_phase_dependency:{step.phase}:{dependency[0]}")
+            if step.scope == "portfolio":
+                node = _Node(order=len(nodes), step=step)
+                for dependency in step.after:
+                    if dependency in portfolio_nodes:
+                        self._link(nodes, node, portfolio_nodes[dependency], propagating=True)
+                    else:
+                        for upstream in holding_nodes[dependency].values():
+                            self._link(nodes, node, upstream, propagating=False)
+                portfolio_nodes[step.key] = node.order
+                nodes.append(node)
+                continue
+
+            instances: Dict[int, int] = {}
+            for holding_index, holding_id in enumerate(holding_ids):
+                if holding_id in self._terminal:
+                    continue
+                node = _Node(
+                    order=len(nodes),
+                    step=step,
+                    holding_index=holding_index,
+                    holding_id=holding_id,
+                )
+                for dependency in step.after:
+                    if dependency in portfolio_nodes:
+                        self._link(nodes, node, portfolio_nodes[dependency], propagating=True)
+                    elif holding_index in holding_nodes[dependency]:
+                        self._link(nodes, node, holding_nodes[dependency][holding_index], propagating=True)
+                instances[holding_index] = node.order
+                nodes.append(node)
+            holding_nodes[step.key] = instances
+        return nodes
+
+    @staticmethod
+    def _link(nodes: List[_Node], node: _Node, upstream_order: int, *, propagating: bool) -> None:
+        upstream = nodes[upstream_order]
+        node.deps.append(upstream_order)
+        if propagating:
+            node.propagating.append(upstream_order)
+        node.remaining += 1
+        upstream.dependents.append(node.order)
+        # Holding agents see portfolio-level results plus their own holding's chain; portfolio
+        # agents see everything upstream of them.
+        if node.holding_index is None or upstream.holding_index is None or upstream.holding_index == node.holding_index:
+            node.ancestors.add(upstream_order)
+        if node.holding_index is None:
+            node.ancestors.update(upstream.ancestors)
+        else:
+            if upstream.ancestors_by_holding is None:
+                grouped: Dict[Optional[int], List[int]] = {}
+                for order in upstream.ancestors:
+                    grouped.setdefault(nodes[order].holding_index, []).append(order)
+                upstream.ancestors_by_holding = grouped
+            node.ancestors.update(upstream.ancestors_by_holding.get(None, ()))
+            node.ancestors.update(upstream.ancestors_by_holding.get(node.holding_index, ()))
+
+    def _initial_ready(self) -> List[int]:
+        ready = [node.order for node in self._nodes if node.remaining == 0]
+        heapq.heapify(ready)
+        return ready
+
+    def _run_serial(self) -> None:
+        ready = self._initial_ready()
+        while ready:
+            order = heapq.heappop(ready)
+            node = self._nodes[order]
+            if self._is_cancelled(node):
+                node.state = _CANCELLED
+            else:
+                task = self._task_for(node)
+                reused = self._reused_results(node, task)
+                self._complete(node, reused if reused is not None else self._runtime.execute(task))
+            self._release(node, ready)
+
+    def _run_parallel(self, executor: Executor) -> None:
+        ready = self._initial_ready()
+        in_flight: Dict[Future, List[int]] = {}
+        while ready or in_flight:
+            dispatch: Dict[StepKey, List[Tuple[int, PhaseTask]]] = {}
+            while ready:
+                order = heapq.heappop(ready)
+                node = self._nodes[order]
+                if self._is_cancelled(node):
+                    node.state = _CANCELLED
+                    self._release(node, ready)
+                    continue
+                if node.holding_index is None:
+                    # Portfolio barriers run in the coordinator; their views span all holdings.
+                    self._complete(node, self._runtime.execute(self._task_for(node)))
+                    self._release(node, ready)
+                    continue
+                task = self._task_for(node)
+                reused = self._reused_results(node, task)
+                if reused is not None:
+                    self._complete(node, reused)
+                    self._release(node, ready)
+                    continue
+                dispatch.setdefault(node.step.key, []).append((order, task))
+
+            for pending in dispatch.values():
+                batch_size = task_batch_size(len(pending), self._execution)
+                for start in range(0, len(pending), batch_size):
+                    batch = pending[start : start + batch_size]
+                    in_flight[self._submit(executor, [task for _, task in batch])] = [order for order, _ in batch]
+
+            if not in_flight:
+                continue
+            finished, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+            for future in sorted(finished, key=lambda item: in_flight[item][0]):
+                batch = in_flight.pop(future)
+                batch_results, cache_delta, timing_records = future.result()
+                if self._execution.uses_processes:
+                    self._absorb_worker_stats(cache_delta, timing_records)
+                for order, results in zip(batch, batch_results):
+                    node = self._nodes[order]
+                    self._complete(node, results)
+                    self._release(node, ready)
+
+    def _run_queued(self, dispatcher: WorkDispatcher) -> None:
+        # Workers run without the agent cache: the coordinator looks every agent up before
+        # dispatch, sends only the misses and stores what comes back, so cache stats and timing
+        # records match a single-process run.
+        ready = self._initial_ready()
+        waiting: Dict[str, List[int]] = {}
+        lookups: Dict[int, CacheLookup] = {}
+        while ready or waiting:
+            while ready:
+                order = heapq.heappop(ready)
+                node = self._nodes[order]
+                if self._is_cancelled(node):
+                    node.state = _CANCELLED
+                    self._release(node, ready)
+                    continue
+                task = self._task_for(node)
+                reused = self._reused_results(node, task) if node.holding_index is not None else None
+                if node.holding_index is None or reused is not None:
+                    self._complete(node, reused if reused is not None else self._runtime.execute(task))
+                    self._release(node, ready)
+                    continue
+                if self._runtime.cache is not None:
+                    lookup = self._runtime.lookup_cached(task)
+                    if not lookup.missing:
+                        self._complete(node, lookup.merged(()))
+                        self._release(node, ready)
+                        continue
+                    lookups[order] = lookup
+                    task = replace(task, agents=lookup.missing)
+                waiting.setdefault(dispatcher.submit(task), []).append(order)
+
+            if not waiting:
+                continue
+            finished = dispatcher.wait()
+            for task_id in sorted(finished, key=lambda item: waiting[item][0]):
+                results, timing_records = finished[task_id]
+                for order in waiting.pop(task_id):
+                    node = self._nodes[order]
+                    self._absorb_worker_stats(None, timing_records)
+                    node_results = results
+                    lookup = lookups.pop(order, None)
+                    if lookup is not None:
+                        for name, result in zip(lookup.missing, results):
+                            self._runtime.cache.put(lookup.keys[name], result)
+                        node_results = lookup.merged(results)
+                    self._complete(node, node_results)
+                    self._release(node, ready)
+
+    def _run_sharded(self, executor: Executor) -> None:
+        ready = self._initial_ready()
+        while ready:
+            segment: List[int] = []
+            while ready:
+                order = heapq.heappop(ready)
+                node = self._nodes[order]
+                if self._is_cancelled(node):
+                    node.state = _CANCELLED
+                    self._release(node, ready)
+                elif node.holding_index is None:
+                    self._complete(node, self._runtime.execute(self._task_for(node)))
+                    self._release(node, ready)
+                else:
+                    segment.append(order)
+            if segment:
+                self._run_segment(executor, segment, ready)
+
+    def _run_segment(self, executor: Executor, roots: List[int], ready: List[int]) -> None:
+        # Holding nodes become part of the segment once every dependency they wait on is in it,
+        # so a segment stops at the next portfolio barrier.
+        segment = set(roots)
+        waiting: Dict[int, int] = {}
+        queue = list(roots)
+        while queue:
+            for order in self._nodes[queue.pop()].dependents:
+                dependent = self._nodes[order]
+                if dependent.holding_index is None:
+                    continue
+                waiting[order] = waiting.get(order, dependent.remaining) - 1
+                if waiting[order] == 0:
+                    segment.add(order)
+                    queue.append(order)
+
+        by_holding: Dict[int, List[int]] = {}
+        for order in sorted(segment):
+            by_holding.setdefault(self._nodes[order].holding_index, []).append(order)
+        holding_indexes = sorted(by_holding)
+        shard_size = max(1, math.ceil(len(holding_indexes) / self._execution.max_workers))
+        steps = tuple(dict.fromkeys(self._nodes[order].step for order in segment))
+        step_index = {step: index for index, step in enumerate(steps)}
+
+        futures: List[Future] = []
+        for start in range(0, len(holding_indexes), shard_size):
+            chain = [order for index in holding_indexes[start : start + shard_size] for order in by_holding[index]]
+            futures.append(executor.submit(_execute_installed_shard, self._shard_task(chain, segment, steps, step_index)))
+
+        for future in futures:
+            outcomes, cache_delta, timing_records = future.result()
+            self._absorb_worker_stats(cache_delta, timing_records)
+            for order, state, results, reused in outcomes:
+                node = self._nodes[order]
+                if state == _CANCELLED:
+                    node.state = _CANCELLED
+                    continue
+                self._complete(node, results)
+                if reused:
+                    self._reused.add(order)
+
+        for order in sorted(segment):
+            for dependent_order in self._nodes[order].dependents:
+                dependent = self._nodes[dependent_order]
+                dependent.remaining -= 1
+                if dependent.remaining == 0 and dependent_order not in segment:
+                    heapq.heappush(ready, dependent_order)
+
+    def _shard_task(
+        self,
+        chain: List[int],
+        segment: Set[int],
+        steps: Tuple[PhaseStep, ...],
+        step_index: Dict[PhaseStep, int],
+    ) -> ShardTask:
+        nodes: List[ShardNode] = []
+        upstream: Dict[int, Tuple[AgentResult, ...]] = {}
+        for order in chain:
+            node = self._nodes[order]
+            for ancestor in node.ancestors:
+                if ancestor not in segment and ancestor not in upstream:
+                    upstream[ancestor] = tuple(self._nodes[ancestor].results)
+            nodes.append(
+                ShardNode(
+                    order=order,
+                    step_index=step_index[node.step],
+                    holding_index=node.holding_index,
+                    holding_id=node.holding_id,
+                    ancestors=tuple(sorted(node.ancestors)),
+                    propagating=tuple(dep for dep in node.propagating if dep in segment),
+                    cancelled=any(
+                        self._nodes[dep].state in {_HALTED, _CANCELLED}
+                        for dep in node.propagating
+                        if dep not in segment
+                    ),
+                )
+            )
+        holding_ids = {node.holding_id for node in nodes}
+        return ShardTask(
+            steps=steps,
+            nodes=tuple(nodes),
+            upstream=upstream,
+            terminal=frozenset(self._terminal & holding_ids),
+        )
+
+    def _absorb_worker_stats(self, cache_delta: Optional[CacheStats], timing_records: List[TimingRecord]) -> None:
+        # Worker processes count against their own copies of the cache and recorder.
+        if cache_delta is not None:
+            self._runtime.cache.absorb(cache_delta)
+        if self._runtime.timings is not None:
+            self._runtime.timings.absorb(timing_records)
+
+    def _submit(self, executor: Executor, tasks: List[PhaseTask]) -> Future:
+        if self._execution.pool == "process":
+            return executor.submit(_execute_installed_batch, tasks)
+        return executor.submit(self._runtime.execute_batch, tasks)
+
+    def _task_for(self, node: _Node) -> PhaseTask:
+        view: List[AgentResult] = []
+        for order in sorted(node.ancestors):
+            view.extend(self._nodes[order].results)
+        return PhaseTask(
+            phase=node.step.phase,
+            scope=node.step.scope,
+            holding_index=node.holding_index,
+            view=tuple(view),
+        )
+
+    def _reused_results(self, node: _Node, task: PhaseTask) -> Optional[List[AgentResult]]:
+        if self._reuse is None or node.holding_id is None:
+            return None
+        agent_names = self._phase_agents.get(node.step.phase)
+        if agent_names is None:
+            agent_names = self._runtime.holding_agent_names(node.step.phase)
+            self._phase_agents[node.step.phase] = agent_names
+        reused = self._reuse.results_for(node.holding_id, agent_names, task.view)
+        if reused is not None:
+            self._reused.add(node.order)
+        return reused
+
+    def _is_cancelled(self, node: _Node) -> bool:
+        if node.holding_id is not None and node.holding_id in self._terminal:
+            return True
+        return any(self._nodes[order].state in {_HALTED, _CANCELLED} for order in node.propagating)
+
+    def _complete(self, node: _Node, results: List[AgentResult]) -> None:
+        node.results = list(results)
+        node.state = _DONE
+        if node.step.halts_run is not None and node.step.halts_run(node.results):
+            node.state = _HALTED
+        if node.step.vetoes_holdings is not None:
+            self._terminal.update(node.step.vetoes_holdings(node.results))
+
+    def _release(self, node: _Node, ready: List[int]) -> None:
+        for order in node.dependents:
+            dependent = self._nodes[order]
+            dependent.remaining -= 1
+            if dependent.remaining == 0:
+                heapq.heappush(ready, order)
@@ -0,0 +1,565 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.agents.registry import AgentRegistry, get_default_registry
+from src.core.logging.timings import TimingRecord, TimingRecorder
+from src.core.models import AgentResult, ConfigSnapshot, PortfolioConfig, PortfolioSnapshot, RunConfig
+from src.core.orchestration.scheduler import PhaseRuntime, PhaseTask
+from src.core.utils.determinism import stable_json_dumps
+
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_LEASE_SECONDS = 300.0
+DEFAULT_RESULT_TIMEOUT_SECONDS = 600.0
+DEFAULT_POLL_INTERVAL_SECONDS = 0.02
+DEFAULT_WORKER_CONTEXTS = 4
+
+
+def _digest(payload: Any) -> str:
+    return hashlib.sha256(stable_json_dumps(payload).encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class WorkItem:
+    task_id: str
+    payload: bytes
+
+
+@dataclass(frozen=True)
+class WorkResult:
+    task_id: str
+    payload: Optional[bytes] = None
+    error: Optional[str] = None
+
+
+class WorkQueue(ABC):
+    """Transport for holding-level agent tasks.
+
+    The coordinator publishes the run context once, submits tasks and collects results; payloads
+    are opaque JSON bytes. `submit` is idempotent per task ID: resubmitting a task whose result
+    is already stored leaves the stored result in place, and resubmitting a failed one retries it.
+    Consumed results are dropped with `discard`, and the context with `release_context` once
+    the run is done.
+    """
+
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS
+
+    @abstractmethod
+    def publish_context(self, context_id: str, payload: bytes) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def submit(self, task_id: str, payload: bytes) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def collect(self, task_ids: Sequence[str]) -> Dict[str, WorkResult]:
+        """Finished results among `task_ids`; blocks until at least one is available."""
+        raise NotImplementedError
+
+    def discard(self, task_ids: Sequence[str]) -> None:
+        return None
+
+    def release_context(self, context_id: str) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+
+def encode_context(runtime: PhaseRuntime) -> bytes:
+    # The orchestrator stores holdings in scheduling order on the snapshot itself, so workers
+    # rebuild `ordered_holdings` from it.
+    return stable_json_dumps(
+        {
+            "portfolio_snapshot": runtime.portfolio_snapshot.model_dump(mode="json"),
+            "portfolio_config": runtime.portfolio_config.model_dump(mode="json"),
+            "run_config": runtime.run_config.model_dump(mode="json"),
+            "config_snapshot": runtime.config_snapshot.model_dump(mode="json"),
+            "agent_registry": runtime.registry.describe(),
+        }
+    ).encode("utf-8")
+
+
+def encode_task(context_id: str, task: PhaseTask) -> bytes:
+    return stable_json_dumps(
+        {
+            "context_id": context_id,
+            "phase": task.phase,
+            "scope": task.scope,
+            "holding_index": task.holding_index,
+            "agents": list(task.agents) if task.agents is not None else None,
+            "view": [result.model_dump(mode="json") for result in task.view],
+        }
+    ).encode("utf-8")
+
+
+def decode_results(payload: bytes) -> Tuple[List[AgentResult], List[TimingRecord]]:
+    data = json.loads(payload)
+    return (
+        [AgentResult.model_validate(item) for item in data["results"]],
+        [TimingRecord(**item) for item in data["timings"]],
+    )
+
+
+def work_task_id(context_id: str, holding_hash: str, task: PhaseTask) -> str:
+    """Task ID from the run context, the holding's canonical hash, the phase, agents and upstream view."""
+    return _digest(
+        {
+            "context_id": context_id,
+            "holding": holding_hash,
+            "holding_index": task.holding_index,
+            "agents": list(task.agents) if task.agents is not None else None,
+            "phase": task.phase,
+            "scope": task.scope,
+            "view": _digest([result.model_dump(mode="json") for result in task.view]),
+        }
+    )
+
+
+class WorkerRuntime:
+    """Worker side: rebuilds the run context by ID and runs one holding phase per task.
+
+    The `max_contexts` most recently used contexts stay parsed, so a worker shared by several
+    coordinators does not re-validate a context on every task. Results travel back with the
+    task's timing records; the agent cache stays with the coordinator.
+    """
+
+    def __init__(
+        self,
+        registry: Optional[AgentRegistry] = None,
+        *,
+        max_contexts: int = DEFAULT_WORKER_CONTEXTS,
+    ) -> None:
+        if max_contexts < 1:
+            raise ValueError("max_contexts must be >= 1")
+        self._registry = registry or get_default_registry()
+        self._max_contexts = max_contexts
+        self._runtimes: OrderedDict[str, PhaseRuntime] = OrderedDict()
+
+    def add_context(self, context_id: str, payload: bytes) -> None:
+        if context_id in self._runtimes:
+            self._runtimes.move_to_end(context_id)
+            return
+        data = json.loads(payload)
+        if data["agent_registry"] != self._registry.describe():
+            raise RuntimeError("agent_registry_mismatch")
+        portfolio_snapshot = PortfolioSnapshot.model_validate(data["portfolio_snapshot"])
+        self._runtimes[context_id] = PhaseRuntime(
+            portfolio_snapshot=portfolio_snapshot,
+            portfolio_config=PortfolioConfig.model_validate(data["portfolio_config"]),
+            run_config=RunConfig.model_validate(data["run_config"]),
+            config_snapshot=ConfigSnapshot.model_validate(data["config_snapshot"]),
+            ordered_holdings=list(portfolio_snapshot.holdings),
+            registry=self._registry,
+        )
+        while len(self._runtimes) > self._max_contexts:
+            self._runtimes.popitem(last=False)
+
+    def execute(self, payload: bytes, load_context: Optional[Callable[[str], bytes]] = None) -> bytes:
+        data = json.loads(payload)
+        context_id = data["context_id"]
+        if context_id in self._runtimes:
+            self._runtimes.move_to_end(context_id)
+        else:
+            if load_context is None:
+                raise RuntimeError(f"unknown_work_context:{context_id}")
+            self.add_context(context_id, load_context(context_id))
+        task = PhaseTask(
+            phase=data["phase"],
+            scope=data["scope"],
+            holding_index=data["holding_index"],
+            view=tuple(AgentResult.model_validate(item) for item in data["view"]),
+            agents=tuple(data["agents"]) if data.get("agents") is not None else None,
+        )
+        timings = TimingRecorder()
+        results = replace(self._runtimes[context_id], timings=timings).execute(task)
+        return stable_json_dumps(
+            {
+                "results": [result.model_dump(mode="json") for result in results],
+                "timings": [asdict(record) for record in timings.records()],
+            }
+        ).encode("utf-8")
+
+
+class WorkDispatcher:
+    """Coordinator side for one scheduler run: encodes tasks, retries failures, decodes results."""
+
+    def __init__(self, queue: WorkQueue, runtime: PhaseRuntime) -> None:
+        self._queue = queue
+        context = encode_context(runtime)
+        self._context_id = hashlib.sha256(context).hexdigest()
+        queue.publish_context(self._context_id, context)
+        self._holding_hashes = [_digest(holding.model_dump(mode="json")) for holding in runtime.ordered_holdings]
+        self._payloads: Dict[str, bytes] = {}
+        self._attempts: Dict[str, int] = {}
+
+    def submit(self, task: PhaseTask) -> str:
+        if task.holding_index is None:
+            raise ValueError("work_queue_requires_holding_task")
+        task_id = work_task_id(self._context_id, self._holding_hashes[task.holding_index], task)
+        if task_id not in self._payloads:
+            self._payloads[task_id] = encode_task(self._context_id, task)
+            self._attempts[task_id] = 1
+            self._queue.submit(task_id, self._payloads[task_id])
+        return task_id
+
+    def wait(self) -> Dict[str, Tuple[List[AgentResult], List[TimingRecord]]]:
+        while True:
+            finished: Dict[str, Tuple[List[AgentResult], List[TimingRecord]]] = {}
+            for task_id, result in sorted(self._queue.collect(sorted(self._payloads)).items()):
+                if result.error is not None:
+                    if self._attempts[task_id] >= self._queue.max_attempts:
+                        raise RuntimeError(f"work_task_failed:{task_id}:{result.error}")
+                    self._attempts[task_id] += 1
+                    self._queue.submit(task_id, self._payloads[task_id])
+                    continue
+                del self._payloads[task_id]
+                finished[task_id] = decode_results(result.payload)
+            if finished:
+                self._queue.discard(sorted(finished))
+                return finished
+
+    def close(self) -> None:
+        self._queue.release_context(self._context_id)
+
+
+_LOCAL_WORKER: Dict[str, WorkerRuntime] = {}
+
+
+def _init_local_worker(registry: Optional[AgentRegistry], contexts: Dict[str, bytes]) -> None:
+    worker = WorkerRuntime(registry)
+    for context_id, payload in contexts.items():
+        worker.add_context(context_id, payload)
+    _LOCAL_WORKER["runtime"] = worker
+
+
+def _execute_local(payload: bytes) -> bytes:
+    return _LOCAL_WORKER["runtime"].execute(payload)
+
+
+class LocalWorkQueue(WorkQueue):
+    """In-process queue; with `workers`, tasks run on a process pool of that size.
+
+    Tasks take the same serialized path as remote ones, so this doubles as a transport test.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int = 0,
+        registry: Optional[AgentRegistry] = None,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ) -> None:
+        if workers < 0:
+            raise ValueError("workers must be >= 0")
+        self.max_attempts = max_attempts
+        self._workers = workers
+        self._registry = registry
+        self._contexts: Dict[str, bytes] = {}
+        self._pending: Dict[str, bytes] = {}
+        self._futures: Dict[str, Future] = {}
+        self._results: Dict[str, WorkResult] = {}
+        self._worker = WorkerRuntime(registry)
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def publish_context(self, context_id: str, payload: bytes) -> None:
+        if context_id in self._contexts:
+            return
+        # Task IDs include the context ID, so results of earlier contexts can never match again.
+        self.close()
+        self._contexts = {context_id: payload}
+        self._results = {}
+        self._worker.add_context(context_id, payload)
+
+    def submit(self, task_id: str, payload: bytes) -> None:
+        stored = self._results.get(task_id)
+        if stored is not None and stored.error is None:
+            return
+        self._results.pop(task_id, None)
+        if task_id in self._pending or task_id in self._futures:
+            return
+        if self._workers == 0:
+            self._pending[task_id] = payload
+            return
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._workers,
+                initializer=_init_local_worker,
+                initargs=(self._registry, self._contexts),
+            )
+        self._futures[task_id] = self._pool.submit(_execute_local, payload)
+
+    def collect(self, task_ids: Sequence[str]) -> Dict[str, WorkResult]:
+        for task_id in [task_id for task_id in task_ids if task_id in self._pending]:
+            payload = self._pending.pop(task_id)
+            try:
+                self._results[task_id] = WorkResult(task_id, payload=self._worker.execute(payload))
+            except Exception as exc:  # noqa: BLE001 - reported to the dispatcher for retry
+                self._results[task_id] = WorkResult(task_id, error=f"{exc.__class__.__name__}:{exc}")
+        running = {self._futures[task_id]: task_id for task_id in task_ids if task_id in self._futures}
+        if running and not any(task_id in self._results for task_id in task_ids):
+            wait(list(running), return_when=FIRST_COMPLETED)
+        for future, task_id in running.items():
+            if not future.done():
+                continue
+            del self._futures[task_id]
+            error = future.exception()
+            self._results[task_id] = (
+                WorkResult(task_id, error=f"{error.__class__.__name__}:{error}")
+                if error is not None
+                else WorkResult(task_id, payload=future.result())
+            )
+        return {task_id: self._results[task_id] for task_id in task_ids if task_id in self._results}
+
+    def discard(self, task_ids: Sequence[str]) -> None:
+        for task_id in task_ids:
+            self._results.pop(task_id, None)
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        self._futures = {}
+
+
+class FileBroker(WorkQueue):
+    """Directory-backed broker standing in for a real queue; workers may run on other nodes.
+
+    Layout under `root`: contexts/, pending/, claimed/, leases/ and results/, one JSON file per
+    task ID. Workers claim a task by renaming it from pending/ to claimed/, and every file is
+    written under a temporary name and renamed into place, so a claim or result is never seen
+    half written. A worker records its claim in leases/ and renews it every `heartbeat_seconds`
+    while the task runs. The coordinator times each lease on its own clock from the last renewal
+    it observed, so clock skew between hosts does not matter. A lease not renewed for
+    `lease_seconds` is reported as failed and the dispatcher resubmits the task; if the original
+    worker finishes later, the first stored result wins. Collected results are deleted, and a
+    context is deleted once every coordinator that published it has released it.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        heartbeat_seconds: Optional[float] = None,
+        result_timeout: float = DEFAULT_RESULT_TIMEOUT_SECONDS,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+    ) -> None:
+        self.root = Path(root)
+        self.max_attempts = max_attempts
+        self.heartbeat_seconds = heartbeat_seconds if heartbeat_seconds is not None else lease_seconds / 4
+        self._lease_seconds = lease_seconds
+        self._result_timeout = result_timeout
+        self._poll_interval = poll_interval
+        # task ID -> (last lease record seen, coordinator monotonic time it was first seen)
+        self._observed_leases: Dict[str, Tuple[bytes, float]] = {}
+        self._context_refs: Dict[str, Path] = {}
+        for name in ("contexts", "pending", "claimed", "leases", "results"):
+            (self.root / name).mkdir(parents=True, exist_ok=True)
+
+    def publish_context(self, context_id: str, payload: bytes) -> None:
+        path = self._path("contexts", context_id)
+        if context_id not in self._context_refs:
+            reference = self.root / "contexts" / f"{context_id}.{uuid.uuid4().hex}.ref"
+            reference.touch()
+            self._context_refs[context_id] = reference
+        if not path.exists():
+            self._write(path, payload)
+
+    def release_context(self, context_id: str) -> None:
+        reference = self._context_refs.pop(context_id, None)
+        if reference is None:
+            return
+        reference.unlink(missing_ok=True)
+        if not any((self.root / "contexts").glob(f"{context_id}.*.ref")):
+            self._path("contexts", context_id).unlink(missing_ok=True)
+
+    def submit(self, task_id: str, payload: bytes) -> None:
+        result = self._path("results", task_id)
+        if result.exists():
+            if self._read_result(task_id).error is None:
+                return
+            result.unlink(missing_ok=True)
+        if self._path("pending", task_id).exists() or self._path("claimed", task_id).exists():
+            return
+        self._write(self._path("pending", task_id), payload)
+
+    def collect(self, task_ids: Sequence[str]) -> Dict[str, WorkResult]:
+        deadline = time.monotonic() + self._result_timeout
+        while True:
+            finished: Dict[str, WorkResult] = {}
+            now = time.monotonic()
+            for task_id in task_ids:
+                if self._path("results", task_id).exists():
+                    self._observed_leases.pop(task_id, None)
+                    finished[task_id] = self._read_result(task_id)
+                    continue
+                if not self._path("claimed", task_id).exists():
+                    self._observed_leases.pop(task_id, None)
+                    continue
+                try:
+                    # Empty until the claiming worker has written its lease record.
+                    record = self._path("leases", task_id).read_bytes()
+                except FileNotFoundError:
+                    record = b""
+                observed = self._observed_leases.get(task_id)
+                if observed is None or observed[0] != record:
+                    self._observed_leases[task_id] = (record, now)
+                elif now - observed[1] > self._lease_seconds:
+                    self._observed_leases.pop(task_id)
+                    self._path("claimed", task_id).unlink(missing_ok=True)
+                    self._path("leases", task_id).unlink(missing_ok=True)
+                    finished[task_id] = WorkResult(task_id, error="lease_expired")
+            if finished:
+                return finished
+            if time.monotonic() >= deadline:
+                raise TimeoutError("work_queue_timeout")
+            time.sleep(self._poll_interval)
+
+    def discard(self, task_ids: Sequence[str]) -> None:
+        for task_id in task_ids:
+            for kind in ("results", "pending", "claimed", "leases"):
+                self._path(kind, task_id).unlink(missing_ok=True)
+
+    def claim(self) -> Optional[WorkItem]:
+        for pending in sorted((self.root / "pending").glob("*.json")):
+            claimed = self._path("claimed", pending.stem)
+            try:
+                os.rename(pending, claimed)
+            except FileNotFoundError:
+                continue
+            claimed_at = time.time()
+            self._write_lease(pending.stem, {"claimed_at": claimed_at, "renewed_at": claimed_at, "renewals": 0})
+            return WorkItem(task_id=pending.stem, payload=claimed.read_bytes())
+        return None
+
+    def renew(self, task_id: str) -> None:
+        """Extends the lease of a task this worker is still running."""
+        if not self._path("claimed", task_id).exists():
+            return
+        try:
+            lease = json.loads(self._path("leases", task_id).read_bytes())
+        except (FileNotFoundError, ValueError):
+            lease = {"claimed_at": time.time(), "renewals": 0}
+        self._write_lease(task_id, {**lease, "renewed_at": time.time(), "renewals": lease["renewals"] + 1})
+
+    def load_context(self, context_id: str) -> bytes:
+        return self._path("contexts", context_id).read_bytes()
+
+    def complete(self, task_id: str, payload: bytes) -> None:
+        self._finish(task_id, {"payload": json.loads(payload)})
+
+    def fail(self, task_id: str, error: str) -> None:
+        self._finish(task_id, {"error": error})
+
+    def _finish(self, task_id: str, record: Dict[str, Any]) -> None:
+        result = self._path("results", task_id)
+        if not result.exists():
+            self._write(result, stable_json_dumps(record).encode("utf-8"))
+        self._path("claimed", task_id).unlink(missing_ok=True)
+        self._path("leases", task_id).unlink(missing_ok=True)
+
+    def _write_lease(self, task_id: str, lease: Dict[str, Any]) -> None:
+        self._write(self._path("leases", task_id), stable_json_dumps(lease).encode("utf-8"))
+
+    def _read_result(self, task_id: str) -> WorkResult:
+        record = json.loads(self._path("results", task_id).read_bytes())
+        if "error" in record:
+            return WorkResult(task_id, error=record["error"])
+        return WorkResult(task_id, payload=stable_json_dumps(record["payload"]).encode("utf-8"))
+
+    def _path(self, kind: str, task_id: str) -> Path:
+        return self.root / kind / f"{task_id}.json"
+
+    @staticmethod
+    def _write(path: Path, payload: bytes) -> None:
+        temporary = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        temporary.write_bytes(payload)
+        os.replace(temporary, path)
+
+
+def _run_with_heartbeat(broker: FileBroker, task_id: str, run: Callable[[], bytes]) -> bytes:
+    stop = threading.Event()
+
+    def heartbeat() -> None:
+        while not stop.wait(broker.heartbeat_seconds):
+            broker.renew(task_id)
+
+    thread = threading.Thread(target=heartbeat, name=f"lease-{task_id[:12]}", daemon=True)
+    thread.start()
+    try:
+        return run()
+    finally:
+        stop.set()
+        thread.join()
+
+
+def serve_file_broker(
+    broker: FileBroker,
+    *,
+    registry: Optional[AgentRegistry] = None,
+    idle_timeout: Optional[float] = None,
+    poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+) -> int:
+    """Claim and run tasks until the broker has been idle for `idle_timeout` seconds (or forever).
+
+    Each claimed task's lease is renewed in the background while it runs.
+    """
+    worker = WorkerRuntime(registry)
+    handled = 0
+    idle_since = time.monotonic()
+    while True:
+        item = broker.claim()
+        if item is None:
+            if idle_timeout is not None and time.monotonic() - idle_since >= idle_timeout:
+                return handled
+            time.sleep(poll_interval)
+            continue
+        try:
+            payload = _run_with_heartbeat(
+                broker, item.task_id, lambda: worker.execute(item.payload, broker.load_context)
+            )
+        except Exception as exc:  # noqa: BLE001 - reported to the dispatcher for retry
+            broker.fail(item.task_id, f"{exc.__class__.__name__}:{exc}")
+        else:
+            broker.complete(item.task_id, payload)
+        handled += 1
+        idle_since = time.monotonic()
+
+
+def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Work-queue worker for holding-level agent tasks")
+    parser.add_argument("--broker", required=True, help="FileBroker directory shared with the coordinator")
+    parser.add_argument("--idle-timeout", type=float, default=None, help="Exit after this many idle seconds")
+    parser.add_argument("--poll-interval", type=float, default=DEFAULT_POLL_INTERVAL_SECONDS)
+    return parser.parse_args(argv)
+
+
+def main() -> None:
+    args = _parse_args(sys.argv[1:])
+    handled = serve_file_broker(
+        FileBroker(Path(args.broker)),
+        idle_timeout=args.idle_timeout,
+        poll_interval=args.poll_interval,
+    )
+    print(f"handled {handled} tasks")
+
+
+if __name__ == "__main__":
+    main()
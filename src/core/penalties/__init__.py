@@ -6,7 +6,10 @@ from src.core.penalties.models import (
     MissingField,
     StalenessFlag,
 )
+from src.core.penalties.agent_outputs import parse_dio_output, parse_fx_reports
+from src.core.penalties.batch import PenaltyColumns, PenaltyInput, compute_penalty_breakdowns_batch, gather_penalty_columns
 from src.core.penalties.penalty_engine import compute_penalty_breakdown, compute_penalty_breakdown_with_cap_tracking
+from src.core.penalties.policy import PenaltyPolicy
 
 __all__ = [
     "ContradictionRecord",
@@ -14,7 +17,14 @@ __all__ = [
     "DIOOutput",
     "FXExposureReport",
     "MissingField",
+    "PenaltyColumns",
+    "PenaltyInput",
+    "PenaltyPolicy",
     "StalenessFlag",
     "compute_penalty_breakdown",
     "compute_penalty_breakdown_with_cap_tracking",
+    "compute_penalty_breakdowns_batch",
+    "gather_penalty_columns",
+    "parse_dio_output",
+    "parse_fx_reports",
 ]
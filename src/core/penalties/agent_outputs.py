@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from typing import Dict, Optional
+
+from pydantic import ValidationError
+
+from src.core.models import AgentResult
+from src.core.penalties.models import DIOOutput, FXExposureReport
+
+
+def parse_dio_output(result: AgentResult) -> Optional[DIOOutput]:
+    try:
+        return DIOOutput.parse_obj(result.key_findings)
+    except ValidationError:
+        return None
+
+
+def parse_fx_reports(result: AgentResult) -> Dict[str, Optional[FXExposureReport]]:
+    # Holding-scope PSCC carries a single report; portfolio PSCC carries one per holding.
+    # Invalid payloads map to None so callers can tell them apart from missing reports.
+    if result.scope == "holding":
+        payload = result.key_findings.get("fx_exposure_report")
+        if payload is None or not result.holding_id:
+            return {}
+        return {result.holding_id: _parse_fx_report(payload)}
+    payloads = result.key_findings.get("fx_exposure_reports") or {}
+    return {
+        holding_id: _parse_fx_report(payload)
+        for holding_id, payload in payloads.items()
+        if payload is not None
+    }
+
+
+def _parse_fx_report(payload: object) -> Optional[FXExposureReport]:
+    try:
+        return FXExposureReport.parse_obj(payload)
+    except ValidationError:
+        return None
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.core.models import AgentResult, AgentResultStore, PenaltyBreakdown, PortfolioConfig, RunConfig
+from src.core.penalties.models import DIOOutput, FXExposureReport
+from src.core.penalties.penalty_engine import (
+    _build_breakdown,
+    _confidence_reasons,
+    _data_validity_reasons,
+    _dio_hard_stop_triggered,
+    _fx_reasons,
+    _integrity_reasons,
+    _missing_field_reason,
+    _normalize_missing_fields,
+    _zero_breakdown,
+)
+from src.core.penalties.policy import PENALTY_REASONS, STALENESS_REASONS, PenaltyPolicy
+
+
+# One column per penalty reason. Every reason has a fixed amount and items are deduped by
+# reason, so a holding's pre-cap items are exactly a boolean row over these columns.
+REASON_COLUMNS: Tuple[str, ...] = tuple(PENALTY_REASONS)
+STALENESS_COLUMNS: Tuple[str, ...] = tuple(STALENESS_REASONS.values())
+
+_COLUMN_INDEX = {reason: index for index, reason in enumerate(REASON_COLUMNS)}
+_STALENESS_INDEX = np.array([_COLUMN_INDEX[reason] for reason in STALENESS_COLUMNS])
+_CASH_INDEX = _COLUMN_INDEX["missing_cash_or_runway"]
+
+
+def _columns_of(reasons: Sequence[str]) -> np.ndarray:
+    return np.array([_COLUMN_INDEX[reason] for reason in reasons], dtype=int)
+
+
+@dataclass(frozen=True)
+class PenaltyInput:
+    holding_id: str
+    dio_output: DIOOutput
+    fx_report: Optional[FXExposureReport] = None
+
+
+@dataclass(frozen=True)
+class PenaltyColumns:
+    """Columnar penalty flags for a batch of holdings, before thresholds and caps.
+
+    `flags` is (holdings x REASON_COLUMNS); staleness columns are left unset and derived from
+    `staleness_age_days` (holdings x STALENESS_COLUMNS, the largest non-hard-stop age or NaN).
+    """
+
+    holding_ids: Tuple[str, ...]
+    hard_stop: np.ndarray
+    burn_rate: np.ndarray
+    flags: np.ndarray
+    staleness_age_days: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.holding_ids)
+
+
+def gather_penalty_columns(
+    holdings: Sequence[PenaltyInput],
+    *,
+    run_config: RunConfig,
+    agent_results: Sequence[AgentResult],
+    portfolio_config: PortfolioConfig,
+) -> PenaltyColumns:
+    store = AgentResultStore.coerce(agent_results)
+    count = len(holdings)
+    hard_stop = np.zeros(count, dtype=bool)
+    burn_rate = np.zeros(count, dtype=bool)
+    flags = np.zeros((count, len(REASON_COLUMNS)), dtype=bool)
+    staleness_age_days = np.full((count, len(STALENESS_COLUMNS)), np.nan)
+
+    for row, holding in enumerate(holdings):
+        dio_output = holding.dio_output
+        hard_stop[row] = _dio_hard_stop_triggered(dio_output)
+        burn_rate[row] = bool(run_config.burn_rate_classification.get(holding.holding_id))
+        reasons: List[str] = []
+        for missing in _normalize_missing_fields(dio_output.missing_penalty_critical_fields):
+            if not missing.not_applicable:
+                reason = _missing_field_reason(missing.field_name)
+                if reason is not None:
+                    reasons.append(reason)
+        reasons.extend(_integrity_reasons(dio_output))
+        reasons.extend(_confidence_reasons(holding.holding_id, store))
+        reasons.extend(_fx_reasons(portfolio_config, holding.fx_report))
+        reasons.extend(_data_validity_reasons(dio_output))
+        for reason in reasons:
+            flags[row, _COLUMN_INDEX[reason]] = True
+
+        for flag in dio_output.staleness_flags:
+            reason = STALENESS_REASONS.get(flag.staleness_type)
+            if flag.hard_stop_triggered or reason is None:
+                continue
+            column = STALENESS_COLUMNS.index(reason)
+            current = staleness_age_days[row, column]
+            if math.isnan(current) or flag.age_days > current:
+                staleness_age_days[row, column] = flag.age_days
+
+    return PenaltyColumns(
+        holding_ids=tuple(holding.holding_id for holding in holdings),
+        hard_stop=hard_stop,
+        burn_rate=burn_rate,
+        flags=flags,
+        staleness_age_days=staleness_age_days,
+    )
+
+
+def compute_penalty_breakdowns_batch(
+    columns: PenaltyColumns,
+    *,
+    run_config: Optional[RunConfig] = None,
+    policy: Optional[PenaltyPolicy] = None,
+) -> List[Tuple[PenaltyBreakdown, bool]]:
+    """`compute_penalty_breakdown_with_cap_tracking` for every holding in `columns` at once.
+
+    Thresholds, category caps and the total cap are applied as array operations; breakdowns
+    are only built at the end. Amounts are whole numbers, so the array sums are exact and
+    the results equal the per-holding engine's.
+    """
+    if policy is None:
+        if run_config is None:
+            raise ValueError("run_config or policy is required")
+        policy = PenaltyPolicy.compile(run_config)
+    present, cap_applied = capped_penalty_presence(columns, [policy])
+    return [
+        (breakdown_from_presence(present[0, row], policy), bool(cap_applied[0, row]))
+        for row in range(len(columns))
+    ]
+
+
+def capped_penalty_presence(
+    columns: PenaltyColumns,
+    policies: Sequence[PenaltyPolicy],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Reasons kept after thresholds and caps, as (policies x holdings x REASON_COLUMNS).
+
+    Also returns (policies x holdings) cap-applied flags. The policies may differ in limits,
+    caps and exclusions but must share one reason table, so every policy has the same drop
+    orders and amounts.
+    """
+    if not policies:
+        return (
+            np.zeros((0, len(columns), len(REASON_COLUMNS)), dtype=bool),
+            np.zeros((0, len(columns)), dtype=bool),
+        )
+    reference = policies[0]
+    if any(policy.reasons != reference.reasons for policy in policies[1:]):
+        raise ValueError("policies must share one reason table")
+    amounts = np.array([reference.amount(reason) for reason in REASON_COLUMNS], dtype=float)
+
+    present = np.repeat(columns.flags[None, :, :], len(policies), axis=0)
+    present[:, :, _CASH_INDEX] &= ~columns.burn_rate
+    limits = np.array(
+        [[policy.staleness_limits[reason] for reason in STALENESS_COLUMNS] for policy in policies],
+        dtype=float,
+    )
+    with np.errstate(invalid="ignore"):
+        present[:, :, _STALENESS_INDEX] = columns.staleness_age_days[None, :, :] > limits[:, None, :]
+    for position, policy in enumerate(policies):
+        if policy.excluded_reasons:
+            present[position][:, _columns_of(sorted(policy.excluded_reasons))] = False
+    present &= ~columns.hard_stop[None, :, None]
+
+    cap_applied = np.zeros(present.shape[:2], dtype=bool)
+    for category, drop_order in reference.category_drop_orders.items():
+        if not drop_order:
+            continue
+        caps = np.array([policy.category_caps[category] for policy in policies], dtype=float)
+        cap_applied |= _drop_to_cap(present, _columns_of(drop_order), amounts, caps)
+    caps = np.array([policy.total_cap for policy in policies], dtype=float)
+    cap_applied |= _drop_to_cap(present, _columns_of(reference.total_drop_order), amounts, caps)
+    return present, cap_applied
+
+
+def breakdown_from_presence(row: np.ndarray, policy: PenaltyPolicy) -> PenaltyBreakdown:
+    """The `PenaltyBreakdown` for one holding's row of `capped_penalty_presence`."""
+    if not row.any():
+        return _zero_breakdown()
+    return _build_breakdown([policy.item(REASON_COLUMNS[index]) for index in np.flatnonzero(row)])
+
+
+def _drop_to_cap(present: np.ndarray, order: np.ndarray, amounts: np.ndarray, caps: np.ndarray) -> np.ndarray:
+    # `PenaltyPolicy.apply_caps` drops reasons in drop order while the running total is below
+    # the cap. Amounts are negative, so the running total only rises and the dropped reasons
+    # form a prefix: one goes exactly when the total minus everything present before it is
+    # still below the cap. Updates `present` and returns which rows dropped anything.
+    values = np.where(present[:, :, order], amounts[order], 0.0)
+    total = values.sum(axis=2, keepdims=True)
+    before = np.cumsum(values, axis=2) - values
+    dropped = present[:, :, order] & (total - before < caps[:, None, None])
+    present[:, :, order] &= ~dropped
+    return dropped.any(axis=2)
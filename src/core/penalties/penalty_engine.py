@@ -1,48 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Sequence
+from typing import Iterable, List, Optional, Sequence
 
-from src.core.models import AgentResult, ConfigSnapshot, PenaltyBreakdown, PenaltyItem, PortfolioConfig, RunConfig, RunMode
+from src.core.models import AgentResult, AgentResultStore, ConfigSnapshot, PenaltyBreakdown, PenaltyItem, PortfolioConfig, RunConfig
 from src.core.penalties.models import DIOOutput, FXExposureReport, MissingField
-
-
-@dataclass(frozen=True)
-class _Thresholds:
-    stale_financials: float
-    stale_price_volume: float
-    stale_company_updates: float
-    stale_macro_regime: float
-
-
-DEFAULT_THRESHOLDS = {
-    RunMode.FAST: _Thresholds(
-        stale_financials=120.0,
-        stale_price_volume=3.0,
-        stale_company_updates=90.0,
-        stale_macro_regime=14.0,
-    ),
-    RunMode.DEEP: _Thresholds(
-        stale_financials=90.0,
-        stale_price_volume=1.0,
-        stale_company_updates=60.0,
-        stale_macro_regime=7.0,
-    ),
-}
-
-CATEGORY_CAPS = {
-    "A": -20.0,
-    "B": -10.0,
-    "C": -20.0,
-    "D": -10.0,
-    "E": -10.0,
-    "F": -10.0,
-}
-
-TOTAL_CAPS = {
-    RunMode.DEEP: -35.0,
-    RunMode.FAST: -40.0,
-}
+from src.core.penalties.policy import CATEGORY_CAPS, STALENESS_REASONS, PenaltyPolicy
 
 
 def compute_penalty_breakdown(
@@ -53,6 +15,7 @@ def compute_penalty_breakdown(
     agent_results: Sequence[AgentResult],
     portfolio_config: PortfolioConfig,
     pscc_output_optional: Optional[FXExposureReport] = None,
+    policy: Optional[PenaltyPolicy] = None,
 ) -> PenaltyBreakdown:
     breakdown, _ = compute_penalty_breakdown_with_cap_tracking(
         holding_id=holding_id,
@@ -62,6 +25,7 @@ def compute_penalty_breakdown(
         agent_results=agent_results,
         portfolio_config=portfolio_config,
         pscc_output_optional=pscc_output_optional,
+        policy=policy,
     )
     return breakdown
 
@@ -74,78 +38,41 @@ def compute_penalty_breakdown_with_cap_tracking(
     agent_results: Sequence[AgentResult],
     portfolio_config: PortfolioConfig,
     pscc_output_optional: Optional[FXExposureReport] = None,
+    policy: Optional[PenaltyPolicy] = None,
 ) -> tuple[PenaltyBreakdown, bool]:
     if _dio_hard_stop_triggered(dio_output):
         return _zero_breakdown(), False
 
-    items: List[PenaltyItem] = []
+    policy = policy or PenaltyPolicy.compile(run_config)
+    reasons: List[str] = []
     is_burn_rate_company = bool(run_config.burn_rate_classification.get(holding_id))
     missing_fields = _normalize_missing_fields(dio_output.missing_penalty_critical_fields)
 
     for missing in missing_fields:
         if missing.not_applicable:
             continue
-        field_name = missing.field_name
-        if field_name in {"cash", "runway_months", "burn_rate"}:
-            if not is_burn_rate_company:
-                items.append(_item("A", "missing_cash_or_runway", -6.0, "DIO"))
-            continue
-        if field_name in {"shares_outstanding", "market_cap"}:
-            items.append(_item("A", "missing_shares_or_market_cap", -5.0, "DIO"))
-            continue
-        if field_name == "fully_diluted_shares":
-            items.append(_item("A", "missing_fully_diluted_shares", -4.0, "DIO"))
-            continue
-        if field_name in {"adv_usd", "liquidity_measure"}:
-            items.append(_item("A", "missing_liquidity_measure", -5.0, "DIO"))
-            continue
-        if field_name in {"price", "volume"}:
-            items.append(_item("A", "missing_price_or_volume", -4.0, "DIO"))
-            continue
-        if field_name in {"macro_regime_input", "vix", "macro_regime"}:
-            items.append(_item("A", "missing_macro_regime_input", -4.0, "DIO"))
+        reason = _missing_field_reason(missing.field_name)
+        if reason is None or (reason == "missing_cash_or_runway" and is_burn_rate_company):
             continue
+        reasons.append(reason)
 
-    thresholds = _resolve_thresholds(run_config)
     for flag in dio_output.staleness_flags:
         if flag.hard_stop_triggered:
             continue
         reason = _staleness_reason(flag.staleness_type)
         if reason is None:
             continue
-        limit = getattr(thresholds, reason)
-        if flag.age_days > limit:
-            items.append(_item("B", reason, _staleness_amount(reason), "DIO"))
+        if policy.is_stale(reason, flag.age_days):
+            reasons.append(reason)
 
-    if dio_output.contradictions:
-        items.append(_item("C", "contradiction_detected", -10.0, "DIO"))
-        if any(record.unresolved for record in dio_output.contradictions):
-            items.append(_item("C", "conflict_unresolved", -6.0, "DIO"))
-    if dio_output.unsourced_numbers_detected:
-        items.append(_item("C", "unsourced_numbers_detected", -10.0, "DIO"))
-
-    if _count_low_confidence(agent_results, holding_id) >= 3:
-        items.append(_item("D", "low_confidence_multi_agent", -5.0, "PenaltyEngine"))
-    if _devils_advocate_unresolved(agent_results, holding_id):
-        items.append(_item("D", "devils_advocate_unresolved_fatal_risk", -5.0, "DevilsAdvocate"))
-
-    items.extend(_fx_items(portfolio_config, pscc_output_optional))
+    reasons.extend(_integrity_reasons(dio_output))
+    reasons.extend(_confidence_reasons(holding_id, agent_results))
+    reasons.extend(_fx_reasons(portfolio_config, pscc_output_optional))
+    reasons.extend(_data_validity_reasons(dio_output))
 
-    data_validity_items = _data_validity_items(dio_output)
-    if run_config.run_mode == RunMode.FAST:
-        data_validity_items = [
-            item for item in data_validity_items if item.reason == "recent_split_or_reverse_split"
-        ]
-    items.extend(data_validity_items)
-
-    items = _dedupe_items(items)
-    capped_by_category = _apply_category_caps(items, _resolve_category_caps(run_config))
-    category_cap_applied = len(capped_by_category) != len(items)
-    capped_total = _apply_total_cap(capped_by_category, _resolve_total_cap(run_config))
-    total_cap_applied = len(capped_total) != len(capped_by_category)
-    cap_applied = category_cap_applied or total_cap_applied
-
-    return _build_breakdown(capped_total), cap_applied
+    # Dedupes, drops reasons excluded for the run mode, then applies category and total caps.
+    capped, cap_applied = policy.apply_caps(reasons)
+    return _build_breakdown([policy.item(reason) for reason in capped]), cap_applied
 
 
 def _dio_hard_stop_triggered(dio_output: DIOOutput) -> bool:
@@ -171,8 +98,20 @@ def _zero_breakdown() -> PenaltyBreakdown:
     )
 
 
-def _item(category: str, reason: str, amount: float, source_agent: str) -> PenaltyItem:
-    return PenaltyItem(category=category, reason=reason, amount=amount, source_agent=source_agent)
+def _missing_field_reason(field_name: str) -> Optional[str]:
+    if field_name in {"cash", "runway_months", "burn_rate"}:
+        return "missing_cash_or_runway"
+    if field_name in {"shares_outstanding", "market_cap"}:
+        return "missing_shares_or_market_cap"
+    if field_name == "fully_diluted_shares":
+        return "missing_fully_diluted_shares"
+    if field_name in {"adv_usd", "liquidity_measure"}:
+        return "missing_liquidity_measure"
+    if field_name in {"price", "volume"}:
+        return "missing_price_or_volume"
+    if field_name in {"macro_regime_input", "vix", "macro_regime"}:
+        return "missing_macro_regime_input"
+    return None
 
 
 def _normalize_missing_fields(entries: Iterable[MissingField | str]) -> List[MissingField]:
@@ -185,68 +124,41 @@ def _normalize_missing_fields(entries: Iterable[MissingField | str]) -> List[Mis
     return normalized
 
 
-def _resolve_thresholds(run_config: RunConfig) -> _Thresholds:
-    defaults = DEFAULT_THRESHOLDS[run_config.run_mode]
-    thresholds = run_config.staleness_thresholds or {}
-    if isinstance(thresholds.get(run_config.run_mode.value), dict):
-        thresholds = thresholds[run_config.run_mode.value]
-    return _Thresholds(
-        stale_financials=thresholds.get("stale_financials", defaults.stale_financials),
-        stale_price_volume=thresholds.get("stale_price_volume", defaults.stale_price_volume),
-        stale_company_updates=thresholds.get("stale_company_updates", defaults.stale_company_updates),
-        stale_macro_regime=thresholds.get("stale_macro_regime", defaults.stale_macro_regime),
-    )
+def _staleness_reason(staleness_type: str) -> Optional[str]:
+    return STALENESS_REASONS.get(staleness_type)
 
 
-def _resolve_category_caps(run_config: RunConfig) -> Dict[str, float]:
-    caps = CATEGORY_CAPS.copy()
-    for key, value in (run_config.penalty_caps or {}).items():
-        if key in caps:
-            caps[key] = float(value)
-    return caps
+def _integrity_reasons(dio_output: DIOOutput) -> List[str]:
+    reasons: List[str] = []
+    if dio_output.contradictions:
+        reasons.append("contradiction_detected")
+        if any(record.unresolved for record in dio_output.contradictions):
+            reasons.append("conflict_unresolved")
+    if dio_output.unsourced_numbers_detected:
+        reasons.append("unsourced_numbers_detected")
+    return reasons
 
 
-def _resolve_total_cap(run_config: RunConfig) -> float:
-    caps = run_config.penalty_caps or {}
-    if "total" in caps:
-        return float(caps["total"])
-    return TOTAL_CAPS[run_config.run_mode]
+def _confidence_reasons(holding_id: str, agent_results: Sequence[AgentResult]) -> List[str]:
+    holding_agents = AgentResultStore.coerce(agent_results).for_holding(holding_id)
+    reasons: List[str] = []
+    if _count_low_confidence(holding_agents) >= 3:
+        reasons.append("low_confidence_multi_agent")
+    if _devils_advocate_unresolved(holding_agents):
+        reasons.append("devils_advocate_unresolved_fatal_risk")
+    return reasons
 
 
-def _staleness_reason(staleness_type: str) -> Optional[str]:
-    mapping = {
-        "financials": "stale_financials",
-        "price_volume": "stale_price_volume",
-        "company_updates": "stale_company_updates",
-        "macro_regime": "stale_macro_regime",
-    }
-    return mapping.get(staleness_type)
-
-
-def _staleness_amount(reason: str) -> float:
-    amounts = {
-        "stale_financials": -5.0,
-        "stale_price_volume": -3.0,
-        "stale_company_updates": -2.0,
-        "stale_macro_regime": -4.0,
-    }
-    return amounts[reason]
-
-
-def _count_low_confidence(agent_results: Sequence[AgentResult], holding_id: str) -> int:
+def _count_low_confidence(holding_agents: Sequence[AgentResult]) -> int:
     count = 0
-    for agent in agent_results:
-        if agent.scope != "holding" or agent.holding_id != holding_id:
-            continue
+    for agent in holding_agents:
         if agent.confidence is not None and agent.confidence < 0.5:
             count += 1
     return count
 
 
-def _devils_advocate_unresolved(agent_results: Sequence[AgentResult], holding_id: str) -> bool:
-    for agent in agent_results:
-        if agent.scope != "holding" or agent.holding_id != holding_id:
-            continue
+def _devils_advocate_unresolved(holding_agents: Sequence[AgentResult]) -> bool:
+    for agent in holding_agents:
         if "devil" not in agent.agent_name.lower():
             continue
         findings = agent.key_findings or {}
@@ -255,10 +167,10 @@ def _devils_advocate_unresolved(agent_results: Sequence[AgentResult], holding_id
     return False
 
 
-def _fx_items(
+def _fx_reasons(
     portfolio_config: PortfolioConfig,
     pscc_output_optional: Optional[FXExposureReport],
-) -> List[PenaltyItem]:
+) -> List[str]:
     if pscc_output_optional is None:
         return []
     if pscc_output_optional.fx_hard_stop_triggered:
@@ -267,97 +179,33 @@ def _fx_items(
     holding_currency = pscc_output_optional.holding_currency
     if not base_currency or not holding_currency or base_currency == holding_currency:
         return []
-    items: List[PenaltyItem] = []
+    reasons: List[str] = []
     if pscc_output_optional.fx_rate_missing:
-        items.append(_item("E", "fx_rate_missing", -5.0, "PSCC"))
+        reasons.append("fx_rate_missing")
     if pscc_output_optional.fx_rate_stale:
-        items.append(_item("E", "fx_rate_stale", -3.0, "PSCC"))
+        reasons.append("fx_rate_stale")
     if (
         pscc_output_optional.fx_exposure_pct is not None
         and pscc_output_optional.fx_exposure_pct > 0.2
         and pscc_output_optional.hedge_data_missing
     ):
-        items.append(_item("E", "fx_exposure_high_no_hedge_data", -5.0, "PSCC"))
-    return items
+        reasons.append("fx_exposure_high_no_hedge_data")
+    return reasons
 
 
-def _data_validity_items(dio_output: DIOOutput) -> List[PenaltyItem]:
-    items: List[PenaltyItem] = []
+def _data_validity_reasons(dio_output: DIOOutput) -> List[str]:
+    reasons: List[str] = []
     risk = dio_output.corporate_action_risk
     if risk:
         if risk.split_days_ago is not None and risk.split_days_ago <= 90:
-            items.append(_item("F", "recent_split_or_reverse_split", -6.0, "DIO"))
+            reasons.append("recent_split_or_reverse_split")
         if risk.dividend_days_ago is not None and risk.dividend_days_ago <= 90:
-            items.append(_item("F", "recent_dividend_or_distribution", -3.0, "DIO"))
+            reasons.append("recent_dividend_or_distribution")
         if risk.spinoff_or_merger_days_ago is not None and risk.spinoff_or_merger_days_ago <= 180:
-            items.append(_item("F", "recent_spinoff_or_merger", -8.0, "DIO"))
+            reasons.append("recent_spinoff_or_merger")
     if dio_output.low_source_reliability:
-        items.append(_item("F", "low_source_reliability", -5.0, "DIO"))
-    return items
-
-
-def _dedupe_items(items: Iterable[PenaltyItem]) -> List[PenaltyItem]:
-    deduped: Dict[tuple[str, str, str], PenaltyItem] = {}
-    for item in items:
-        key = (item.category, item.reason, item.source_agent)
-        if key not in deduped:
-            deduped[key] = item
-    return list(deduped.values())
-
-
-def _apply_category_caps(items: List[PenaltyItem], caps: Dict[str, float]) -> List[PenaltyItem]:
-    by_category: Dict[str, List[PenaltyItem]] = {}
-    for item in items:
-        by_category.setdefault(item.category, []).append(item)
-    trimmed: List[PenaltyItem] = []
-    for category, category_items in by_category.items():
-        cap = caps.get(category)
-        if cap is None:
-            trimmed.extend(category_items)
-            continue
-        trimmed.extend(_drop_items_to_cap(category_items, cap, _category_drop_order))
-    return trimmed
-
-
-def _apply_total_cap(items: List[PenaltyItem], total_cap: float) -> List[PenaltyItem]:
-    total = sum(item.amount for item in items)
-    if total >= total_cap:
-        return items
-    remaining = _drop_items_to_cap(items, total_cap, _total_drop_order)
-    return remaining
-
-
-def _drop_items_to_cap(
-    items: List[PenaltyItem],
-    cap: float,
-    drop_order: callable,
-) -> List[PenaltyItem]:
-    total = sum(item.amount for item in items)
-    if total >= cap:
-        return items
-    ordered = drop_order(items)
-    remaining = list(items)
-    for item in ordered:
-        if total >= cap:
-            break
-        total -= item.amount
-        if item in remaining:
-            remaining.remove(item)
-    return remaining
-
-
-def _category_drop_order(items: List[PenaltyItem]) -> List[PenaltyItem]:
-    ordered = sorted(items, key=lambda item: item.reason, reverse=True)
-    ordered = sorted(ordered, key=lambda item: abs(item.amount))
-    return ordered
-
-
-def _total_drop_order(items: List[PenaltyItem]) -> List[PenaltyItem]:
-    category_rank = {"A": 0, "B": 1, "C": 2, "D": 3, "E": 4, "F": 5}
-    ordered = sorted(items, key=lambda item: item.reason, reverse=True)
-    ordered = sorted(ordered, key=lambda item: category_rank.get(item.category, 0), reverse=True)
-    ordered = sorted(ordered, key=lambda item: abs(item.amount))
-    return ordered
+        reasons.append("low_source_reliability")
+    return reasons
 
 
 def _build_breakdown(items: List[PenaltyItem]) -> PenaltyBreakdown:
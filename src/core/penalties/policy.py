@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple
+
+from src.core.models import PenaltyItem, RunConfig, RunMode
+
+
+DEFAULT_THRESHOLDS: Dict[RunMode, Dict[str, float]] = {
+    RunMode.FAST: {
+        "stale_financials": 120.0,
+        "stale_price_volume": 3.0,
+        "stale_company_updates": 90.0,
+        "stale_macro_regime": 14.0,
+    },
+    RunMode.DEEP: {
+        "stale_financials": 90.0,
+        "stale_price_volume": 1.0,
+        "stale_company_updates": 60.0,
+        "stale_macro_regime": 7.0,
+    },
+}
+
+CATEGORY_CAPS = {
+    "A": -20.0,
+    "B": -10.0,
+    "C": -20.0,
+    "D": -10.0,
+    "E": -10.0,
+    "F": -10.0,
+}
+
+TOTAL_CAPS = {
+    RunMode.DEEP: -35.0,
+    RunMode.FAST: -40.0,
+}
+
+# reason -> (category, amount, source_agent)
+PENALTY_REASONS: Dict[str, Tuple[str, float, str]] = {
+    "missing_cash_or_runway": ("A", -6.0, "DIO"),
+    "missing_shares_or_market_cap": ("A", -5.0, "DIO"),
+    "missing_fully_diluted_shares": ("A", -4.0, "DIO"),
+    "missing_liquidity_measure": ("A", -5.0, "DIO"),
+    "missing_price_or_volume": ("A", -4.0, "DIO"),
+    "missing_macro_regime_input": ("A", -4.0, "DIO"),
+    "stale_financials": ("B", -5.0, "DIO"),
+    "stale_price_volume": ("B", -3.0, "DIO"),
+    "stale_company_updates": ("B", -2.0, "DIO"),
+    "stale_macro_regime": ("B", -4.0, "DIO"),
+    "contradiction_detected": ("C", -10.0, "DIO"),
+    "conflict_unresolved": ("C", -6.0, "DIO"),
+    "unsourced_numbers_detected": ("C", -10.0, "DIO"),
+    "low_confidence_multi_agent": ("D", -5.0, "PenaltyEngine"),
+    "devils_advocate_unresolved_fatal_risk": ("D", -5.0, "DevilsAdvocate"),
+    "fx_rate_missing": ("E", -5.0, "PSCC"),
+    "fx_rate_stale": ("E", -3.0, "PSCC"),
+    "fx_exposure_high_no_hedge_data": ("E", -5.0, "PSCC"),
+    "recent_split_or_reverse_split": ("F", -6.0, "DIO"),
+    "recent_dividend_or_distribution": ("F", -3.0, "DIO"),
+    "recent_spinoff_or_merger": ("F", -8.0, "DIO"),
+    "low_source_reliability": ("F", -5.0, "DIO"),
+}
+
+STALENESS_REASONS = {
+    "financials": "stale_financials",
+    "price_volume": "stale_price_volume",
+    "company_updates": "stale_company_updates",
+    "macro_regime": "stale_macro_regime",
+}
+
+# Data validity reasons still applied in FAST mode.
+FAST_DATA_VALIDITY_REASONS = frozenset({"recent_split_or_reverse_split"})
+
+# Total-cap drop order ranks categories F -> A (DD-05).
+CATEGORY_DROP_RANKS = {"A": 0, "B": 1, "C": 2, "D": 3, "E": 4, "F": 5}
+
+
+@dataclass(frozen=True)
+class PenaltyPolicy:
+    """Penalty thresholds, caps and reason amounts resolved once per run config.
+
+    Drop orders for the category and total caps are precomputed, so `apply_caps` is a single
+    pass over the reason table per cap instead of sorting and removing items per holding.
+    """
+
+    staleness_limits: Mapping[str, float]
+    category_caps: Mapping[str, float]
+    total_cap: float
+    reasons: Mapping[str, Tuple[str, float, str]]
+    excluded_reasons: FrozenSet[str]
+    category_drop_orders: Mapping[str, Tuple[str, ...]]
+    total_drop_order: Tuple[str, ...]
+
+    @classmethod
+    def compile(cls, run_config: RunConfig) -> PenaltyPolicy:
+        # ConfigSnapshot carries no penalty settings yet; everything here comes from RunConfig.
+        defaults = DEFAULT_THRESHOLDS[run_config.run_mode]
+        thresholds = run_config.staleness_thresholds or {}
+        if isinstance(thresholds.get(run_config.run_mode.value), dict):
+            thresholds = thresholds[run_config.run_mode.value]
+        category_caps = CATEGORY_CAPS.copy()
+        penalty_caps = run_config.penalty_caps or {}
+        for key, value in penalty_caps.items():
+            if key in category_caps:
+                category_caps[key] = float(value)
+        total_cap = float(penalty_caps["total"]) if "total" in penalty_caps else TOTAL_CAPS[run_config.run_mode]
+        excluded_reasons: FrozenSet[str] = frozenset()
+        if run_config.run_mode == RunMode.FAST:
+            excluded_reasons = frozenset(
+                reason
+                for reason, (category, _, _) in PENALTY_REASONS.items()
+                if category == "F" and reason not in FAST_DATA_VALIDITY_REASONS
+            )
+        return cls.from_tables(
+            staleness_limits={reason: thresholds.get(reason, default) for reason, default in defaults.items()},
+            category_caps=category_caps,
+            total_cap=total_cap,
+            excluded_reasons=excluded_reasons,
+        )
+
+    @classmethod
+    def from_tables(
+        cls,
+        *,
+        staleness_limits: Mapping[str, float],
+        category_caps: Mapping[str, float],
+        total_cap: float,
+        reasons: Optional[Mapping[str, Tuple[str, float, str]]] = None,
+        excluded_reasons: Iterable[str] = (),
+    ) -> PenaltyPolicy:
+        reasons = dict(reasons if reasons is not None else PENALTY_REASONS)
+        by_reason_desc = sorted(reasons, reverse=True)
+        category_drop_orders: Dict[str, Tuple[str, ...]] = {}
+        for category in category_caps:
+            members = [reason for reason in by_reason_desc if reasons[reason][0] == category]
+            category_drop_orders[category] = tuple(sorted(members, key=lambda reason: abs(reasons[reason][1])))
+        total_drop_order = sorted(
+            by_reason_desc,
+            key=lambda reason: CATEGORY_DROP_RANKS.get(reasons[reason][0], 0),
+            reverse=True,
+        )
+        total_drop_order = sorted(total_drop_order, key=lambda reason: abs(reasons[reason][1]))
+        return cls(
+            staleness_limits=MappingProxyType(dict(staleness_limits)),
+            category_caps=MappingProxyType(dict(category_caps)),
+            total_cap=total_cap,
+            reasons=MappingProxyType(reasons),
+            excluded_reasons=frozenset(excluded_reasons),
+            category_drop_orders=MappingProxyType(category_drop_orders),
+            total_drop_order=tuple(total_drop_order),
+        )
+
+    def amount(self, reason: str) -> float:
+        return self.reasons[reason][1]
+
+    def item(self, reason: str) -> PenaltyItem:
+        category, amount, source_agent = self.reasons[reason]
+        return PenaltyItem(category=category, reason=reason, amount=amount, source_agent=source_agent)
+
+    def is_stale(self, reason: str, age_days: float) -> bool:
+        return age_days > self.staleness_limits[reason]
+
+    def apply_caps(self, reasons: Iterable[str]) -> Tuple[List[str], bool]:
+        """Deduped, mode-filtered `reasons` after category then total caps, and whether any cap dropped one."""
+        ordered = [reason for reason in dict.fromkeys(reasons) if reason not in self.excluded_reasons]
+        present = set(ordered)
+        cap_applied = False
+        for category, drop_order in self.category_drop_orders.items():
+            cap_applied |= self._drop_to_cap(drop_order, self.category_caps[category], present)
+        cap_applied |= self._drop_to_cap(self.total_drop_order, self.total_cap, present)
+        return [reason for reason in ordered if reason in present], cap_applied
+
+    def _drop_to_cap(self, drop_order: Tuple[str, ...], cap: float, present: Set[str]) -> bool:
+        # Drops present reasons in drop order while the running total is below the cap.
+        members = [reason for reason in drop_order if reason in present]
+        total = sum(self.reasons[reason][1] for reason in members)
+        dropped = False
+        for reason in members:
+            if total >= cap:
+                break
+            total -= self.reasons[reason][1]
+            present.discard(reason)
+            dropped = True
+        return dropped
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import json
 from datetime import datetime
-from typing import Any, Iterable, List, Tuple
+from typing import TYPE_CHECKING, Any, Iterable, List, Tuple
 
-from src.core.models import HoldingInput
+if TYPE_CHECKING:
+    from src.core.models import HoldingInput
 
 
 def _holding_sort_key(index: int, holding: HoldingInput) -> Tuple[str, int]:
@@ -1,5 +1,17 @@
 """Release phase runners."""
 
-from src.release.phase1 import run_phase1
+from __future__ import annotations
+
+from typing import Any
 
 __all__ = ["run_phase1"]
+
+
+def __getattr__(name: str) -> Any:
+    # phase1 pulls in the replay harness and the whole pipeline; load it only when asked for,
+    # so `src.release.manifest` and `src.release.phase0` stay cheap to import.
+    if name == "run_phase1":
+        from src.release.phase1 import run_phase1
+
+        return run_phase1
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
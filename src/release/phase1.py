@@ -2,21 +2,40 @@ from __future__ import annotations
 
 import argparse
 import json
+import platform
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-from src.testing.replay import BundlePaths, FixturePaths, replay_n_times
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.core.canonicalization import canonical_json_dumps
+from src.core.canonicalization.hashing import sha256_text
+from src.core.config.loader import sha256_digest
+from src.core.orchestration.parallel import SERIAL_EXECUTION, ExecutionConfig
+from src.testing.replay import (
+    BundlePaths,
+    FixturePaths,
+    ReplayResult,
+    detect_mismatch,
+    load_replay_inputs,
+    replay_inputs,
+)
+from src.testing.scale import DEFAULT_MAX_REGRESSION, compare_scale_baseline, rerun_for_baseline
 from tools.phase0_readiness import run_phase0_readiness
 
 
+PHASE0_CACHE_NAME = "phase0_cache.json"
+
+
 @dataclass
 class Phase1Check:
     name: str
     status: str
     details: Dict[str, Any]
+    duration_ms: Optional[float] = None
 
 
 @dataclass
@@ -32,6 +51,28 @@ def _parse_args(argv: List[str]) -> argparse.Namespace:
     parser.add_argument("--fixtures", required=True, help="Path to fixture directory")
     parser.add_argument("--out_dir", required=True, help="Output directory for Phase 1 artifacts")
     parser.add_argument("--runs", type=int, default=1, help="Number of deterministic replay runs")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Replay worker processes across fixtures and runs (1 replays serially in this process)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip fixtures whose input digest matches their stored hash baseline and replay log",
+    )
+    parser.add_argument(
+        "--scale_baseline",
+        required=False,
+        help="Scale benchmark baseline JSON (python -m src.testing.scale); enables the scale_benchmark check",
+    )
+    parser.add_argument(
+        "--scale_max_regression",
+        type=float,
+        default=DEFAULT_MAX_REGRESSION,
+        help="Allowed wall time / peak memory growth against --scale_baseline as a fraction",
+    )
     return parser.parse_args(argv)
 
 
@@ -60,28 +101,24 @@ def run_phase1(argv: List[str]) -> int:
     fixture_map = _fixture_matrix(fixtures_dir)
     report_timestamp = _deterministic_timestamp(fixture_map)
 
-    phase0_result = run_phase0_readiness(
-        [
-            "--release",
-            release_id,
-            "--config-dir",
-            str(bundle_dir),
-            "--fixtures-dir",
-            str(fixtures_dir),
-            "--out",
-            str(phase0_out_dir),
-        ]
+    started = time.perf_counter()
+    phase0_errors, manifest_path, phase0_cached = _run_phase0(
+        release_id=release_id,
+        bundle_dir=bundle_dir,
+        fixtures_dir=fixtures_dir,
+        phase0_out_dir=phase0_out_dir,
     )
-    if phase0_result.errors:
+    if phase0_errors:
         checks.append(
             Phase1Check(
                 name="phase0_readiness",
                 status="FAIL",
-                details={"errors": phase0_result.errors},
+                details={"errors": phase0_errors},
+                duration_ms=_elapsed_ms(started),
             )
         )
         failures.extend(
-            Phase1Failure(check="phase0_readiness", error=error) for error in phase0_result.errors
+            Phase1Failure(check="phase0_readiness", error=error) for error in phase0_errors
         )
         _write_report(
             out_dir=out_dir,
@@ -99,7 +136,8 @@ def run_phase1(argv: List[str]) -> int:
         Phase1Check(
             name="phase0_readiness",
             status="PASS",
-            details={"manifest_path": str(phase0_result.manifest_path) if phase0_result.manifest_path else None},
+            details={"manifest_path": str(manifest_path) if manifest_path else None, "cached": phase0_cached},
+            duration_ms=_elapsed_ms(started),
         )
     )
 
@@ -114,7 +152,33 @@ def run_phase1(argv: List[str]) -> int:
         "--junitxml",
         str(test_dir / "pytest.xml"),
     ]
-    pytest_result = subprocess.run(pytest_cmd, capture_output=True, text=True)
+    # The suites run in a subprocess while this process replays the fixture matrix.
+    with ThreadPoolExecutor(max_workers=1) as pytest_runner:
+        pytest_future = pytest_runner.submit(_run_timed, pytest_cmd)
+
+        started = time.perf_counter()
+        deterministic_pass, skipped_fixtures = _run_replays(
+            fixture_map,
+            runs=runs,
+            workers=args.workers,
+            incremental=args.incremental,
+            replay_dir=replay_dir,
+            hash_dir=hash_dir,
+            hashes_report=hashes_report,
+            failures=failures,
+        )
+        replay_details: Dict[str, Any] = {"fixtures": sorted(fixture_map.keys()), "runs": runs}
+        if args.incremental:
+            replay_details["skipped_fixtures"] = skipped_fixtures
+        replay_check = Phase1Check(
+            name="deterministic_replay",
+            status="PASS" if deterministic_pass else "FAIL",
+            details=replay_details,
+            duration_ms=_elapsed_ms(started),
+        )
+
+        pytest_result, pytest_ms = pytest_future.result()
+
     pytest_status = "PASS" if pytest_result.returncode == 0 else "FAIL"
     checks.append(
         Phase1Check(
@@ -125,25 +189,159 @@ def run_phase1(argv: List[str]) -> int:
                 "stdout": pytest_result.stdout,
                 "stderr": pytest_result.stderr,
             },
+            duration_ms=pytest_ms,
         )
     )
     if pytest_result.returncode != 0:
         failures.append(
             Phase1Failure(check="pytest_phase1_suites", error="pytest suites failed")
         )
+    checks.append(replay_check)
 
-    bundle_paths = BundlePaths()
-    deterministic_pass = True
+    scale_pass = True
+    if args.scale_baseline:
+        scale_pass = _run_scale_check(
+            Path(args.scale_baseline),
+            out_dir=out_dir,
+            max_regression=args.scale_max_regression,
+            checks=checks,
+            failures=failures,
+        )
+
+    status = "PASS" if deterministic_pass and scale_pass and pytest_result.returncode == 0 else "FAIL"
+
+    _write_report(
+        out_dir=out_dir,
+        status=status,
+        runs=runs,
+        fixture_ids=sorted(fixture_map.keys()),
+        checks=checks,
+        hashes=hashes_report,
+        failures=failures,
+        report_timestamp=report_timestamp,
+    )
 
-    for fixture_id, fixture_paths in fixture_map.items():
-        replay_results = replay_n_times(
-            fixture_id,
-            runs,
-            fixture_paths=fixture_paths,
-            bundle_paths=bundle_paths,
+    return 0 if status == "PASS" else 1
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000.0, 3)
+
+
+def _run_timed(cmd: List[str]) -> Tuple[subprocess.CompletedProcess, float]:
+    started = time.perf_counter()
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    return result, _elapsed_ms(started)
+
+
+def _run_phase0(
+    *,
+    release_id: str,
+    bundle_dir: Path,
+    fixtures_dir: Path,
+    phase0_out_dir: Path,
+) -> Tuple[List[str], Optional[Path], bool]:
+    """Phase 0 readiness errors and manifest path, and whether a cached pass was reused.
+
+    A passing run is cached with the sha256 of every bundle and fixture file and of every file
+    in the manifest inventory; while none of them change, readiness is not re-run.
+    """
+    cache_path = phase0_out_dir / PHASE0_CACHE_NAME
+    cache = _load_json(cache_path) if cache_path.exists() else {}
+    manifest_path = Path(cache["manifest_path"]) if cache.get("manifest_path") else None
+    if (
+        cache.get("release_id") == release_id
+        and cache.get("python_version") == platform.python_version()
+        and manifest_path is not None
+        and manifest_path.exists()
+        and cache.get("input_digests") == _phase0_input_digests(bundle_dir, fixtures_dir, manifest_path)
+    ):
+        return [], manifest_path, True
+
+    phase0_result = run_phase0_readiness(
+        [
+            "--release",
+            release_id,
+            "--config-dir",
+            str(bundle_dir),
+            "--fixtures-dir",
+            str(fixtures_dir),
+            "--out",
+            str(phase0_out_dir),
+        ]
+    )
+    if phase0_result.errors or phase0_result.manifest_path is None:
+        cache_path.unlink(missing_ok=True)
+        return phase0_result.errors, phase0_result.manifest_path, False
+    cache_path.write_text(
+        json.dumps(
+            {
+                "release_id": release_id,
+                "python_version": platform.python_version(),
+                "manifest_path": str(phase0_result.manifest_path),
+                "input_digests": _phase0_input_digests(bundle_dir, fixtures_dir, phase0_result.manifest_path),
+            },
+            indent=2,
+            sort_keys=True,
         )
+        + "\n",
+        encoding="utf-8",
+    )
+    return [], phase0_result.manifest_path, False
+
+
+def _phase0_input_digests(bundle_dir: Path, fixtures_dir: Path, manifest_path: Path) -> Dict[str, Optional[str]]:
+    paths = {path for directory in (bundle_dir, fixtures_dir) for path in directory.rglob("*") if path.is_file()}
+    paths.update(Path(entry) for entry in _load_json(manifest_path).get("file_inventory", []))
+    return {
+        str(path): sha256_digest(path.read_bytes()) if path.is_file() else None
+        for path in sorted(paths)
+    }
+
+
+def _run_replays(
+    fixture_map: Dict[str, FixturePaths],
+    *,
+    runs: int,
+    workers: int,
+    incremental: bool,
+    replay_dir: Path,
+    hash_dir: Path,
+    hashes_report: List[Dict[str, Any]],
+    failures: List[Phase1Failure],
+) -> Tuple[bool, List[str]]:
+    """Replay the fixture matrix, writing replay logs and hash baselines per fixture.
+
+    With `incremental`, a fixture whose input digest and run count match its stored baseline is
+    not replayed; its stored replay log stands in for the replays.
+    """
+    bundle_paths = BundlePaths()
+    inputs_by_fixture = {
+        fixture_id: load_replay_inputs(fixture_paths, bundle_paths)
+        for fixture_id, fixture_paths in fixture_map.items()
+    }
+    input_digests = {
+        fixture_id: sha256_text(canonical_json_dumps(inputs))
+        for fixture_id, inputs in inputs_by_fixture.items()
+    }
+    stored = {
+        fixture_id: _stored_replay(fixture_id, input_digests[fixture_id], runs, replay_dir, hash_dir)
+        for fixture_id in fixture_map
+    } if incremental else {}
+    skipped_fixtures = sorted(fixture_id for fixture_id, results in stored.items() if results is not None)
+
+    execution = ExecutionConfig(max_workers=workers, pool="process") if workers > 1 else SERIAL_EXECUTION
+    replays = replay_inputs(
+        {fixture_id: inputs for fixture_id, inputs in inputs_by_fixture.items() if fixture_id not in skipped_fixtures},
+        runs,
+        execution=execution,
+    )
+
+    deterministic_pass = True
+    for fixture_id in fixture_map:
+        replay_results = stored[fixture_id] if fixture_id in skipped_fixtures else replays[fixture_id]
         baseline = replay_results[0]
-        mismatch = _detect_mismatch(baseline, replay_results[1:])
+        mismatch = detect_mismatch(baseline, replay_results[1:])
         if mismatch:
             deterministic_pass = False
             diff_path = replay_dir / f"{fixture_id}_diff.json"
@@ -167,9 +365,18 @@ def run_phase1(argv: List[str]) -> int:
         replay_path = replay_dir / f"{fixture_id}.json"
         replay_path.write_text(json.dumps(replay_payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
 
+        # Only a deterministic replay records its input digest, so --incremental never skips a mismatch.
         hash_baseline_path = hash_dir / f"{fixture_id}.json"
         hash_baseline_path.write_text(
-            json.dumps({"fixture_id": fixture_id, "baseline": baseline.hashes}, indent=2, sort_keys=True)
+            json.dumps(
+                {
+                    "fixture_id": fixture_id,
+                    "baseline": baseline.hashes,
+                    "input_digest": None if mismatch else input_digests[fixture_id],
+                },
+                indent=2,
+                sort_keys=True,
+            )
             + "\n",
             encoding="utf-8",
         )
@@ -186,29 +393,57 @@ def run_phase1(argv: List[str]) -> int:
                     "run_hash": result.hashes.get("run_hash"),
                 }
             )
+    return deterministic_pass, skipped_fixtures
+
 
+def _stored_replay(
+    fixture_id: str,
+    input_digest: str,
+    runs: int,
+    replay_dir: Path,
+    hash_dir: Path,
+) -> Optional[List[ReplayResult]]:
+    hash_baseline_path = hash_dir / f"{fixture_id}.json"
+    replay_path = replay_dir / f"{fixture_id}.json"
+    if not hash_baseline_path.exists() or not replay_path.exists():
+        return None
+    if _load_json(hash_baseline_path).get("input_digest") != input_digest:
+        return None
+    payload = json.loads(replay_path.read_text(encoding="utf-8"))
+    if len(payload) != runs:
+        return None
+    return [ReplayResult(hashes=entry["hashes"], outcomes=entry["outcomes"], logs=entry["logs"]) for entry in payload]
+
+
+def _run_scale_check(
+    baseline_path: Path,
+    *,
+    out_dir: Path,
+    max_regression: float,
+    checks: List[Phase1Check],
+    failures: List[Phase1Failure],
+) -> bool:
+    started = time.perf_counter()
+    baseline = _load_json(baseline_path)
+    report = rerun_for_baseline(baseline)
+    report_path = out_dir / "scale_benchmark.json"
+    report_path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    violations = compare_scale_baseline(report, baseline, max_regression=max_regression)
     checks.append(
         Phase1Check(
-            name="deterministic_replay",
-            status="PASS" if deterministic_pass else "FAIL",
-            details={"fixtures": sorted(fixture_map.keys()), "runs": runs},
+            name="scale_benchmark",
+            status="FAIL" if violations else "PASS",
+            details={
+                "baseline": str(baseline_path),
+                "report": str(report_path),
+                "max_regression": max_regression,
+                "violations": violations,
+            },
+            duration_ms=_elapsed_ms(started),
         )
     )
-
-    status = "PASS" if deterministic_pass and pytest_result.returncode == 0 else "FAIL"
-
-    _write_report(
-        out_dir=out_dir,
-        status=status,
-        runs=runs,
-        fixture_ids=sorted(fixture_map.keys()),
-        checks=checks,
-        hashes=hashes_report,
-        failures=failures,
-        report_timestamp=report_timestamp,
-    )
-
-    return 0 if status == "PASS" else 1
+    failures.extend(Phase1Failure(check="scale_benchmark", error=violation) for violation in violations)
+    return not violations
 
 
 def _fixture_matrix(fixtures_dir: Path) -> Dict[str, FixturePaths]:
@@ -273,32 +508,6 @@ def _deterministic_timestamp(fixture_map: Dict[str, FixturePaths]) -> str:
     return "2025-01-01T00:00:00Z"
 
 
-def _detect_mismatch(baseline, candidates):
-    for result in candidates:
-        mismatches = []
-        if baseline.hashes.get("decision_hash") != result.hashes.get("decision_hash"):
-            mismatches.append("decision_hash")
-        if baseline.hashes.get("run_hash") != result.hashes.get("run_hash"):
-            mismatches.append("run_hash")
-        if baseline.hashes.get("holding_packet_hashes") != result.hashes.get("holding_packet_hashes"):
-            mismatches.append("holding_packet_hashes")
-        if baseline.outcomes != result.outcomes:
-            mismatches.append("outcomes")
-        if mismatches:
-            return {
-                "baseline": {
-                    "hashes": baseline.hashes,
-                    "outcomes": baseline.outcomes,
-                },
-                "candidate": {
-                    "hashes": result.hashes,
-                    "outcomes": result.outcomes,
-                },
-                "differences": sorted(set(mismatches)),
-            }
-    return None
-
-
 def _write_report(
     *,
     out_dir: Path,
@@ -331,7 +540,8 @@ def _write_report(
         "## Checks",
     ]
     for check in checks:
-        lines.append(f"- **{check.name}**: {check.status}")
+        duration = f" ({check.duration_ms:.1f} ms)" if check.duration_ms is not None else ""
+        lines.append(f"- **{check.name}**: {check.status}{duration}")
     if failures:
         lines.append("\n## Failures")
         for failure in failures:
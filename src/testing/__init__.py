@@ -1,11 +1,25 @@
 """Testing utilities for deterministic replay and validation."""
 
-from src.testing.replay import FixturePaths, BundlePaths, compute_all_hashes, replay_n_times, run_fixture
+from src.testing.replay import (
+    BundlePaths,
+    FixturePaths,
+    compute_all_hashes,
+    detect_mismatch,
+    load_replay_inputs,
+    replay_inputs,
+    replay_matrix,
+    replay_n_times,
+    run_fixture,
+)
 
 __all__ = [
     "FixturePaths",
     "BundlePaths",
     "compute_all_hashes",
+    "detect_mismatch",
+    "load_replay_inputs",
+    "replay_inputs",
+    "replay_matrix",
     "replay_n_times",
     "run_fixture",
 ]
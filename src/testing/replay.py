@@ -1,18 +1,20 @@
 from __future__ import annotations
 
+import multiprocessing
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
 from src.core.canonicalization import (
-    canonical_json_dumps,
     hash_committee_packet,
     hash_decision_payload,
+    hash_holding_packet,
     hash_portfolio_config,
     hash_portfolio_snapshot,
     hash_run_config,
     hash_run_hash,
+    packet_hash_session,
 )
 from src.core.config.loader import load_json_file, load_manifest, sha256_digest
 from src.core.models import (
@@ -24,6 +26,7 @@ from src.core.models import (
     RunOutcome,
 )
 from src.core.orchestration import Orchestrator
+from src.core.orchestration.parallel import SERIAL_EXECUTION, ExecutionConfig, ordered_map, worker_pool
 
 
 @dataclass(frozen=True)
@@ -56,7 +59,7 @@ def run_fixture(
     *,
     now_func: Optional[Callable[[], datetime]] = None,
 ) -> OrchestrationResult:
-    inputs = _build_inputs(fixture_paths, bundle_paths)
+    inputs = load_replay_inputs(fixture_paths, bundle_paths)
     orchestrator = Orchestrator(now_func=now_func)
     return orchestrator.run(**inputs)
 
@@ -72,12 +75,12 @@ def compute_all_hashes(packet: OrchestrationResult, inputs: Dict[str, Any]) -> D
     run_config_hash = hash_run_config(run_config)
 
     committee_packet = packet.portfolio_committee_packet
+    session = packet_hash_session()
     holding_packet_hashes: Dict[str, str] = {}
     if packet.holding_packets:
         for holding in packet.holding_packets:
             key = holding.holding_id or "unknown"
-            holding_packet_hashes[key] = canonical_json_dumps(holding)
-            holding_packet_hashes[key] = sha256_digest(holding_packet_hashes[key].encode("utf-8"))
+            holding_packet_hashes[key] = hash_holding_packet(holding, session=session)
 
     if committee_packet is None:
         return {
@@ -101,12 +104,12 @@ def compute_all_hashes(packet: OrchestrationResult, inputs: Dict[str, Any]) -> D
             "holding_packet_hashes": holding_packet_hashes,
         }
 
-    committee_packet_hash = hash_committee_packet(committee_packet)
+    committee_packet_hash = hash_committee_packet(committee_packet, session=session)
     decision_payload = {
         "portfolio_committee_packet": committee_packet,
         "holding_packets": packet.holding_packets,
     }
-    computed_decision_hash = hash_decision_payload(decision_payload)
+    computed_decision_hash = hash_decision_payload(decision_payload, session=session)
     computed_run_hash = hash_run_hash(
         snapshot_hash=snapshot_hash,
         config_hash=config_hash,
@@ -137,24 +140,120 @@ def replay_n_times(
     fixture_paths: FixturePaths,
     bundle_paths: BundlePaths,
     now_func: Optional[Callable[[], datetime]] = None,
+    execution: ExecutionConfig = SERIAL_EXECUTION,
 ) -> List[ReplayResult]:
-    results: List[ReplayResult] = []
-    for run_index in range(n):
-        inputs = _build_inputs(fixture_paths, bundle_paths)
-        outcome = Orchestrator(now_func=now_func).run(**inputs)
-        hashes = compute_all_hashes(outcome, inputs)
-        outcomes = _collect_outcomes(outcome)
-        logs = {
-            "fixture_id": fixture_id,
-            "run_index": run_index,
-            "run_outcome": outcome.outcome.value,
-            "guard_results": [guard.model_dump() for guard in outcome.guard_results],
-        }
-        results.append(ReplayResult(hashes=hashes, outcomes=outcomes, logs=logs))
+    return replay_matrix(
+        {fixture_id: fixture_paths},
+        n,
+        bundle_paths=bundle_paths,
+        now_func=now_func,
+        execution=execution,
+    )[fixture_id]
+
+
+def replay_matrix(
+    fixture_map: Mapping[str, FixturePaths],
+    runs: int,
+    *,
+    bundle_paths: BundlePaths,
+    now_func: Optional[Callable[[], datetime]] = None,
+    execution: ExecutionConfig = SERIAL_EXECUTION,
+) -> Dict[str, List[ReplayResult]]:
+    """Replay every fixture `runs` times; results are listed per fixture in run_index order."""
+    inputs_by_fixture = {
+        fixture_id: load_replay_inputs(fixture_paths, bundle_paths)
+        for fixture_id, fixture_paths in fixture_map.items()
+    }
+    return replay_inputs(inputs_by_fixture, runs, now_func=now_func, execution=execution)
+
+
+def replay_inputs(
+    inputs_by_fixture: Mapping[str, Dict[str, Any]],
+    runs: int,
+    *,
+    now_func: Optional[Callable[[], datetime]] = None,
+    execution: ExecutionConfig = SERIAL_EXECUTION,
+) -> Dict[str, List[ReplayResult]]:
+    """Replay already loaded fixture inputs `runs` times each.
+
+    A process pool uses the spawn start method, so every worker is a fresh interpreter with its
+    own string hash seed, and replays of one fixture are compared across processes. `now_func`
+    must be picklable in that case.
+    """
+    inputs_by_fixture = dict(inputs_by_fixture)
+    tasks = [(fixture_id, run_index) for fixture_id in inputs_by_fixture for run_index in range(runs)]
+    mp_context = multiprocessing.get_context("spawn") if execution.uses_processes else None
+    # ordered_map runs serial and single-task replays in this process, so it needs the inputs too.
+    _init_replay_worker(inputs_by_fixture, now_func)
+    with worker_pool(
+        execution,
+        initializer=_init_replay_worker,
+        initargs=(inputs_by_fixture, now_func),
+        mp_context=mp_context,
+    ) as executor:
+        replayed = ordered_map(_replay_task, tasks, executor=executor, config=execution)
+
+    results: Dict[str, List[ReplayResult]] = {fixture_id: [] for fixture_id in inputs_by_fixture}
+    for (fixture_id, _), result in zip(tasks, replayed):
+        results[fixture_id].append(result)
     return results
 
 
-def _build_inputs(fixture_paths: FixturePaths, bundle_paths: BundlePaths) -> Dict[str, Any]:
+# Set once per replay worker process, so fixture inputs are sent to each worker once.
+_REPLAY_WORKER: Dict[str, Any] = {}
+
+
+def _init_replay_worker(
+    inputs_by_fixture: Dict[str, Dict[str, Any]],
+    now_func: Optional[Callable[[], datetime]],
+) -> None:
+    _REPLAY_WORKER.clear()
+    _REPLAY_WORKER.update({"inputs_by_fixture": inputs_by_fixture, "now_func": now_func})
+
+
+def _replay_task(task: Tuple[str, int]) -> ReplayResult:
+    fixture_id, run_index = task
+    inputs = _REPLAY_WORKER["inputs_by_fixture"][fixture_id]
+    outcome = Orchestrator(now_func=_REPLAY_WORKER["now_func"]).run(**inputs)
+    hashes = compute_all_hashes(outcome, inputs)
+    outcomes = _collect_outcomes(outcome)
+    logs = {
+        "fixture_id": fixture_id,
+        "run_index": run_index,
+        "run_outcome": outcome.outcome.value,
+        "guard_results": [guard.model_dump() for guard in outcome.guard_results],
+    }
+    return ReplayResult(hashes=hashes, outcomes=outcomes, logs=logs)
+
+
+def detect_mismatch(baseline: ReplayResult, candidates: List[ReplayResult]) -> Optional[Dict[str, Any]]:
+    """The first candidate whose hashes or outcomes differ from `baseline`, as a diff payload."""
+    for result in candidates:
+        mismatches = []
+        if baseline.hashes.get("decision_hash") != result.hashes.get("decision_hash"):
+            mismatches.append("decision_hash")
+        if baseline.hashes.get("run_hash") != result.hashes.get("run_hash"):
+            mismatches.append("run_hash")
+        if baseline.hashes.get("holding_packet_hashes") != result.hashes.get("holding_packet_hashes"):
+            mismatches.append("holding_packet_hashes")
+        if baseline.outcomes != result.outcomes:
+            mismatches.append("outcomes")
+        if mismatches:
+            return {
+                "baseline": {
+                    "hashes": baseline.hashes,
+                    "outcomes": baseline.outcomes,
+                },
+                "candidate": {
+                    "hashes": result.hashes,
+                    "outcomes": result.outcomes,
+                },
+                "differences": sorted(set(mismatches)),
+            }
+    return None
+
+
+def load_replay_inputs(fixture_paths: FixturePaths, bundle_paths: BundlePaths) -> Dict[str, Any]:
     run_config_path = fixture_paths.run_config or bundle_paths.run_config
     config_snapshot_path = fixture_paths.config_snapshot or bundle_paths.config_snapshot
     if run_config_path is None or config_snapshot_path is None:
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from src.core.logging.timings import TimingRecorder
+from src.core.models import OrchestrationResult
+from src.core.orchestration import Orchestrator
+from src.core.orchestration.orchestrator import DEFAULT_TIME
+from src.core.utils.determinism import stable_json_dumps
+from src.testing.synthetic import SyntheticRates, generate_portfolio
+
+
+DEFAULT_SCALE_SIZES = (1000, 10000)
+DEFAULT_MAX_REGRESSION = 0.25
+DEFAULT_RUN_CONFIG: Dict[str, Any] = {"run_mode": "DEEP", "partial_failure_veto_threshold_pct": 30.0}
+
+
+def _run_once(inputs: Dict[str, Any]) -> Tuple[OrchestrationResult, TimingRecorder, float]:
+    timings = TimingRecorder()
+    started = time.perf_counter()
+    result = Orchestrator(now_func=lambda: DEFAULT_TIME).run(**inputs, timings=timings)
+    return result, timings, (time.perf_counter() - started) * 1000.0
+
+
+def _summed_ms(records: List[Dict[str, Any]]) -> Dict[str, float]:
+    totals: Dict[str, float] = {}
+    for record in records:
+        totals[record["name"]] = totals.get(record["name"], 0.0) + record["duration_ms"]
+    return {name: round(total, 3) for name, total in sorted(totals.items())}
+
+
+def measure_size(
+    holding_count: int,
+    *,
+    seed: int = 0,
+    rates: Optional[SyntheticRates] = None,
+    run_config_data: Optional[Dict[str, Any]] = None,
+    repeats: int = 1,
+    trace_memory: bool = True,
+) -> Dict[str, Any]:
+    """Wall time, per-stage and per-phase time, and peak traced memory for one portfolio size.
+
+    Stage and phase times come from the median run. Peak memory comes from one extra run under
+    tracemalloc and counts Python allocations made inside `Orchestrator.run`; the inputs are
+    generated before tracing starts.
+    """
+    inputs = generate_portfolio(holding_count, seed=seed, rates=rates).run_inputs(
+        run_config_data or DEFAULT_RUN_CONFIG
+    )
+    runs = sorted((_run_once(inputs) for _ in range(max(1, repeats))), key=lambda run: run[2])
+    result, timings, _ = runs[(len(runs) - 1) // 2]
+    breakdown = timings.to_dict()
+
+    peak_memory_mb = None
+    if trace_memory:
+        tracemalloc.start()
+        try:
+            _run_once(inputs)
+            peak_memory_mb = round(tracemalloc.get_traced_memory()[1] / (1024 * 1024), 3)
+        finally:
+            tracemalloc.stop()
+
+    outcomes = Counter(packet.holding_run_outcome.value for packet in result.holding_packets)
+    return {
+        "holdings": holding_count,
+        "outcome": result.outcome.value,
+        "counts_by_outcome": dict(sorted(outcomes.items())),
+        "wall_ms": [round(run[2], 3) for run in runs],
+        "median_wall_ms": round(statistics.median(run[2] for run in runs), 3),
+        "stages_ms": _summed_ms(breakdown.get("stages", [])),
+        "phases_ms": _summed_ms(breakdown.get("phases", [])),
+        "peak_memory_mb": peak_memory_mb,
+    }
+
+
+def run_scale_benchmark(
+    *,
+    sizes: Sequence[int] = DEFAULT_SCALE_SIZES,
+    seed: int = 0,
+    rates: Optional[SyntheticRates] = None,
+    run_config_data: Optional[Dict[str, Any]] = None,
+    repeats: int = 1,
+    trace_memory: bool = True,
+) -> Dict[str, Any]:
+    rates = rates or SyntheticRates()
+    return {
+        "seed": seed,
+        "rates": asdict(rates),
+        "repeats": repeats,
+        "python": sys.version.split()[0],
+        "sizes": {
+            str(size): measure_size(
+                size,
+                seed=seed,
+                rates=rates,
+                run_config_data=run_config_data,
+                repeats=repeats,
+                trace_memory=trace_memory,
+            )
+            for size in sizes
+        },
+    }
+
+
+def rerun_for_baseline(baseline: Dict[str, Any], *, trace_memory: bool = True) -> Dict[str, Any]:
+    """Run the benchmark with the sizes, seed, rates and repeats recorded in `baseline`."""
+    return run_scale_benchmark(
+        sizes=[int(size) for size in baseline.get("sizes", {})] or DEFAULT_SCALE_SIZES,
+        seed=int(baseline.get("seed", 0)),
+        rates=SyntheticRates(**baseline.get("rates", {})),
+        repeats=int(baseline.get("repeats", 1)),
+        trace_memory=trace_memory,
+    )
+
+
+def compare_scale_baseline(
+    report: Dict[str, Any],
+    baseline: Dict[str, Any],
+    *,
+    max_regression: float = DEFAULT_MAX_REGRESSION,
+) -> List[str]:
+    """Regressions of `report` against `baseline` for the sizes both contain.
+
+    Outcomes must match exactly (same seed, same inputs); wall time and peak memory may grow
+    by at most `max_regression`.
+    """
+    violations: List[str] = []
+    if report.get("seed") != baseline.get("seed") or report.get("rates") != baseline.get("rates"):
+        violations.append("scale benchmark inputs differ from the baseline (seed or rates).")
+        return violations
+    for size, previous in sorted(baseline.get("sizes", {}).items(), key=lambda item: int(item[0])):
+        current = report.get("sizes", {}).get(size)
+        if current is None:
+            continue
+        for field in ("outcome", "counts_by_outcome"):
+            if current[field] != previous[field]:
+                violations.append(f"{size} holdings: {field} changed from {previous[field]} to {current[field]}.")
+        for metric in ("median_wall_ms", "peak_memory_mb"):
+            if current.get(metric) is None or previous.get(metric) is None:
+                continue
+            limit = previous[metric] * (1.0 + max_regression)
+            if current[metric] > limit:
+                violations.append(
+                    f"{size} holdings: {metric} {current[metric]:.1f} exceeds baseline {previous[metric]:.1f} "
+                    f"by more than {max_regression:.0%}."
+                )
+    return violations
+
+
+def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Orchestrator scale benchmark over synthetic portfolios")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SCALE_SIZES), help="Holding counts")
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic portfolio seed")
+    parser.add_argument("--repeats", type=int, default=1, help="Timed runs per size; the median is reported")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc peak memory run")
+    parser.add_argument("--out", required=True, help="Report output path (usable later as --baseline)")
+    parser.add_argument("--baseline", required=False, help="Earlier report to compare against")
+    parser.add_argument("--max-regression", type=float, default=DEFAULT_MAX_REGRESSION)
+    return parser.parse_args(argv)
+
+
+def main() -> None:
+    args = _parse_args(sys.argv[1:])
+    report = run_scale_benchmark(
+        sizes=args.sizes,
+        seed=args.seed,
+        repeats=args.repeats,
+        trace_memory=not args.no_memory,
+    )
+    violations: List[str] = []
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        violations = compare_scale_baseline(report, baseline, max_regression=args.max_regression)
+    out_path = Path(args.out)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(stable_json_dumps(report), encoding="utf-8")
+    for size, entry in report["sizes"].items():
+        memory = f", peak {entry['peak_memory_mb']:.1f} MB" if entry["peak_memory_mb"] is not None else ""
+        print(f"{size} holdings: {entry['median_wall_ms']:.1f} ms{memory}, {entry['outcome']}")
+    for violation in violations:
+        print(f"REGRESSION: {violation}")
+    sys.exit(1 if violations else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from src.core.utils.determinism import stable_json_dumps
+
+
+SYNTHETIC_AS_OF = "2025-01-01T00:00:00Z"
+SYNTHETIC_CASH_PCT = 0.05
+FX_CURRENCIES = ("EUR", "GBP", "JPY", "CAD")
+STALENESS_TYPES = ("financials", "price_volume", "company_updates", "macro_regime")
+METRIC_KEYS = ("fundamental_quality", "technical_momentum")
+ANALYTICAL_AGENTS = ("Fundamentals", "Technical", "DevilsAdvocate")
+
+SYNTHETIC_SCORING_RUBRIC: Dict[str, Any] = {
+    "dimensions": [
+        {
+            "name": "fundamental_quality",
+            "metric_key": "fundamental_quality",
+            "weight": 60.0,
+            "scale_min": 0.0,
+            "scale_max": 100.0,
+            "higher_is_better": True,
+        },
+        {
+            "name": "technical_momentum",
+            "metric_key": "technical_momentum",
+            "weight": 40.0,
+            "scale_min": 0.0,
+            "scale_max": 100.0,
+            "higher_is_better": True,
+        },
+    ]
+}
+
+
+@dataclass(frozen=True)
+class SyntheticRates:
+    """Per-holding probabilities of each injected condition."""
+
+    veto: float = 0.02
+    staleness: float = 0.10
+    contradiction: float = 0.05
+    fx_exposure: float = 0.10
+
+    def __post_init__(self) -> None:
+        for name, rate in asdict(self).items():
+            if not 0.0 <= rate <= 1.0:
+                raise ValueError(f"{name} rate must be within [0, 1]")
+
+
+@dataclass(frozen=True)
+class SyntheticPortfolio:
+    portfolio_snapshot: Dict[str, Any]
+    portfolio_config: Dict[str, Any]
+    config_snapshot: Dict[str, Any]
+
+    @property
+    def holding_count(self) -> int:
+        return len(self.portfolio_snapshot["holdings"])
+
+    def run_inputs(self, run_config_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Keyword arguments for `Orchestrator.run`."""
+        return {
+            "portfolio_snapshot_data": self.portfolio_snapshot,
+            "portfolio_config_data": self.portfolio_config,
+            "run_config_data": run_config_data,
+            "config_snapshot_data": self.config_snapshot,
+        }
+
+
+def generate_portfolio(
+    holding_count: int,
+    *,
+    seed: int = 0,
+    rates: Optional[SyntheticRates] = None,
+    base_currency: str = "USD",
+) -> SyntheticPortfolio:
+    """A valid snapshot of `holding_count` holdings with agent fixture seeds for every agent.
+
+    Output depends only on the arguments. Vetoes alternate between DIO integrity vetoes and
+    Risk Officer vetoes; staleness ages straddle the default DEEP thresholds, so only some
+    stale flags are penalized. FX-exposed holdings get a non-base currency and a PSCC report.
+    """
+    if holding_count < 1:
+        raise ValueError("holding_count must be at least 1")
+    rates = rates or SyntheticRates()
+    rng = random.Random(seed)
+    weight = (1.0 - SYNTHETIC_CASH_PCT) / holding_count
+    source_ref = {"origin": "synthetic", "as_of_date": SYNTHETIC_AS_OF, "retrieval_timestamp": SYNTHETIC_AS_OF}
+
+    holdings: List[Dict[str, Any]] = []
+    fixtures: Dict[str, Dict[str, Any]] = {
+        name: {"holdings": {}} for name in ("DIO", "LEFO", "RiskOfficer", *ANALYTICAL_AGENTS)
+    }
+    fx_reports: Dict[str, Dict[str, Any]] = {}
+    fx_totals: Dict[str, float] = {base_currency: 0.0}
+    position_caps: List[Dict[str, Any]] = []
+    vetoes = 0
+
+    for index in range(holding_count):
+        holding_id = f"SYN-{index:06d}"
+        ticker = f"S{index:06d}"
+        holding: Dict[str, Any] = {
+            "identity": {"holding_id": holding_id, "ticker": ticker, "identifier": f"{ticker}-US"},
+            "weight": weight,
+            "metrics": {
+                key: {"value": round(rng.uniform(0.0, 100.0), 4), "source_ref": source_ref} for key in METRIC_KEYS
+            },
+        }
+
+        dio: Dict[str, Any] = {
+            "staleness_flags": [],
+            "contradictions": [],
+            "integrity_veto_triggered": False,
+            "confidence": round(rng.uniform(0.6, 1.0), 4),
+        }
+        risk: Dict[str, Any] = {"veto_flags": [], "risk_summary": "neutral", "confidence": round(rng.uniform(0.6, 1.0), 4)}
+        if rng.random() < rates.staleness:
+            dio["staleness_flags"].append(
+                {"staleness_type": rng.choice(STALENESS_TYPES), "age_days": round(rng.uniform(1.0, 400.0), 2)}
+            )
+        if rng.random() < rates.contradiction:
+            dio["contradictions"].append({"unresolved": True})
+        if rng.random() < rates.veto:
+            if vetoes % 2 == 0:
+                dio["integrity_veto_triggered"] = True
+            else:
+                risk["veto_flags"] = ["synthetic_veto"]
+                risk["risk_summary"] = "veto"
+            vetoes += 1
+
+        currency = base_currency
+        if rng.random() < rates.fx_exposure:
+            currency = rng.choice(FX_CURRENCIES)
+            holding["currency"] = currency
+            fx_reports[holding_id] = {
+                "holding_currency": currency,
+                "fx_rate_stale": rng.random() < 0.5,
+                "fx_exposure_pct": round(rng.uniform(0.05, 0.6), 4),
+                "hedge_data_missing": rng.random() < 0.5,
+            }
+        fx_totals[currency] = fx_totals.get(currency, 0.0) + weight
+
+        score_cap = round(rng.uniform(60.0, 100.0), 2)
+        fixtures["LEFO"]["holdings"][holding_id] = {
+            "liquidity_grade": rng.randint(1, 5),
+            "hard_override_triggered": False,
+            "score_cap": score_cap,
+            "confidence": round(rng.uniform(0.6, 1.0), 4),
+        }
+        if rng.random() < 0.05:
+            position_caps.append({"holding_id": holding_id, "score_cap": round(score_cap - 5.0, 2)})
+        fixtures["DIO"]["holdings"][holding_id] = dio
+        fixtures["RiskOfficer"]["holdings"][holding_id] = risk
+        for agent_name in ANALYTICAL_AGENTS:
+            fixtures[agent_name]["holdings"][holding_id] = {"confidence": round(rng.uniform(0.5, 1.0), 4)}
+        holdings.append(holding)
+
+    fixtures["GRRA"] = {"portfolio": {"do_not_trade_flag": False, "risk_budget_multiplier": 1.0, "confidence": 0.9}}
+    fixtures["PSCC"] = {
+        "portfolio": {
+            "position_caps_applied": position_caps,
+            "fx_exposure_by_currency": {currency: round(total, 6) for currency, total in sorted(fx_totals.items())},
+            "fx_exposure_reports": fx_reports,
+            "portfolio_liquidity_risk": "low",
+            "confidence": 0.9,
+        }
+    }
+
+    return SyntheticPortfolio(
+        portfolio_snapshot={
+            "portfolio_id": f"PORT-SYN-{holding_count}-{seed}",
+            "as_of_date": SYNTHETIC_AS_OF,
+            "holdings": holdings,
+            "cash_pct": SYNTHETIC_CASH_PCT,
+        },
+        portfolio_config={"base_currency": base_currency},
+        config_snapshot={
+            "rubric_version": "v1.0",
+            "registries": {"scoring_rubric": SYNTHETIC_SCORING_RUBRIC, "agent_fixtures": fixtures},
+            "hash": f"synthetic_config_{holding_count}_{seed}",
+        },
+    )
+
+
+def write_synthetic_fixtures(
+    out_dir: Path,
+    *,
+    sizes: Sequence[int],
+    seed: int = 0,
+    rates: Optional[SyntheticRates] = None,
+) -> List[Path]:
+    """Write PortfolioSnapshot_SYN<n>.json and ConfigSnapshot_SYN<n>.json fixtures per size."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    rates = rates or SyntheticRates()
+    written: List[Path] = []
+    for size in sizes:
+        portfolio = generate_portfolio(size, seed=seed, rates=rates)
+        description = f"Synthetic {size}-holding fixture (seed {seed}, rates {asdict(rates)})."
+        for kind, payload in (
+            ("PortfolioSnapshot", portfolio.portfolio_snapshot),
+            ("ConfigSnapshot", portfolio.config_snapshot),
+        ):
+            fixture_id = f"{kind}_SYN{size}"
+            path = out_dir / f"{fixture_id}.json"
+            path.write_text(
+                stable_json_dumps(
+                    {
+                        "fixture_id": fixture_id,
+                        "version": "1.0",
+                        "description": description,
+                        "created_at_utc": SYNTHETIC_AS_OF,
+                        "payload": payload,
+                    }
+                ),
+                encoding="utf-8",
+            )
+            written.append(path)
+    return written
+
+
+def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate seeded synthetic portfolio fixtures")
+    parser.add_argument("--sizes", type=int, nargs="+", required=True, help="Holding counts to generate")
+    parser.add_argument("--out", required=True, help="Output directory for fixtures")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--veto-rate", type=float, default=SyntheticRates.veto)
+    parser.add_argument("--staleness-rate", type=float, default=SyntheticRates.staleness)
+    parser.add_argument("--contradiction-rate", type=float, default=SyntheticRates.contradiction)
+    parser.add_argument("--fx-rate", type=float, default=SyntheticRates.fx_exposure)
+    return parser.parse_args(argv)
+
+
+def main() -> None:
+    args = _parse_args(sys.argv[1:])
+    rates = SyntheticRates(
+        veto=args.veto_rate,
+        staleness=args.staleness_rate,
+        contradiction=args.contradiction_rate,
+        fx_exposure=args.fx_rate,
+    )
+    for path in write_synthetic_fixtures(Path(args.out), sizes=args.sizes, seed=args.seed, rates=rates):
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import itertools
+import json
+from pathlib import Path
+
+import pytest
+
+from src.core.canonicalization import (
+    canonicalization_idempotent,
+    canonicalize_payload,
+    detect_ordering_violations,
+    find_ordering_violations,
+    hash_portfolio_snapshot,
+    packet_hash_session,
+    verify_canonical,
+)
+from src.core.canonicalization.rules import ORDERING_RULES, ordering_state
+from src.core.models import PortfolioSnapshot
+from src.core.orchestration import Orchestrator
+
+
+FIXTURE_PATHS = sorted(Path("fixtures").rglob("*.json"))
+
+
+def _load_fixture(path: str) -> dict:
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    return payload.get("payload", payload)
+
+
+def _assert_matches_reference(payload: object) -> None:
+    verification = verify_canonical(payload)
+    assert verification.canonical == canonicalize_payload(payload)
+    assert verification.ordering_violations == detect_ordering_violations(payload)
+    assert verification.idempotent == canonicalization_idempotent(payload)
+    assert find_ordering_violations(payload) == detect_ordering_violations(payload)
+
+
+@pytest.mark.parametrize("path", FIXTURE_PATHS, ids=lambda path: str(path))
+def test_order_verifier_matches_reference_on_fixtures(path: Path) -> None:
+    _assert_matches_reference(json.loads(path.read_text(encoding="utf-8")))
+
+
+def test_order_verifier_matches_reference_on_unordered_payloads() -> None:
+    snapshot = _load_fixture("fixtures/portfolio/PortfolioSnapshot_N3.json")
+    _assert_matches_reference({**snapshot, "holdings": list(reversed(snapshot["holdings"]))})
+    _assert_matches_reference(
+        {
+            "agent_outputs": [
+                {"agent_name": " b", "key_findings": {"concentration_breaches": [{"breach_type": "z"}, {"breach_type": "a"}]}},
+                {"agent_name": "a "},
+            ],
+            "guard_results": [{"guard_id": "G1"}, "G0"],
+            "nested": [{"penalty_items": ({"category": "x"}, {"category": "x", "reason": "r"})}],
+            "holdings": [{"holding_id": "A", "value": float("nan")}, {"holding_id": "B"}],
+        }
+    )
+
+
+def test_ordering_state_matches_rule_comparison() -> None:
+    items = [
+        {"holding_id": "A", "agent_name": "X", "guard_id": "G1", "category": "c", "sequence_number": 2},
+        {"holding_id": "B", "agent_name": "X", "guard_id": "G0", "category": "a", "sequence_number": 1},
+        {"holding_id": "A", "agent_name": "W", "guard_id": "G1", "category": "b", "sequence_number": 1},
+    ]
+    for key, rule in ORDERING_RULES.items():
+        for permutation in itertools.permutations(items):
+            normalized = list(permutation)
+            ordered = rule(normalized)
+            expected = None if ordered is None else list(ordered) == normalized
+            assert ordering_state(key, normalized) == expected
+    assert ordering_state("veto_logs", [{"sequence_number": None}]) is None
+
+
+def test_verified_snapshot_canonical_form_is_reused_for_hashing() -> None:
+    snapshot = PortfolioSnapshot.model_validate(_load_fixture("fixtures/portfolio/PortfolioSnapshot_N3.json"))
+    session = packet_hash_session()
+
+    verify_canonical(snapshot, session=session)
+
+    assert session.canonical(snapshot) == canonicalize_payload(snapshot)
+    assert hash_portfolio_snapshot(snapshot, session=session) == hash_portfolio_snapshot(snapshot)
+
+
+def test_determinism_guard_passes_on_completed_run(happy_path_inputs) -> None:
+    result = Orchestrator().run(**happy_path_inputs())
+
+    g7 = next(guard for guard in result.guard_results if guard.guard_id == "G7")
+    assert g7.status == "passed"
+    packet = result.portfolio_committee_packet
+    assert packet.snapshot_hash == hash_portfolio_snapshot(
+        PortfolioSnapshot.model_validate(_load_fixture("fixtures/portfolio/PortfolioSnapshot_N3.json"))
+    )
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from src.core.canonicalization import (
+    canonical_json_dumps,
+    canonical_sha256,
+    hash_committee_packet,
+    hash_decision_payload,
+    hash_holding_packet,
+    packet_hash_session,
+    write_canonical_json,
+)
+from src.core.canonicalization import streaming
+from src.core.models import RunOutcome
+from src.core.orchestration import Orchestrator
+
+
+FIXTURE_PATHS = sorted(Path("fixtures").rglob("*.json"))
+
+
+def _streamed(payload: object, chunk_chars: int = 16) -> str:
+    chunks: list[str] = []
+    write_canonical_json(payload, chunks.append, chunk_chars=chunk_chars)
+    return "".join(chunks)
+
+
+def _assert_identical(payload: object) -> None:
+    expected = canonical_json_dumps(payload)
+    assert _streamed(payload) == expected
+    assert canonical_sha256(payload) == hashlib.sha256(expected.encode("utf-8")).hexdigest()
+
+
+@pytest.mark.parametrize("path", FIXTURE_PATHS, ids=lambda path: str(path))
+def test_streaming_encoder_matches_reference_on_fixtures(path: Path) -> None:
+    _assert_identical(json.loads(path.read_text(encoding="utf-8")))
+
+
+def test_streaming_encoder_matches_reference_on_run_outputs(happy_path_inputs) -> None:
+    result = Orchestrator().run(**happy_path_inputs())
+
+    assert result.outcome == RunOutcome.COMPLETED
+    _assert_identical(result.portfolio_committee_packet)
+    _assert_identical({"portfolio_committee_packet": result.portfolio_committee_packet, "holding_packets": result.holding_packets})
+    _assert_identical(result)
+
+
+def test_streaming_encoder_matches_reference_on_edge_cases() -> None:
+    payload = {
+        "agent_name": "  DIO  ",
+        "holding_id": " H-1 ",
+        "nan": float("nan"),
+        "inf": float("-inf"),
+        "floats": [1.0, -0.0, 1e-7, 12345678.9, float("nan")],
+        "decimal": Decimal("1.2300"),
+        "when": datetime(2025, 1, 1, tzinfo=timezone.utc),
+        "outcome": RunOutcome.VETOED,
+        "tuple": (1, "two", None, True),
+        "run_id": "excluded",
+        "notes": ["excluded"],
+        "unicode": "café ✓",
+        "agent_outputs": [{"agent_name": "b "}, "not-a-dict", {"agent_name": " a", "score": 1.5}],
+        "veto_logs": [{"agent_name": "x"}],
+        "guard_results": ({"guard_id": "G2"}, {"guard_id": "G1", "reasons": []}),
+        "nested": {"holdings": [{"holding_id": "B"}, {"identity": {"holding_id": "A"}}], "empty": {}},
+        "1": 1,
+    }
+    _assert_identical(payload)
+
+
+def test_packet_hash_session_encodes_each_packet_once(monkeypatch: pytest.MonkeyPatch, happy_path_inputs) -> None:
+    result = Orchestrator().run(**happy_path_inputs())
+    committee_packet = result.portfolio_committee_packet
+    decision_payload = {"portfolio_committee_packet": committee_packet, "holding_packets": result.holding_packets}
+    expected_committee = hashlib.sha256(canonical_json_dumps(committee_packet).encode("utf-8")).hexdigest()
+    expected_decision = hashlib.sha256(canonical_json_dumps(decision_payload).encode("utf-8")).hexdigest()
+
+    encoded: list[str] = []
+    walk = streaming._model_items
+    canonicalize = streaming._canonicalize_value
+
+    def counting_walk(model):
+        encoded.append(type(model).__name__)
+        return walk(model)
+
+    def counting_canonicalize(value, parent_key):
+        encoded.append(type(value).__name__)
+        return canonicalize(value, parent_key)
+
+    monkeypatch.setattr(streaming, "_model_items", counting_walk)
+    monkeypatch.setattr(streaming, "_canonicalize_value", counting_canonicalize)
+
+    session = packet_hash_session()
+    holding_hashes = [hash_holding_packet(holding, session=session) for holding in result.holding_packets]
+    assert hash_committee_packet(committee_packet, session=session) == expected_committee
+    assert hash_decision_payload(decision_payload, session=session) == expected_decision
+    assert holding_hashes == [
+        hashlib.sha256(canonical_json_dumps(holding).encode("utf-8")).hexdigest() for holding in result.holding_packets
+    ]
+    assert encoded.count("PortfolioCommitteePacket") == 1
+    assert encoded.count("HoldingPacket") == 2 * len(result.holding_packets)
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import copy
+import json
 import os
 import sys
 import warnings
 from pathlib import Path
+from typing import Callable
 
 import pytest
 from pydantic import PydanticDeprecatedSince20
@@ -30,3 +33,31 @@ def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item
     for item in items:
         if item.path.name not in keep:
             item.add_marker(pytest.mark.skip(reason="IMP-01 skeleton only; advanced tests deferred."))
+
+
+def _load_fixture_payload(path: Path) -> dict:
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    return payload.get("payload", payload)
+
+
+@pytest.fixture(scope="session")
+def _happy_path_payload() -> dict:
+    config_snapshot = _load_fixture_payload(ROOT / "fixtures/config/ConfigSnapshot_v1.json")
+    return {
+        "portfolio_snapshot_data": _load_fixture_payload(ROOT / "fixtures/portfolio/PortfolioSnapshot_N3.json"),
+        "portfolio_config_data": _load_fixture_payload(ROOT / "fixtures/portfolio_config.json"),
+        "run_config_data": _load_fixture_payload(ROOT / "fixtures/config/RunConfig_DEEP.json"),
+        "config_snapshot_data": {
+            **config_snapshot,
+            "registries": {
+                **config_snapshot["registries"],
+                **_load_fixture_payload(ROOT / "fixtures/seeded/SeededData_HappyPath.json"),
+            },
+        },
+    }
+
+
+@pytest.fixture
+def happy_path_inputs(_happy_path_payload: dict) -> Callable[[], dict]:
+    """Returns a fresh copy of the N3 happy-path `Orchestrator.run` inputs on every call."""
+    return lambda: copy.deepcopy(_happy_path_payload)
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from src.testing.replay import BundlePaths, FixturePaths, replay_n_times
+from src.core.orchestration.parallel import ExecutionConfig
+from src.testing.replay import BundlePaths, FixturePaths, detect_mismatch, replay_matrix, replay_n_times
 
 
 def test_replay_determinism_tf01() -> None:
@@ -22,3 +23,38 @@ def test_replay_determinism_tf01() -> None:
 
     assert results[0].hashes["decision_hash"] == results[1].hashes["decision_hash"]
     assert results[0].outcomes == results[1].outcomes
+
+
+def test_replay_matrix_matches_serial_replay_across_processes() -> None:
+    fixture_map = {
+        "TF-01": FixturePaths(
+            portfolio_snapshot=Path("fixtures/portfolio/PortfolioSnapshot_N3.json"),
+            portfolio_config=Path("fixtures/portfolio_config.json"),
+            seeded=Path("fixtures/seeded/SeededData_HappyPath.json"),
+            run_config=Path("fixtures/config/RunConfig_DEEP.json"),
+            config_snapshot=Path("fixtures/config/ConfigSnapshot_v1.json"),
+        ),
+        "TF-03": FixturePaths(
+            portfolio_snapshot=Path("fixtures/portfolio/PortfolioSnapshot_N3.json"),
+            portfolio_config=Path("fixtures/portfolio_config.json"),
+            seeded=Path("fixtures/seeded/SeededData_GRRA_DoNotTrade.json"),
+            run_config=Path("fixtures/config/RunConfig_DEEP.json"),
+            config_snapshot=Path("fixtures/config/ConfigSnapshot_v1.json"),
+        ),
+    }
+    serial = {
+        fixture_id: replay_n_times(fixture_id, 3, fixture_paths=paths, bundle_paths=BundlePaths())
+        for fixture_id, paths in fixture_map.items()
+    }
+
+    parallel = replay_matrix(
+        fixture_map,
+        3,
+        bundle_paths=BundlePaths(),
+        execution=ExecutionConfig(max_workers=2, pool="process"),
+    )
+
+    assert parallel == serial
+    for results in parallel.values():
+        assert [result.logs["run_index"] for result in results] == [0, 1, 2]
+        assert detect_mismatch(results[0], results[1:]) is None
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from pathlib import Path
 
@@ -8,7 +9,7 @@ from src.agents.executor import HoldingAgentContext, run_holding_agents
 from src.agents.registry import AgentRegistry, DEFAULT_AGENT_CLASSES
 from src.core.guards.guards_g0_g10 import GuardContext, G5AgentConformanceGuard
 from src.core.models import AgentResult, ConfigSnapshot, PortfolioConfig, PortfolioSnapshot, RunConfig, RunOutcome
-from src.core.orchestration import Orchestrator
+from src.core.orchestration import AsyncOrchestrator, Orchestrator
 from src.core.utils.determinism import stable_sort_holdings
 
 
@@ -234,3 +235,37 @@ def test_agent_ordering_is_deterministic() -> None:
     result_b = Orchestrator().run(**inputs)
 
     assert result_a.portfolio_committee_packet.agent_outputs == result_b.portfolio_committee_packet.agent_outputs
+
+
+def test_async_agents_overlap_within_a_phase():
+    class SlowAnalyticalAgent(BaseAgent):
+        in_flight = 0
+        peak = 0
+
+        @classmethod
+        def supported_scopes(cls) -> set[str]:
+            return {"holding"}
+
+        async def execute_async(self, context: HoldingAgentContext) -> AgentResult:
+            cls = type(self)
+            cls.in_flight += 1
+            cls.peak = max(cls.peak, cls.in_flight)
+            await asyncio.sleep(0.01)
+            cls.in_flight -= 1
+            return self._build_result(
+                status="completed",
+                confidence=0.5,
+                holding_id=context.holding.identity.holding_id,
+            )
+
+    agent_classes = {**DEFAULT_AGENT_CLASSES, "Fundamentals": SlowAnalyticalAgent}
+    registry = AgentRegistry(config_data={"agents": {}, "phases": {}}, agent_classes=agent_classes)
+
+    result = asyncio.run(AsyncOrchestrator(registry=registry, max_concurrency=8).run(**_base_inputs()))
+
+    assert result.outcome == RunOutcome.COMPLETED
+    assert SlowAnalyticalAgent.peak > 1
+    outputs = result.portfolio_committee_packet.agent_outputs
+    assert [item["holding_id"] for item in outputs if item["agent_name"] == "Fundamentals"] == sorted(
+        item["holding_id"] for item in outputs if item["agent_name"] == "Fundamentals"
+    )
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 
+from src.agents.cache import AgentResultCache
 from src.core.config.loader import sha256_digest
+from src.core.logging.timings import TimingRecorder
 from src.core.models import RunOutcome
-from src.core.orchestration import Orchestrator
+from src.core.orchestration import AsyncOrchestrator, ExecutionConfig, Orchestrator
+from src.core.orchestration.workqueue import FileBroker, LocalWorkQueue, serve_file_broker
+from src.testing.synthetic import SyntheticRates, generate_portfolio
 
 
 FIXED_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
@@ -85,3 +91,138 @@ def test_config_hash_mismatch_fails_run():
 
     assert result.outcome == RunOutcome.FAILED
     assert "run_config_hash_mismatch" in result.run_log.reasons
+
+
+def test_parallel_holding_execution_matches_serial_run_hash():
+    serial = Orchestrator(now_func=lambda: FIXED_TIME).run(**_base_inputs())
+    threaded = Orchestrator(
+        now_func=lambda: FIXED_TIME,
+        execution=ExecutionConfig(max_workers=4, pool="thread"),
+    ).run(**_base_inputs())
+    processed = Orchestrator(
+        now_func=lambda: FIXED_TIME,
+        execution=ExecutionConfig(max_workers=2, pool="process"),
+    ).run(**_base_inputs())
+
+    assert serial.outcome == RunOutcome.COMPLETED
+    assert serial.portfolio_committee_packet.run_hash is not None
+    for candidate in (threaded, processed):
+        assert candidate.portfolio_committee_packet.run_hash == serial.portfolio_committee_packet.run_hash
+        assert candidate.portfolio_committee_packet.agent_outputs == serial.portfolio_committee_packet.agent_outputs
+
+
+def test_pipelined_holding_vetoes_match_serial_execution():
+    def _vetoed_inputs():
+        inputs = _base_inputs()
+        fixtures = inputs["config_snapshot_data"]["registries"]["agent_fixtures"]
+        fixtures["DIO"]["holdings"]["HOLDING-001"]["integrity_veto_triggered"] = True
+        fixtures.setdefault("RiskOfficer", {}).setdefault("holdings", {}).setdefault("HOLDING-002", {})[
+            "veto_flags"
+        ] = ["concentration_breach"]
+        return inputs
+
+    serial = Orchestrator(now_func=lambda: FIXED_TIME).run(**_vetoed_inputs())
+    threaded = Orchestrator(
+        now_func=lambda: FIXED_TIME,
+        execution=ExecutionConfig(max_workers=3, pool="thread"),
+    ).run(**_vetoed_inputs())
+
+    serial_agents = {
+        (agent["agent_name"], agent.get("holding_id")) for agent in serial.portfolio_committee_packet.agent_outputs
+    }
+    assert ("LEFO", "HOLDING-001") not in serial_agents
+    assert ("RiskOfficer", "HOLDING-002") in serial_agents
+    assert ("Fundamentals", "HOLDING-002") not in serial_agents
+    assert ("Fundamentals", "HOLDING-003") in serial_agents
+    assert threaded.outcome == serial.outcome
+    assert threaded.portfolio_committee_packet.agent_outputs == serial.portfolio_committee_packet.agent_outputs
+    assert threaded.portfolio_committee_packet.run_hash == serial.portfolio_committee_packet.run_hash
+
+
+def test_async_orchestrator_matches_sync_packets():
+    serial = Orchestrator(now_func=lambda: FIXED_TIME).run(**_base_inputs())
+    concurrent = asyncio.run(
+        AsyncOrchestrator(now_func=lambda: FIXED_TIME, max_concurrency=4).run(**_base_inputs())
+    )
+
+    assert concurrent.outcome == serial.outcome
+    assert concurrent.portfolio_committee_packet == serial.portfolio_committee_packet
+    assert concurrent.holding_packets == serial.holding_packets
+
+
+def test_sharded_execution_matches_single_process_run():
+    rates = SyntheticRates(veto=0.15, staleness=0.3, contradiction=0.2, fx_exposure=0.3)
+    portfolio = generate_portfolio(60, seed=5, rates=rates)
+    run_configs = [
+        {"run_mode": "DEEP", "partial_failure_veto_threshold_pct": 30.0},
+        {"run_mode": "DEEP", "partial_failure_veto_threshold_pct": 30.0, "do_not_trade_flag": True},
+    ]
+
+    for run_config in run_configs:
+        inputs = portfolio.run_inputs(run_config)
+        serial = Orchestrator(now_func=lambda: FIXED_TIME).run(**inputs)
+        sharded = Orchestrator(
+            now_func=lambda: FIXED_TIME,
+            execution=ExecutionConfig(max_workers=3, pool="shard"),
+        ).run(**inputs)
+
+        assert sharded == serial
+
+    inputs = portfolio.run_inputs(run_configs[0])
+    serial = Orchestrator(now_func=lambda: FIXED_TIME).run(**inputs)
+    assert serial.outcome == RunOutcome.COMPLETED
+    assert {packet.holding_run_outcome for packet in serial.holding_packets} > {RunOutcome.COMPLETED}
+    rerun = Orchestrator(
+        now_func=lambda: FIXED_TIME,
+        execution=ExecutionConfig(max_workers=2, pool="shard"),
+    ).run(**inputs, prior=serial)
+    assert rerun == Orchestrator(now_func=lambda: FIXED_TIME).run(**inputs, prior=serial)
+    assert rerun.run_log.reused_holdings
+
+
+def test_work_queue_execution_matches_single_process_run(tmp_path):
+    rates = SyntheticRates(veto=0.15, staleness=0.3, contradiction=0.2, fx_exposure=0.3)
+    inputs = generate_portfolio(40, seed=5, rates=rates).run_inputs(
+        {"run_mode": "DEEP", "partial_failure_veto_threshold_pct": 30.0}
+    )
+    serial = Orchestrator(now_func=lambda: FIXED_TIME).run(**inputs)
+
+    queued = Orchestrator(now_func=lambda: FIXED_TIME, work_queue=LocalWorkQueue()).run(**inputs)
+    assert queued == serial
+
+    broker = FileBroker(tmp_path / "broker")
+    workers = [
+        threading.Thread(target=serve_file_broker, args=(broker,), kwargs={"idle_timeout": 1.0}) for _ in range(2)
+    ]
+    for worker in workers:
+        worker.start()
+    brokered = Orchestrator(now_func=lambda: FIXED_TIME, work_queue=broker).run(**inputs)
+    for worker in workers:
+        worker.join()
+    assert brokered == serial
+
+    # Task IDs are content-derived, so a rerun is served from stored results with no workers.
+    assert Orchestrator(now_func=lambda: FIXED_TIME, work_queue=broker).run(**inputs) == serial
+
+
+
+def test_work_queue_keeps_agent_cache_and_timings_of_a_single_process_run():
+    inputs = generate_portfolio(4, seed=3).run_inputs({"run_mode": "DEEP"})
+
+    def run(work_queue, cache):
+        timings = TimingRecorder()
+        result = Orchestrator(now_func=lambda: FIXED_TIME, cache=cache, work_queue=work_queue).run(
+            **inputs, timings=timings
+        )
+        counts = {kind: len(records) for kind, records in timings.to_dict().items() if kind != "clock"}
+        return result, counts
+
+    serial_cache, queued_cache = AgentResultCache(), AgentResultCache()
+    for _ in range(2):
+        serial, serial_counts = run(None, serial_cache)
+        queued, queued_counts = run(LocalWorkQueue(), queued_cache)
+
+        assert queued.run_log.agent_cache == serial.run_log.agent_cache
+        assert queued_counts == serial_counts
+        assert queued == serial
+    assert queued.run_log.agent_cache["misses"] == 0
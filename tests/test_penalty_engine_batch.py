@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from src.core.models import AgentResult, ConfigSnapshot, PortfolioConfig, RunConfig, RunMode
+from src.core.penalties import (
+    ContradictionRecord,
+    CorporateActionRisk,
+    DIOOutput,
+    FXExposureReport,
+    MissingField,
+    PenaltyInput,
+    StalenessFlag,
+    compute_penalty_breakdowns_batch,
+    gather_penalty_columns,
+)
+from src.core.penalties.penalty_engine import compute_penalty_breakdown_with_cap_tracking
+
+
+SEED_PATHS = [
+    "fixtures/seeded/TF-06_missing_cash_non_burn_rate.json",
+    "fixtures/seeded/TF-07_not_applicable_cash_runway.json",
+    "fixtures/seeded/TF-08_staleness_financials_penalty.json",
+    "fixtures/seeded/TF-10_corporate_action_split.json",
+    "fixtures/seeded/TF-12_penalty_cap_enforcement.json",
+]
+
+
+def _load_payload(path: str) -> dict:
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    return payload.get("payload", payload)
+
+
+def _config_snapshot() -> ConfigSnapshot:
+    return ConfigSnapshot.parse_obj(_load_payload("fixtures/config/ConfigSnapshot_v1.json"))
+
+
+def _portfolio_config() -> PortfolioConfig:
+    return PortfolioConfig.parse_obj(_load_payload("fixtures/portfolio_config.json"))
+
+
+def _assert_batch_matches(inputs: list[PenaltyInput], run_config: RunConfig, agent_results: list[AgentResult]) -> None:
+    columns = gather_penalty_columns(
+        inputs,
+        run_config=run_config,
+        agent_results=agent_results,
+        portfolio_config=_portfolio_config(),
+    )
+    batch = compute_penalty_breakdowns_batch(columns, run_config=run_config)
+
+    assert len(batch) == len(inputs)
+    for holding, (breakdown, cap_applied) in zip(inputs, batch):
+        expected, expected_cap_applied = compute_penalty_breakdown_with_cap_tracking(
+            holding_id=holding.holding_id,
+            run_config=run_config,
+            config_snapshot=_config_snapshot(),
+            dio_output=holding.dio_output,
+            agent_results=agent_results,
+            portfolio_config=_portfolio_config(),
+            pscc_output_optional=holding.fx_report,
+        )
+        assert breakdown.model_dump() == expected.model_dump()
+        assert cap_applied is expected_cap_applied
+
+
+def test_batch_matches_per_holding_engine_on_seeded_fixtures() -> None:
+    inputs = []
+    for path in SEED_PATHS:
+        seed = _load_payload(path)
+        inputs.append(PenaltyInput(holding_id=seed["holding_id"], dio_output=DIOOutput.parse_obj(seed["dio_output"])))
+    run_config = RunConfig.parse_obj(_load_payload("fixtures/config/RunConfig_DEEP.json"))
+
+    _assert_batch_matches(inputs, run_config, [])
+    _assert_batch_matches([], run_config, [])
+
+
+def _random_dio_output(rng: random.Random) -> DIOOutput:
+    field_names = ["cash", "burn_rate", "market_cap", "fully_diluted_shares", "adv_usd", "price", "vix", "other"]
+    staleness_types = ["financials", "price_volume", "company_updates", "macro_regime", "unknown"]
+    return DIOOutput(
+        staleness_flags=[
+            StalenessFlag(
+                staleness_type=rng.choice(staleness_types),
+                age_days=rng.choice([0.5, 2.0, 10.0, 65.0, 100.0, 150.0]),
+                hard_stop_triggered=rng.random() < 0.03,
+            )
+            for _ in range(rng.randint(0, 4))
+        ],
+        missing_penalty_critical_fields=[
+            MissingField(field_name=rng.choice(field_names), not_applicable=rng.random() < 0.2)
+            for _ in range(rng.randint(0, 5))
+        ],
+        contradictions=[ContradictionRecord(unresolved=rng.random() < 0.5) for _ in range(rng.randint(0, 2))],
+        unsourced_numbers_detected=rng.random() < 0.3,
+        corporate_action_risk=CorporateActionRisk(
+            split_days_ago=rng.choice([None, 30, 120]),
+            dividend_days_ago=rng.choice([None, 10, 200]),
+            spinoff_or_merger_days_ago=rng.choice([None, 90, 365]),
+        ),
+        low_source_reliability=rng.random() < 0.3,
+        integrity_veto_triggered=rng.random() < 0.03,
+    )
+
+
+@pytest.mark.parametrize(
+    "run_config",
+    [
+        RunConfig(run_mode=RunMode.DEEP),
+        RunConfig(run_mode=RunMode.FAST, burn_rate_classification={"H3": True, "H7": True}),
+        RunConfig(
+            run_mode=RunMode.DEEP,
+            staleness_thresholds={"DEEP": {"stale_financials": 60.0, "stale_price_volume": 5.0}},
+            penalty_caps={"A": -8.0, "C": -12.0, "total": -18.5},
+        ),
+    ],
+    ids=["deep", "fast_burn_rate", "overrides"],
+)
+def test_batch_matches_per_holding_engine_on_random_holdings(run_config: RunConfig) -> None:
+    rng = random.Random(11)
+    inputs = []
+    agent_results = []
+    for index in range(200):
+        holding_id = f"H{index}"
+        fx_report = None
+        if rng.random() < 0.5:
+            fx_report = FXExposureReport(
+                holding_currency=rng.choice(["USD", "EUR"]),
+                fx_rate_missing=rng.random() < 0.5,
+                fx_rate_stale=rng.random() < 0.5,
+                fx_exposure_pct=rng.choice([None, 0.1, 0.5]),
+                hedge_data_missing=rng.random() < 0.5,
+            )
+        for agent_name in ("Fundamentals", "Technical", "DevilsAdvocate"):
+            agent_results.append(
+                AgentResult(
+                    agent_name=agent_name,
+                    scope="holding",
+                    holding_id=holding_id,
+                    status="completed",
+                    confidence=rng.choice([0.2, 0.9]),
+                    key_findings={"unresolved_fatal_risk": rng.random() < 0.2},
+                )
+            )
+        inputs.append(PenaltyInput(holding_id=holding_id, dio_output=_random_dio_output(rng), fx_report=fx_report))
+
+    _assert_batch_matches(inputs, run_config, agent_results)
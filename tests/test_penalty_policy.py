@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import pytest
+
+from src.core.models import RunConfig, RunMode
+from src.core.penalties import PenaltyPolicy
+
+
+def test_compile_resolves_overrides_and_fast_exclusions() -> None:
+    policy = PenaltyPolicy.compile(
+        RunConfig(
+            run_mode=RunMode.FAST,
+            staleness_thresholds={"FAST": {"stale_financials": 30.0}},
+            penalty_caps={"A": -8.0, "total": -18.5},
+        )
+    )
+
+    assert policy.staleness_limits["stale_financials"] == 30.0
+    assert policy.staleness_limits["stale_price_volume"] == 3.0
+    assert policy.category_caps["A"] == -8.0
+    assert policy.category_caps["B"] == -10.0
+    assert policy.total_cap == -18.5
+    assert "recent_dividend_or_distribution" in policy.excluded_reasons
+    assert "recent_split_or_reverse_split" not in policy.excluded_reasons
+    assert policy.is_stale("stale_financials", 31.0)
+    assert not policy.is_stale("stale_financials", 30.0)
+    with pytest.raises(TypeError):
+        policy.category_caps["A"] = 0.0  # type: ignore[index]
+
+
+def test_apply_caps_drops_smallest_reasons_in_drop_order() -> None:
+    policy = PenaltyPolicy.compile(RunConfig(run_mode=RunMode.DEEP))
+
+    kept, cap_applied = policy.apply_caps(
+        [
+            "missing_cash_or_runway",
+            "missing_shares_or_market_cap",
+            "missing_fully_diluted_shares",
+            "missing_liquidity_measure",
+            "missing_price_or_volume",
+            "missing_cash_or_runway",
+        ]
+    )
+
+    # Category A sums to -24 against a -20 cap; drops start with the -4 reasons, reason descending.
+    assert kept == [
+        "missing_cash_or_runway",
+        "missing_shares_or_market_cap",
+        "missing_fully_diluted_shares",
+        "missing_liquidity_measure",
+    ]
+    assert cap_applied is True
+    assert policy.apply_caps(["stale_financials"]) == (["stale_financials"], False)
+
+
+def test_total_cap_drops_later_categories_first() -> None:
+    policy = PenaltyPolicy.from_tables(
+        staleness_limits={},
+        category_caps={"A": -20.0, "F": -10.0},
+        total_cap=-8.0,
+    )
+
+    kept, cap_applied = policy.apply_caps(["missing_liquidity_measure", "low_source_reliability"])
+
+    assert kept == ["missing_liquidity_measure"]
+    assert cap_applied is True
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import pytest
+
+from src.aggregation import sweep_run_penalties
+from src.core.models import ConfigSnapshot, PortfolioConfig, RunConfig, RunOutcome
+from src.core.orchestration import Orchestrator
+
+
+SCENARIOS = {
+    "baseline": {},
+    "tight_staleness": {"staleness_thresholds": {"stale_financials": 30.0, "stale_price_volume": 0.5}},
+    "tight_caps": {"penalty_caps": {"A": -5.0, "total": -8.0}},
+    "loose": {"staleness_thresholds": {"stale_financials": 365.0}, "penalty_caps": {"total": -100.0}},
+}
+
+
+def _inputs(happy_path_inputs: Callable[[], dict]) -> dict:
+    inputs = happy_path_inputs()
+    dio = inputs["config_snapshot_data"]["registries"]["agent_fixtures"]["DIO"]["holdings"]
+    dio["HOLDING-001"]["staleness_flags"] = [
+        {"staleness_type": "financials", "age_days": 45.0, "hard_stop_triggered": False},
+        {"staleness_type": "price_volume", "age_days": 2.0, "hard_stop_triggered": False},
+    ]
+    dio["HOLDING-001"]["missing_penalty_critical_fields"] = [{"field_name": "market_cap"}, {"field_name": "price"}]
+    dio["HOLDING-002"]["staleness_flags"] = [
+        {"staleness_type": "financials", "age_days": 120.0, "hard_stop_triggered": False},
+    ]
+    dio["HOLDING-002"]["missing_penalty_critical_fields"] = [{"field_name": "cash"}, {"field_name": "adv_usd"}]
+    dio["HOLDING-002"]["contradictions"] = [{"unresolved": True}]
+    dio["HOLDING-003"]["low_source_reliability"] = True
+    run_config = inputs["run_config_data"]
+    run_config.setdefault("burn_rate_classification", {})
+    run_config.setdefault("penalty_caps", {})
+    run_config.setdefault("staleness_thresholds", {})
+    return inputs
+
+
+def test_sweep_matches_orchestrator_run_per_scenario(happy_path_inputs) -> None:
+    inputs = _inputs(happy_path_inputs)
+    result = Orchestrator().run(**inputs)
+    assert result.outcome == RunOutcome.COMPLETED
+
+    sweep = sweep_run_penalties(
+        result,
+        run_config=RunConfig.model_validate(inputs["run_config_data"]),
+        config_snapshot=ConfigSnapshot.model_validate(inputs["config_snapshot_data"]),
+        portfolio_config=PortfolioConfig.model_validate(inputs["portfolio_config_data"]),
+        scenarios=SCENARIOS,
+    )
+
+    assert sweep.final_scores.shape == (len(SCENARIOS), 3)
+    assert len(set(sweep.total_penalties.sum(axis=1).tolist())) > 1
+    for scenario_id, overrides in SCENARIOS.items():
+        run_config = dict(inputs["run_config_data"])
+        for field, value in overrides.items():
+            run_config[field] = {**run_config[field], **value}
+        expected = Orchestrator().run(**{**inputs, "run_config_data": run_config})
+        for packet in expected.holding_packets:
+            scorecard = packet.scorecard
+            breakdown = sweep.breakdown(scenario_id, packet.holding_id)
+            assert breakdown.model_dump() == scorecard.penalty_breakdown.model_dump()
+            assert sweep.final_score(scenario_id, packet.holding_id) == scorecard.final_score
+            cell = (sweep.scenario_ids.index(scenario_id), sweep.holding_ids.index(packet.holding_id))
+            assert bool(sweep.cap_applied[cell]) is ("penalty_cap_applied" in scorecard.notes)
+
+    matrix = sweep.to_dict()
+    assert matrix["scenarios"] == list(SCENARIOS)
+    assert matrix["holdings"] == ["HOLDING-001", "HOLDING-002", "HOLDING-003"]
+
+
+def test_sweep_rejects_non_penalty_overrides(happy_path_inputs) -> None:
+    inputs = _inputs(happy_path_inputs)
+    result = Orchestrator().run(**inputs)
+
+    with pytest.raises(ValueError):
+        sweep_run_penalties(
+            result,
+            run_config=RunConfig.model_validate(inputs["run_config_data"]),
+            config_snapshot=ConfigSnapshot.model_validate(inputs["config_snapshot_data"]),
+            portfolio_config=PortfolioConfig.model_validate(inputs["portfolio_config_data"]),
+            scenarios={"mode": {"run_mode": "FAST"}},
+        )
+
+
+def test_sweep_merges_flat_overrides_into_per_mode_thresholds(happy_path_inputs) -> None:
+    inputs = _inputs(happy_path_inputs)
+    inputs["run_config_data"]["staleness_thresholds"] = {"DEEP": {"stale_financials": 365.0}}
+    result = Orchestrator().run(**inputs)
+
+    sweep = sweep_run_penalties(
+        result,
+        run_config=RunConfig.model_validate(inputs["run_config_data"]),
+        config_snapshot=ConfigSnapshot.model_validate(inputs["config_snapshot_data"]),
+        portfolio_config=PortfolioConfig.model_validate(inputs["portfolio_config_data"]),
+        scenarios={"base": {}, "tight": {"staleness_thresholds": {"stale_financials": 30.0}}},
+    )
+
+    tight_config = {
+        **inputs["run_config_data"],
+        "staleness_thresholds": {"DEEP": {"stale_financials": 30.0}},
+    }
+    expected = Orchestrator().run(**{**inputs, "run_config_data": tight_config})
+    for packet in expected.holding_packets:
+        breakdown = sweep.breakdown("tight", packet.holding_id)
+        assert breakdown.model_dump() == packet.scorecard.penalty_breakdown.model_dump()
+    assert sweep.total_penalties[1].sum() < sweep.total_penalties[0].sum()
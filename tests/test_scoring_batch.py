@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+from src.aggregation import compile_rubric, compute_base_score, compute_base_scores
+from src.core.models import HoldingIdentity, HoldingInput, MetricValue
+
+
+METRIC_KEYS = ["roic", "growth", "leverage", "momentum", "quality"]
+
+
+def _random_rubric(rng: random.Random) -> dict:
+    dimensions = []
+    for metric_key in rng.sample(METRIC_KEYS, rng.randint(1, len(METRIC_KEYS))):
+        dimension = {
+            "metric_key": metric_key,
+            "weight": rng.choice([0.0, 7.5, 12.3, 20.0, 33.3, 40.0]),
+            "higher_is_better": rng.random() < 0.7,
+            "missing_policy": rng.choice(["require", "omit"]),
+        }
+        if rng.random() < 0.7:
+            lower = rng.choice([-1.0, 0.0, 0.1])
+            dimension["scale_min"] = lower
+            dimension["scale_max"] = lower if rng.random() < 0.05 else lower + rng.choice([0.3, 1.0, 2.7])
+        dimensions.append(dimension)
+    return {"dimensions": dimensions}
+
+
+def _random_holding(rng: random.Random, index: int) -> HoldingInput:
+    metrics = {}
+    for metric_key in METRIC_KEYS:
+        roll = rng.random()
+        if roll < 0.1:
+            continue
+        if roll < 0.15:
+            metrics[metric_key] = MetricValue(not_applicable=True)
+        elif roll < 0.2:
+            metrics[metric_key] = MetricValue(missing_reason="not_reported")
+        else:
+            metrics[metric_key] = MetricValue(value=rng.uniform(-1.5, 3.5))
+    return HoldingInput(
+        identity=HoldingIdentity(holding_id=f"H{index}", ticker=f"T{index}"),
+        weight=0.01,
+        metrics=metrics,
+    )
+
+
+def _same(left, right) -> bool:
+    if left is None or right is None:
+        return left is right
+    return math.copysign(1.0, left) == math.copysign(1.0, right) and left.hex() == right.hex()
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_batch_scores_are_bit_identical_to_scalar(seed: int) -> None:
+    rng = random.Random(seed)
+    rubric = _random_rubric(rng)
+    holdings = [_random_holding(rng, index) for index in range(60)]
+
+    batch = compute_base_scores(holdings, compile_rubric(rubric), [])
+
+    for holding, score in zip(holdings, batch):
+        assert _same(score, compute_base_score(holding, rubric, []))
+
+
+def test_incomplete_or_empty_rubric_scores_none() -> None:
+    holding = _random_holding(random.Random(0), 0)
+
+    assert compile_rubric(None) is None
+    assert compile_rubric({"dimensions": []}) is None
+    assert compute_base_scores([holding], compile_rubric({"dimensions": [{"weight": 10.0}]}), []) == [None]
+    assert compute_base_scores([holding], None, []) == [None]
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from src.agents.cache import AgentResultCache
+from src.agents.registry import DEFAULT_AGENT_CLASSES, AgentRegistry
+from src.agents.technical import TechnicalAgent
+from src.core.models import RunOutcome
+from src.core.orchestration import Orchestrator
+
+
+def test_cached_rerun_skips_agents_and_keeps_run_hash(happy_path_inputs) -> None:
+    cache = AgentResultCache()
+    baseline = Orchestrator().run(**happy_path_inputs())
+    first = Orchestrator(cache=cache).run(**happy_path_inputs())
+    second = Orchestrator(cache=cache).run(**happy_path_inputs())
+
+    agent_count = len(baseline.portfolio_committee_packet.agent_outputs)
+    assert first.run_log.agent_cache == {"hits": 0, "misses": agent_count}
+    assert second.run_log.agent_cache == {"hits": agent_count, "misses": 0}
+    assert baseline.run_log.agent_cache is None
+    assert first.portfolio_committee_packet.run_hash == baseline.portfolio_committee_packet.run_hash
+    assert second.portfolio_committee_packet.run_hash == baseline.portfolio_committee_packet.run_hash
+
+
+def test_sqlite_tier_survives_a_new_cache_instance(tmp_path: Path, happy_path_inputs) -> None:
+    path = tmp_path / "agent_cache.sqlite"
+    first_cache = AgentResultCache(path=path)
+    first = Orchestrator(cache=first_cache).run(**happy_path_inputs())
+    first_cache.close()
+
+    second = Orchestrator(cache=AgentResultCache(path=path)).run(**happy_path_inputs())
+
+    assert second.run_log.agent_cache["misses"] == 0
+    assert second.portfolio_committee_packet.run_hash == first.portfolio_committee_packet.run_hash
+
+
+def test_failed_agent_results_are_not_cached(happy_path_inputs) -> None:
+    class FailingTechnicalAgent(TechnicalAgent):
+        def execute(self, context):
+            raise RuntimeError("backend_unavailable")
+
+    registry = AgentRegistry(
+        config_data={"agents": {}, "phases": {}},
+        agent_classes={**DEFAULT_AGENT_CLASSES, "Technical": FailingTechnicalAgent},
+    )
+    cache = AgentResultCache()
+    Orchestrator(registry=registry, cache=cache).run(**happy_path_inputs())
+    repeat = Orchestrator(registry=registry, cache=cache).run(**happy_path_inputs())
+
+    holding_count = len(happy_path_inputs()["portfolio_snapshot_data"]["holdings"])
+    assert repeat.run_log.agent_cache["misses"] == holding_count
+    technical = [
+        item for item in repeat.portfolio_committee_packet.agent_outputs if item["agent_name"] == "Technical"
+    ]
+    assert technical and all(item["status"] == "failed" for item in technical)
+
+
+def test_changed_inputs_miss_the_cache(happy_path_inputs) -> None:
+    cache = AgentResultCache()
+    Orchestrator(cache=cache).run(**happy_path_inputs())
+    changed = happy_path_inputs()
+    changed["portfolio_snapshot_data"]["holdings"][0]["identity"]["ticker"] = "CHANGED"
+
+    result = Orchestrator(cache=cache).run(**changed)
+
+    assert result.outcome == RunOutcome.COMPLETED
+    assert 0 < result.run_log.agent_cache["misses"] < len(result.portfolio_committee_packet.agent_outputs)
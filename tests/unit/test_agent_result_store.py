@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import pickle
+
+from src.core.models import AgentResult, AgentResultStore, RunOutcome, attach_typed_output, typed_output
+from src.core.orchestration import Orchestrator
+from src.core.penalties import DIOOutput
+
+
+def _result(agent_name: str, scope: str, holding_id: str | None = None, confidence: float = 0.9) -> AgentResult:
+    return AgentResult(
+        agent_name=agent_name,
+        scope=scope,
+        status="completed",
+        confidence=confidence,
+        holding_id=holding_id,
+    )
+
+
+def test_store_indexes_by_agent_scope_and_holding() -> None:
+    store = AgentResultStore(
+        [
+            _result("PSCC", "portfolio"),
+            _result("DIO", "holding", "HOLDING-002"),
+            _result("DIO", "holding", "HOLDING-001"),
+            _result("Technical", "holding", "HOLDING-001", confidence=0.2),
+        ]
+    )
+    store.add(_result("DIO", "portfolio"))
+
+    assert len(store) == 5
+    assert store.get("DIO", "holding", "HOLDING-001").holding_id == "HOLDING-001"
+    assert store.get("DIO", "holding", "HOLDING-003") is None
+    assert store.get("PSCC", "portfolio").agent_name == "PSCC"
+    assert [item.holding_id for item in store.for_agent("DIO", "holding")] == ["HOLDING-002", "HOLDING-001"]
+    assert [item.agent_name for item in store.for_holding("HOLDING-001")] == ["DIO", "Technical"]
+    assert [(item.agent_name, item.scope, item.holding_id) for item in store.sorted_results()] == [
+        ("DIO", "holding", "HOLDING-001"),
+        ("DIO", "holding", "HOLDING-002"),
+        ("DIO", "portfolio", None),
+        ("PSCC", "portfolio", None),
+        ("Technical", "holding", "HOLDING-001"),
+    ]
+
+
+def test_store_coerce_reuses_existing_store_and_keeps_sequence_order() -> None:
+    results = [_result("GRRA", "portfolio"), _result("DIO", "portfolio")]
+    store = AgentResultStore.coerce(results)
+
+    assert AgentResultStore.coerce(store) is store
+    assert list(store) == results
+    assert store == results
+    assert store[0].agent_name == "GRRA"
+
+
+def test_typed_outputs_are_parsed_once_per_result() -> None:
+    calls = []
+
+    def _parser(result: AgentResult) -> str:
+        calls.append(result.agent_name)
+        return result.agent_name.lower()
+
+    first = _result("DIO", "holding", "HOLDING-001")
+    second = _result("DIO", "holding", "HOLDING-002")
+
+    assert typed_output(first, _parser) == "dio"
+    assert typed_output(first, _parser) == "dio"
+    attach_typed_output(second, _parser, "attached")
+    assert typed_output(second, _parser) == "attached"
+    assert calls == ["DIO"]
+
+
+def _holding_id_parser(result: AgentResult) -> str:
+    return f"parsed:{result.holding_id}"
+
+
+def test_typed_outputs_live_on_the_result_and_drop_on_change() -> None:
+    result = _result("DIO", "holding", "HOLDING-001")
+    attach_typed_output(result, _holding_id_parser, "attached")
+
+    assert result == _result("DIO", "holding", "HOLDING-001")
+    assert typed_output(pickle.loads(pickle.dumps(result)), _holding_id_parser) == "attached"
+    assert typed_output(result.model_copy(update={"holding_id": "HOLDING-002"}), _holding_id_parser) == (
+        "parsed:HOLDING-002"
+    )
+    assert typed_output(result.model_copy(deep=True), _holding_id_parser) == "parsed:HOLDING-001"
+    result.holding_id = "HOLDING-003"
+    assert typed_output(result, _holding_id_parser) == "parsed:HOLDING-003"
+
+
+def test_dio_output_is_validated_once_per_agent_result(monkeypatch, happy_path_inputs) -> None:
+    inputs = happy_path_inputs()
+    original = DIOOutput.parse_obj.__func__
+    calls = []
+
+    def _counting_parse(cls, payload):
+        calls.append(payload)
+        return original(cls, payload)
+
+    monkeypatch.setattr(DIOOutput, "parse_obj", classmethod(_counting_parse))
+
+    result = Orchestrator().run(**inputs)
+
+    dio_outputs = [item for item in result.portfolio_committee_packet.agent_outputs if item["agent_name"] == "DIO"]
+    assert result.outcome == RunOutcome.COMPLETED
+    assert len(calls) == len(dio_outputs)
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from collections import Counter
+from pathlib import Path
+from typing import Callable
+
+from src.agents.registry import DEFAULT_AGENT_CLASSES, AgentRegistry
+from src.core.orchestration import Orchestrator
+from src.core.utils.determinism import stable_json_dumps
+
+
+def _changed_inputs(happy_path_inputs: Callable[[], dict]) -> dict:
+    inputs = happy_path_inputs()
+    inputs["portfolio_snapshot_data"]["holdings"][0]["currency"] = "EUR"
+    return inputs
+
+
+def _counting_registry(calls: Counter) -> AgentRegistry:
+    def counting(agent_class):
+        def execute(self, context):
+            calls[(self.agent_name, self.scope)] += 1
+            return agent_class.execute(self, context)
+
+        return type(agent_class.__name__, (agent_class,), {"execute": execute})
+
+    return AgentRegistry(
+        config_data={"agents": {}, "phases": {}},
+        agent_classes={name: counting(agent_class) for name, agent_class in DEFAULT_AGENT_CLASSES.items()},
+    )
+
+
+def test_incremental_run_matches_full_run_and_skips_unchanged_holdings(happy_path_inputs) -> None:
+    prior = Orchestrator().run(**happy_path_inputs())
+    full = Orchestrator().run(**_changed_inputs(happy_path_inputs))
+
+    calls: Counter = Counter()
+    incremental = Orchestrator(registry=_counting_registry(calls)).run(
+        **_changed_inputs(happy_path_inputs), prior=prior
+    )
+
+    assert incremental.portfolio_committee_packet.run_hash == full.portfolio_committee_packet.run_hash
+    assert incremental.run_log.reused_holdings == ["HOLDING-002", "HOLDING-003"]
+    assert calls[("DIO", "portfolio")] == 1
+    assert calls[("GRRA", "portfolio")] == 1
+    assert calls[("PSCC", "portfolio")] == 1
+    assert calls[("DIO", "holding")] == 1
+    assert calls[("Fundamentals", "holding")] == 1
+
+
+def test_prior_artifact_directory_is_accepted(tmp_path: Path, happy_path_inputs) -> None:
+    prior = Orchestrator().run(**happy_path_inputs())
+    (tmp_path / "runlog.json").write_text(stable_json_dumps(prior.run_log.model_dump(mode="json")), encoding="utf-8")
+    (tmp_path / "output_packet.json").write_text(
+        stable_json_dumps(prior.packet.model_dump(mode="json")),
+        encoding="utf-8",
+    )
+
+    incremental = Orchestrator().run(**_changed_inputs(happy_path_inputs), prior=tmp_path)
+    full = Orchestrator().run(**_changed_inputs(happy_path_inputs))
+
+    assert incremental.run_log.reused_holdings == ["HOLDING-002", "HOLDING-003"]
+    assert incremental.portfolio_committee_packet.run_hash == full.portfolio_committee_packet.run_hash
+
+
+def test_config_change_disables_reuse(happy_path_inputs) -> None:
+    prior = Orchestrator().run(**happy_path_inputs())
+    changed = happy_path_inputs()
+    changed["run_config_data"] = {**changed["run_config_data"], "run_mode": "FAST"}
+
+    calls: Counter = Counter()
+    Orchestrator(registry=_counting_registry(calls)).run(**changed, prior=prior)
+    baseline: Counter = Counter()
+    Orchestrator(registry=_counting_registry(baseline)).run(**changed)
+
+    assert calls == baseline
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import json
+import shutil
 from pathlib import Path
 
 import pytest
 
+from src.release.phase1 import _fixture_matrix, _run_phase0, _run_replays, _run_scale_check
 from src.testing.replay import BundlePaths, FixturePaths, run_fixture
+from src.testing.scale import run_scale_benchmark
 
 
 def test_run_fixture_requires_config_paths(tmp_path: Path) -> None:
@@ -16,3 +20,88 @@ def test_run_fixture_requires_config_paths(tmp_path: Path) -> None:
 
     with pytest.raises(ValueError, match="RunConfig and ConfigSnapshot"):
         run_fixture(fixture_paths, BundlePaths())
+
+
+def test_scale_check_fails_on_outcome_drift(tmp_path: Path) -> None:
+    baseline = run_scale_benchmark(sizes=[10], seed=2, trace_memory=False)
+    baseline["sizes"]["10"]["median_wall_ms"] = 1e9
+    baseline_path = tmp_path / "scale_baseline.json"
+    baseline_path.write_text(json.dumps(baseline), encoding="utf-8")
+    checks: list = []
+    failures: list = []
+
+    assert _run_scale_check(baseline_path, out_dir=tmp_path, max_regression=0.25, checks=checks, failures=failures)
+    assert checks[-1].status == "PASS"
+
+    baseline["sizes"]["10"]["counts_by_outcome"] = {"COMPLETED": 9, "VETOED": 1}
+    baseline_path.write_text(json.dumps(baseline), encoding="utf-8")
+
+    assert not _run_scale_check(baseline_path, out_dir=tmp_path, max_regression=0.25, checks=checks, failures=failures)
+    assert checks[-1].status == "FAIL"
+    assert failures[-1].check == "scale_benchmark"
+    assert (tmp_path / "scale_benchmark.json").exists()
+
+
+REPO_FIXTURES = Path(__file__).resolve().parents[2] / "fixtures"
+PHASE0_INVALID_FIXTURES = (
+    "portfolio/PortfolioSnapshot_IMAGE_001.json",
+    "portfolio/PortfolioSnapshot_TF15_invalid.json",
+    "expected/TF-06_expected_penalty_breakdown.json",
+    "expected/TF-07_expected_penalty_breakdown.json",
+    "expected/TF-08_expected_penalty_breakdown.json",
+    "expected/TF-10_expected_penalty_breakdown.json",
+    "expected/TF-12_expected_penalty_breakdown.json",
+    "expected/TF-15_expected_failed_packet.json",
+)
+
+
+def test_phase0_readiness_is_cached_until_an_input_changes(tmp_path: Path) -> None:
+    fixtures_dir = tmp_path / "fixtures"
+    shutil.copytree(REPO_FIXTURES, fixtures_dir)
+    for relative in PHASE0_INVALID_FIXTURES:
+        (fixtures_dir / relative).unlink()
+    options = {
+        "release_id": "phase1_test",
+        "bundle_dir": Path("config/release_bundle"),
+        "fixtures_dir": fixtures_dir,
+        "phase0_out_dir": tmp_path / "phase0",
+    }
+
+    errors, manifest_path, cached = _run_phase0(**options)
+    assert (errors, cached) == ([], False)
+    assert _run_phase0(**options) == ([], manifest_path, True)
+
+    (fixtures_dir / "config" / "Unexpected.json").write_text("{}", encoding="utf-8")
+    errors, _, cached = _run_phase0(**options)
+    assert errors and not cached
+    assert not (tmp_path / "phase0" / "phase0_cache.json").exists()
+
+
+def test_incremental_replay_skips_fixtures_with_matching_input_digest(tmp_path: Path) -> None:
+    fixture_map = {"TF-01": _fixture_matrix(REPO_FIXTURES)["TF-01"]}
+    replay_dir = tmp_path / "replay_logs"
+    hash_dir = tmp_path / "hash_baselines"
+    replay_dir.mkdir()
+    hash_dir.mkdir()
+
+    def replay(runs: int) -> tuple:
+        hashes: list = []
+        passed, skipped = _run_replays(
+            fixture_map,
+            runs=runs,
+            workers=1,
+            incremental=True,
+            replay_dir=replay_dir,
+            hash_dir=hash_dir,
+            hashes_report=hashes,
+            failures=[],
+        )
+        return passed, skipped, hashes
+
+    first = replay(2)
+    assert first[:2] == (True, [])
+    replay_log = (replay_dir / "TF-01.json").read_bytes()
+
+    assert replay(2) == (True, ["TF-01"], first[2])
+    assert (replay_dir / "TF-01.json").read_bytes() == replay_log
+    assert replay(3)[1] == []
@@ -4,6 +4,7 @@ import json
 from pathlib import Path
 
 from src.cli import run_prod
+from src.core.logging.run_store import RunStore
 
 
 def test_run_prod_writes_artifacts(tmp_path: Path) -> None:
@@ -22,6 +23,9 @@ def test_run_prod_writes_artifacts(tmp_path: Path) -> None:
     if summary.get("outcome") != "FAILED":
         assert (out_dir / "output_packet.json").exists()
 
+    timings = json.loads((out_dir / "timings.json").read_text(encoding="utf-8"))
+    assert timings["stages"][0]["name"] == "load_portfolio"
+
 
 def test_run_prod_writes_failure_report_on_exception(tmp_path: Path) -> None:
     bad_portfolio = tmp_path / "bad_portfolio.json"
@@ -34,3 +38,96 @@ def test_run_prod_writes_failure_report_on_exception(tmp_path: Path) -> None:
     assert (out_dir / "summary.json").exists()
     assert (out_dir / "runlog.json").exists()
     assert (out_dir / "failure_report.md").exists()
+
+
+def test_run_prod_batch_writes_per_portfolio_artifacts(tmp_path: Path) -> None:
+    repo_root = Path(__file__).resolve().parents[2]
+    example = (repo_root / "fixtures" / "portfolio_snapshot_prod_example.json").read_text(encoding="utf-8")
+    portfolio_dir = tmp_path / "portfolios"
+    portfolio_dir.mkdir()
+    (portfolio_dir / "client_a.json").write_text(example, encoding="utf-8")
+    (portfolio_dir / "client_b.json").write_text(example, encoding="utf-8")
+    (portfolio_dir / "client_c.json").write_text("{not valid json", encoding="utf-8")
+    out_dir = tmp_path / "batch"
+
+    success = run_prod.run_prod_batch(
+        portfolio_paths=run_prod.resolve_portfolio_paths(str(portfolio_dir)),
+        out_dir=out_dir,
+        portfolio_workers=2,
+    )
+    single_dir = tmp_path / "single"
+    run_prod.run_prod(portfolio_path=portfolio_dir / "client_a.json", out_dir=single_dir)
+
+    assert not success
+    summary = json.loads((out_dir / "batch_summary.json").read_text(encoding="utf-8"))
+    assert [entry["portfolio"] for entry in summary["portfolios"]] == ["client_a", "client_b", "client_c"]
+    assert summary["failed_portfolios"] == ["client_c"]
+    assert summary["portfolios"][2]["outcome"] == "FAILED"
+    assert (out_dir / "client_c" / "failure_report.md").exists()
+    for name in ("client_a", "client_b"):
+        for artifact in ("summary.json", "runlog.json"):
+            assert (out_dir / name / artifact).read_bytes() == (single_dir / artifact).read_bytes()
+    assert run_prod.resolve_portfolio_paths(str(portfolio_dir / "client_[ab].json")) == [
+        portfolio_dir / "client_a.json",
+        portfolio_dir / "client_b.json",
+    ]
+
+
+def test_run_prod_records_runs_in_the_run_store(tmp_path: Path) -> None:
+    repo_root = Path(__file__).resolve().parents[2]
+    example = (repo_root / "fixtures" / "portfolio_snapshot_prod_example.json").read_text(encoding="utf-8")
+    portfolio_dir = tmp_path / "portfolios"
+    portfolio_dir.mkdir()
+    (portfolio_dir / "client_a.json").write_text(example, encoding="utf-8")
+    (portfolio_dir / "client_b.json").write_text("{not valid json", encoding="utf-8")
+    store = RunStore(tmp_path / "runs.sqlite")
+
+    run_prod.run_prod(portfolio_path=portfolio_dir / "client_a.json", out_dir=tmp_path / "single", run_store=store)
+    run_prod.run_prod_batch(
+        portfolio_paths=run_prod.resolve_portfolio_paths(str(portfolio_dir)),
+        out_dir=tmp_path / "batch",
+        run_store=store,
+    )
+
+    packet = json.loads((tmp_path / "single" / "output_packet.json").read_text(encoding="utf-8"))
+    completed = store.find_runs(portfolio_id=packet["portfolio_id"], outcome="COMPLETED")
+    assert [run.artifact_dir for run in completed] == [str(tmp_path / "batch" / "client_a"), str(tmp_path / "single")]
+    assert completed[0].hashes["run_hash"] == packet["run_hash"]
+    assert store.has_run_hash(packet["run_hash"])
+    assert [run.artifact_dir for run in store.find_runs(outcome="FAILED")] == [str(tmp_path / "batch" / "client_b")]
+
+    holdings = store.holdings_for_run(completed[0].run_key)
+    assert {holding.holding_id: holding.outcome for holding in holdings} == packet["per_holding_outcomes"]
+    assert holdings[0].scorecard == packet["holdings"][0]["scorecard"]
+
+
+class _FailingRunStore:
+    def record(self, files, *, artifact_dir=None):
+        raise RuntimeError("database is locked")
+
+    def import_artifact_dirs(self, artifact_dirs):
+        raise RuntimeError("database is locked")
+
+
+def test_run_store_failure_keeps_artifacts_and_reports_it(tmp_path: Path) -> None:
+    repo_root = Path(__file__).resolve().parents[2]
+    portfolio_path = repo_root / "fixtures" / "portfolio_snapshot_prod_example.json"
+    out_dir = tmp_path / "single"
+
+    assert not run_prod.run_prod(portfolio_path=portfolio_path, out_dir=out_dir, run_store=_FailingRunStore())
+
+    for artifact in ("summary.json", "runlog.json", "output_packet.json", "timings.json"):
+        assert (out_dir / artifact).exists()
+    report = (out_dir / "failure_report.md").read_text(encoding="utf-8")
+    assert "**Failing step:** record_run_store" in report
+    assert "database is locked" in report
+
+    batch_dir = tmp_path / "batch"
+    assert not run_prod.run_prod_batch(
+        portfolio_paths=[portfolio_path], out_dir=batch_dir, run_store=_FailingRunStore()
+    )
+    summary = json.loads((batch_dir / "batch_summary.json").read_text(encoding="utf-8"))
+    assert summary["errors"] == ["run_store_record_failed"]
+    assert (batch_dir / portfolio_path.stem / "output_packet.json").exists()
+    assert (batch_dir / "failure_report.md").exists()
+
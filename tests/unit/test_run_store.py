@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from src.core.logging.run_store import RunStore
+from src.core.utils.determinism import stable_json_dumps
+
+
+def _files(portfolio_id: str, outcome: str, run_hash: str, holding_outcomes: dict) -> dict:
+    holdings = [
+        {"holding_id": holding_id, "holding_run_outcome": holding_outcome, "scorecard": {"final_score": 50.0}}
+        for holding_id, holding_outcome in holding_outcomes.items()
+    ]
+    return {
+        "summary.json": stable_json_dumps(
+            {"run_id": "local-run", "portfolio_id": portfolio_id, "outcome": outcome, "counts_by_outcome": {}}
+        ),
+        "runlog.json": stable_json_dumps({"run_id": "local-run", "status": "completed", "reasons": []}),
+        "output_packet.json": stable_json_dumps({"portfolio_id": portfolio_id, "run_hash": run_hash, "holdings": holdings}),
+    }
+
+
+def test_bulk_insert_and_history_queries() -> None:
+    store = RunStore(":memory:")
+    september = datetime(2025, 9, 15, tzinfo=timezone.utc)
+    october = datetime(2025, 10, 15, tzinfo=timezone.utc)
+    store.record_many(
+        [
+            (_files("PORT-A", "VETOED", "hash-1", {"H1": "VETOED"}), None),
+            (_files("PORT-B", "COMPLETED", "hash-2", {"H1": "COMPLETED"}), None),
+        ],
+        recorded_at=september,
+    )
+    later = store.record(_files("PORT-A", "VETOED", "hash-3", {"H1": "VETOED", "H2": "COMPLETED"}), recorded_at=october)
+
+    vetoed = store.find_runs(portfolio_id="PORT-A", outcome="VETOED", since=datetime(2025, 10, 1, tzinfo=timezone.utc))
+    assert [run.run_key for run in vetoed] == [later]
+    assert [run.hashes["run_hash"] for run in store.find_runs(portfolio_id="PORT-A")] == ["hash-3", "hash-1"]
+    assert len(store.find_runs(until=datetime(2025, 10, 1))) == 2
+    assert store.has_run_hash("hash-2") and not store.has_run_hash("hash-4")
+    assert [holding.outcome for holding in store.holding_history("H1")] == ["VETOED", "COMPLETED", "VETOED"]
+    assert [holding.run_key for holding in store.holding_history("H2", outcome="COMPLETED")] == [later]
+    assert store.holdings_for_run(later)[1].final_score == 50.0
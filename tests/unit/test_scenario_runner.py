@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from src.agents.registry import DEFAULT_AGENT_CLASSES, AgentRegistry
+from src.agents.technical import TechnicalAgent
+from src.core.canonicalization import hash_run_config
+from src.core.models import RunConfig, RunOutcome
+from src.core.orchestration import Orchestrator, ScenarioRunner
+
+
+SCENARIOS = {
+    "deep": {},
+    "fast": {"run_mode": "FAST"},
+    "strict_veto": {"partial_failure_veto_threshold_pct": 0.0},
+}
+
+
+def test_scenarios_match_independent_runs_and_share_agents(happy_path_inputs) -> None:
+    inputs = happy_path_inputs()
+
+    results = ScenarioRunner().run(**inputs, scenarios=SCENARIOS)
+
+    assert list(results) == list(SCENARIOS)
+    for scenario_id, overrides in SCENARIOS.items():
+        expected = Orchestrator().run(
+            **{**inputs, "run_config_data": {**inputs["run_config_data"], **overrides}},
+            run_id=f"local-run:{scenario_id}",
+        )
+        assert results[scenario_id].outcome == expected.outcome
+        assert results[scenario_id].packet.model_dump() == expected.packet.model_dump()
+
+    agent_count = results["deep"].run_log.agent_cache["misses"]
+    assert agent_count > 0
+    assert results["fast"].run_log.agent_cache == {"hits": agent_count, "misses": 0}
+    assert results["strict_veto"].run_log.agent_cache == {"hits": agent_count, "misses": 0}
+
+
+def test_run_mode_dependent_agents_are_not_shared(happy_path_inputs) -> None:
+    class ModeAwareTechnicalAgent(TechnicalAgent):
+        run_config_fields = frozenset({"run_mode"})
+
+        def execute(self, context):
+            result = super().execute(context)
+            return result.model_copy(update={"notes": context.run_config.run_mode.value})
+
+    registry = AgentRegistry(
+        config_data={"agents": {}, "phases": {}},
+        agent_classes={**DEFAULT_AGENT_CLASSES, "Technical": ModeAwareTechnicalAgent},
+    )
+    holding_count = len(happy_path_inputs()["portfolio_snapshot_data"]["holdings"])
+
+    results = ScenarioRunner(registry=registry).run(**happy_path_inputs(), scenarios=SCENARIOS)
+
+    for scenario_id, expected_mode in (("deep", "DEEP"), ("fast", "FAST")):
+        technical = [
+            item
+            for item in results[scenario_id].portfolio_committee_packet.agent_outputs
+            if item["agent_name"] == "Technical"
+        ]
+        assert len(technical) == holding_count
+        assert all(item["notes"] == expected_mode for item in technical)
+    assert results["fast"].run_log.agent_cache["misses"] >= holding_count
+    assert results["strict_veto"].run_log.agent_cache["misses"] == 0
+
+
+def test_agents_without_declared_run_config_fields_are_not_shared(happy_path_inputs) -> None:
+    class UndeclaredTechnicalAgent(TechnicalAgent):
+        run_config_fields = None
+
+    registry = AgentRegistry(
+        config_data={"agents": {}, "phases": {}},
+        agent_classes={**DEFAULT_AGENT_CLASSES, "Technical": UndeclaredTechnicalAgent},
+    )
+    holding_count = len(happy_path_inputs()["portfolio_snapshot_data"]["holdings"])
+
+    results = ScenarioRunner(registry=registry).run(**happy_path_inputs(), scenarios=SCENARIOS)
+
+    assert results["fast"].run_log.agent_cache["misses"] >= holding_count
+    assert results["strict_veto"].run_log.agent_cache["misses"] >= holding_count
+
+
+def test_manifest_pins_only_scenarios_that_keep_the_base_run_config(happy_path_inputs) -> None:
+    inputs = happy_path_inputs()
+    pinned = {"run_config_hash": "base-run-config", "config_snapshot_hash": "config-snapshot"}
+
+    results = ScenarioRunner().run(**inputs, scenarios=SCENARIOS, manifest_data=pinned, config_hashes=pinned)
+
+    assert results["deep"].run_log.config_hashes == pinned
+    for scenario_id in ("fast", "strict_veto"):
+        run_config = RunConfig.model_validate({**inputs["run_config_data"], **SCENARIOS[scenario_id]})
+        assert results[scenario_id].outcome != RunOutcome.FAILED
+        assert results[scenario_id].run_log.config_hashes == {
+            "run_config_hash": hash_run_config(run_config),
+            "config_snapshot_hash": "config-snapshot",
+        }
+
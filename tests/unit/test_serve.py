@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import http.client
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+
+from src.agents.cache import AgentResultCache
+from src.cli import run_prod
+from src.cli.serve import EvaluationService, build_server
+from src.release.manifest import compute_manifest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+EXAMPLE = REPO_ROOT / "fixtures" / "portfolio_snapshot_prod_example.json"
+
+
+def _copy_bundle(tmp_path: Path) -> Path:
+    bundle_dir = tmp_path / "bundle"
+    shutil.copytree(REPO_ROOT / "config" / "release_bundle", bundle_dir)
+    return bundle_dir
+
+
+def _post(port: int, path: str, body: bytes) -> tuple[int, dict]:
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    try:
+        connection.request("POST", path, body=body, headers={"Content-Type": "application/json"})
+        response = connection.getresponse()
+        return response.status, json.loads(response.read())
+    finally:
+        connection.close()
+
+
+def test_server_returns_run_prod_artifacts(tmp_path: Path) -> None:
+    bundle_dir = _copy_bundle(tmp_path)
+    out_dir = tmp_path / "run_prod"
+    run_prod.run_prod(
+        portfolio_path=EXAMPLE,
+        out_dir=out_dir,
+        bundle_dir=bundle_dir,
+        run_mode="FAST",
+        cache=AgentResultCache(),
+    )
+
+    server = build_server(EvaluationService(bundle_dir=bundle_dir, workers=2), port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        port = server.server_address[1]
+        responses = [_post(port, "/evaluate?run_mode=FAST", EXAMPLE.read_bytes()) for _ in range(2)]
+        bad_status, bad = _post(port, "/evaluate", b"{not valid json")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    for status, payload in responses:
+        assert status == 200
+        assert payload["release_id"] == "release_bundle_v1"
+        assert set(payload["artifacts"]) == {path.name for path in out_dir.iterdir()}
+        for name in ("summary.json", "output_packet.json"):
+            assert payload["artifacts"][name] == (out_dir / name).read_text(encoding="utf-8")
+    first, second = (json.loads(payload["artifacts"]["runlog.json"]) for _, payload in responses)
+    # The first request matches a cold run; the second is served from the warm agent cache.
+    assert first == json.loads((out_dir / "runlog.json").read_text(encoding="utf-8"))
+    assert second["agent_cache"] == {"hits": first["agent_cache"]["misses"], "misses": 0}
+    assert bad_status == 400
+    assert bad["error"].startswith("invalid_json:")
+
+
+def test_service_reloads_bundle_when_manifest_changes(tmp_path: Path) -> None:
+    bundle_dir = _copy_bundle(tmp_path)
+    service = EvaluationService(bundle_dir=bundle_dir)
+    snapshot = json.loads(EXAMPLE.read_text(encoding="utf-8"))
+    first = service.bundle
+
+    run_config_path = bundle_dir / "run_config.json"
+    run_config = json.loads(run_config_path.read_text(encoding="utf-8"))
+    run_config_path.write_text(json.dumps({**run_config, "run_mode": "FAST"}), encoding="utf-8")
+    # The bundle no longer matches its manifest, so the loaded bundle keeps serving.
+    assert service.refresh() is first
+
+    manifest_path = bundle_dir / "release_manifest.json"
+    manifest = {**compute_manifest(bundle_dir), "release_id": "release_bundle_v2"}
+    manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+    stat = manifest_path.stat()
+    os.utime(manifest_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    bundle, artifacts = service.evaluate(snapshot)
+
+    assert bundle is not first
+    assert bundle.release_id == "release_bundle_v2"
+    assert service.health()["release_id"] == "release_bundle_v2"
+    assert service.health()["reload_error"] is None
+    assert bundle.inputs(None)[1].run_mode.value == "FAST"
+    assert "runlog.json" in artifacts.files
+
+
+def test_service_keeps_serving_when_reload_raises_unexpectedly(tmp_path: Path) -> None:
+    bundle_dir = _copy_bundle(tmp_path)
+    service = EvaluationService(bundle_dir=bundle_dir)
+    first = service.bundle
+
+    manifest_path = bundle_dir / "release_manifest.json"
+    manifest_path.write_text("[]", encoding="utf-8")
+    stat = manifest_path.stat()
+    os.utime(manifest_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert service.refresh() is first
+    assert service.health()["reload_error"]
+
+    loads = []
+    service._load_bundle = lambda: loads.append(1)  # type: ignore[method-assign]
+    assert service.refresh() is first
+    # The failed manifest is remembered, so it is not re-loaded on the next request.
+    assert loads == []
+
+
+def test_server_rejects_malformed_content_length(tmp_path: Path) -> None:
+    server = build_server(EvaluationService(bundle_dir=_copy_bundle(tmp_path)), port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        statuses = []
+        for value in ("abc", "-5"):
+            connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=30)
+            try:
+                connection.putrequest("POST", "/evaluate")
+                connection.putheader("Content-Length", value)
+                connection.endheaders()
+                response = connection.getresponse()
+                statuses.append((response.status, json.loads(response.read())))
+            finally:
+                connection.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert statuses == [(400, {"error": "invalid_content_length"})] * 2
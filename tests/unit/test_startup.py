@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+from tools.startup_benchmark import check_regressions, run_startup_benchmark
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_entry_points_defer_agents_and_release_runners() -> None:
+    report = run_startup_benchmark(entry_points=["run_prod", "release_phase0"], repeats=1, repo_root=REPO_ROOT)
+
+    assert report["violations"] == []
+    for entry in report["entry_points"].values():
+        assert entry["import_ms"] > 0
+        assert len(entry["wall_ms"]) == 1
+
+
+def test_disabled_agents_are_never_imported() -> None:
+    script = "\n".join(
+        [
+            "import sys",
+            "from src.agents.registry import AgentRegistry",
+            "registry = AgentRegistry(config_data={'agents': {'Technical': {'enabled': False}}, 'phases': {}})",
+            "names = [agent.agent_name for agent in registry.agents_for_phase(phase='ANALYTICAL', scope='holding')]",
+            "print(names, 'src.agents.technical' in sys.modules, 'src.agents.fundamentals' in sys.modules)",
+        ]
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+    assert output == "['Fundamentals', 'DevilsAdvocate'] False True"
+
+
+def test_check_regressions_applies_threshold() -> None:
+    entry = {"median_wall_ms": 130.0, "import_ms": 90.0, "forbidden_imports": []}
+    baseline = {"entry_points": {"run_prod": {"median_wall_ms": 100.0, "import_ms": 80.0}}}
+
+    violations = check_regressions({"entry_points": {"run_prod": entry}}, baseline, max_regression=0.25)
+
+    assert len(violations) == 1
+    assert violations[0].startswith("run_prod median_wall_ms 130.0")
+    assert check_regressions({"entry_points": {"run_prod": entry}}, baseline, max_regression=0.5) == []
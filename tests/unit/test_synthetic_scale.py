@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import copy
+import json
+from pathlib import Path
+
+import pytest
+
+from src.core.models import ConfigSnapshot, PortfolioSnapshot
+from src.testing.scale import compare_scale_baseline, run_scale_benchmark
+from src.testing.synthetic import SyntheticRates, generate_portfolio, write_synthetic_fixtures
+
+
+def test_generator_is_seeded_and_schema_valid() -> None:
+    rates = SyntheticRates(veto=0.1, staleness=0.3, contradiction=0.2, fx_exposure=0.25)
+    portfolio = generate_portfolio(400, seed=7, rates=rates)
+
+    assert portfolio == generate_portfolio(400, seed=7, rates=rates)
+    assert portfolio != generate_portfolio(400, seed=8, rates=rates)
+    snapshot = PortfolioSnapshot.model_validate(portfolio.portfolio_snapshot)
+    ConfigSnapshot.model_validate(portfolio.config_snapshot)
+    assert len(snapshot.holdings) == 400
+    assert sum(holding.weight for holding in snapshot.holdings) + snapshot.cash_pct == pytest.approx(1.0)
+
+    fixtures = portfolio.config_snapshot["registries"]["agent_fixtures"]
+    assert set(fixtures) == {"DIO", "GRRA", "LEFO", "PSCC", "RiskOfficer", "Fundamentals", "Technical", "DevilsAdvocate"}
+    dio = fixtures["DIO"]["holdings"].values()
+    vetoes = sum(seed["integrity_veto_triggered"] for seed in dio) + sum(
+        bool(seed["veto_flags"]) for seed in fixtures["RiskOfficer"]["holdings"].values()
+    )
+    assert 20 <= vetoes <= 60
+    assert 80 <= sum(bool(seed["staleness_flags"]) for seed in dio) <= 160
+    assert 50 <= sum(bool(seed["contradictions"]) for seed in dio) <= 110
+    fx_reports = fixtures["PSCC"]["portfolio"]["fx_exposure_reports"]
+    assert 60 <= len(fx_reports) <= 140
+    assert {holding.identity.holding_id for holding in snapshot.holdings if holding.currency} == set(fx_reports)
+
+
+def test_write_synthetic_fixtures(tmp_path: Path) -> None:
+    paths = write_synthetic_fixtures(tmp_path, sizes=[5], seed=3)
+
+    assert [path.name for path in paths] == ["PortfolioSnapshot_SYN5.json", "ConfigSnapshot_SYN5.json"]
+    payload = json.loads(paths[0].read_text(encoding="utf-8"))
+    assert payload["fixture_id"] == "PortfolioSnapshot_SYN5"
+    assert payload["payload"] == generate_portfolio(5, seed=3).portfolio_snapshot
+
+
+def test_scale_benchmark_reports_stages_and_flags_regressions() -> None:
+    report = run_scale_benchmark(sizes=[30], seed=1, rates=SyntheticRates(veto=0.1))
+
+    entry = report["sizes"]["30"]
+    assert entry["outcome"] == "COMPLETED"
+    assert sum(entry["counts_by_outcome"].values()) == 30
+    assert entry["counts_by_outcome"].get("VETOED", 0) > 0
+    assert {"parse_inputs", "agents", "aggregation"} <= set(entry["stages_ms"])
+    assert entry["peak_memory_mb"] > 0
+    assert compare_scale_baseline(report, report) == []
+
+    slower = copy.deepcopy(report)
+    slower["sizes"]["30"]["median_wall_ms"] = entry["median_wall_ms"] * 2
+    slower["sizes"]["30"]["counts_by_outcome"] = {"COMPLETED": 30}
+    violations = compare_scale_baseline(slower, report, max_regression=0.25)
+    assert len(violations) == 2
+    assert compare_scale_baseline({**report, "seed": 2}, report) == [
+        "scale benchmark inputs differ from the baseline (seed or rates)."
+    ]
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from src.core.logging import TimingRecorder
+from src.core.orchestration import ExecutionConfig, Orchestrator
+
+
+def test_timings_cover_stages_agents_and_guards_without_changing_hashes(happy_path_inputs) -> None:
+    baseline = Orchestrator().run(**happy_path_inputs())
+    timings = TimingRecorder()
+    timed_run = Orchestrator().run(**happy_path_inputs(), timings=timings)
+
+    report = timings.to_dict()
+    stage_names = [entry["name"] for entry in report["stages"]]
+    assert stage_names[:3] == ["parse_inputs", "intake_guards", "fingerprint_inputs"]
+    assert {"agents", "post_agent_guards", "governance", "hashing", "aggregation"} <= set(stage_names)
+    assert len(report["agents"]) == len(baseline.portfolio_committee_packet.agent_outputs)
+    assert {entry["name"] for entry in report["guards"]} >= {"G0", "G5", "G7", "G9"}
+    assert all(entry["duration_ms"] >= 0.0 for entry in report["phases"])
+    assert timed_run.run_log == baseline.run_log
+    assert timed_run.portfolio_committee_packet.run_hash == baseline.portfolio_committee_packet.run_hash
+
+
+def test_process_pool_agent_timings_reach_the_coordinator(happy_path_inputs) -> None:
+    timings = TimingRecorder()
+    result = Orchestrator(execution=ExecutionConfig(max_workers=2, pool="process")).run(
+        **happy_path_inputs(),
+        timings=timings,
+    )
+
+    holding_agents = [entry for entry in timings.to_dict()["agents"] if entry["scope"] == "holding"]
+    expected = [agent for agent in result.portfolio_committee_packet.agent_outputs if agent["scope"] == "holding"]
+    assert len(holding_agents) == len(expected)
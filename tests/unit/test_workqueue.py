@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Sequence, Set
+
+import pytest
+
+from src.core.orchestration import Orchestrator
+from src.core.orchestration.workqueue import FileBroker, LocalWorkQueue, WorkResult
+from src.testing.synthetic import generate_portfolio
+
+
+FIXED_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class _FlakyQueue(LocalWorkQueue):
+    """Reports the first result of every task as a failure."""
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.failed: Set[str] = set()
+
+    def collect(self, task_ids: Sequence[str]) -> Dict[str, WorkResult]:
+        results = super().collect(task_ids)
+        for task_id in results:
+            if task_id not in self.failed:
+                self.failed.add(task_id)
+                results[task_id] = WorkResult(task_id, error="injected")
+        return results
+
+
+def test_failed_tasks_are_retried_up_to_max_attempts() -> None:
+    inputs = generate_portfolio(5, seed=2).run_inputs({"run_mode": "DEEP"})
+    serial = Orchestrator(now_func=lambda: FIXED_TIME).run(**inputs)
+
+    flaky = _FlakyQueue(max_attempts=2)
+    assert Orchestrator(now_func=lambda: FIXED_TIME, work_queue=flaky).run(**inputs) == serial
+    assert len(flaky.failed) == 20
+
+    with pytest.raises(RuntimeError, match="work_task_failed:.*:injected"):
+        Orchestrator(now_func=lambda: FIXED_TIME, work_queue=_FlakyQueue(max_attempts=1)).run(**inputs)
+
+
+def test_file_broker_submit_is_idempotent_and_leases_expire(tmp_path: Path) -> None:
+    broker = FileBroker(tmp_path, lease_seconds=0.0, result_timeout=1.0)
+    broker.submit("task-a", b"{}")
+    broker.submit("task-a", b"{}")
+    assert [path.name for path in (tmp_path / "pending").iterdir()] == ["task-a.json"]
+
+    item = broker.claim()
+    assert item is not None and item.task_id == "task-a"
+    assert broker.claim() is None
+    assert broker.collect(["task-a"]) == {"task-a": WorkResult("task-a", error="lease_expired")}
+
+    # The slow worker still finishes; its result satisfies the resubmitted task without a rerun.
+    broker.complete("task-a", b"[]")
+    broker.submit("task-a", b"{}")
+    assert list((tmp_path / "pending").iterdir()) == []
+    assert json.loads(broker.collect(["task-a"])["task-a"].payload) == []
+
+    broker.submit("task-b", b"{}")
+    broker.fail(broker.claim().task_id, "boom")
+    assert broker.collect(["task-b"])["task-b"].error == "boom"
+    broker.submit("task-b", b"{}")
+    assert [path.name for path in (tmp_path / "pending").iterdir()] == ["task-b.json"]
+    with pytest.raises(TimeoutError):
+        broker.collect(["task-b"])
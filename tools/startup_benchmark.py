@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence
+
+from src.core.utils.determinism import stable_json_dumps
+
+
+IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)$")
+DEFAULT_MAX_REGRESSION = 0.25
+DEFAULT_REPORT_PATH = Path("artifacts/benchmarks/startup.json")
+
+
+@dataclass(frozen=True)
+class EntryPoint:
+    module: str
+    # Modules the entry point must not import before it does any work.
+    forbidden: FrozenSet[str] = frozenset()
+
+
+_DEFERRED = frozenset(
+    {
+        "asyncio",
+        "src.release.phase1",
+        "src.testing.replay",
+        "tools.phase0_readiness",
+        "src.agents.dio",
+        "src.agents.grra",
+        "src.agents.lefo",
+        "src.agents.pscc",
+        "src.agents.risk_officer",
+        "src.agents.fundamentals",
+        "src.agents.technical",
+        "src.agents.devils_advocate",
+    }
+)
+
+ENTRY_POINTS: Dict[str, EntryPoint] = {
+    "run_prod": EntryPoint(
+        module="src.cli.run_prod",
+        forbidden=_DEFERRED,
+    ),
+    "run_local": EntryPoint(
+        module="src.cli.run_local",
+        forbidden=_DEFERRED,
+    ),
+    "release_phase0": EntryPoint(
+        module="src.cli.release_phase0",
+        forbidden=_DEFERRED | {"numpy", "src.core.models", "src.core.orchestration"},
+    ),
+}
+
+
+def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure import time and cold-start wall time of CLI entry points")
+    parser.add_argument("--entry", action="append", choices=sorted(ENTRY_POINTS), help="Entry point (repeatable)")
+    parser.add_argument("--repeats", type=int, default=5, help="Cold starts per entry point; the median is reported")
+    parser.add_argument("--out", default=str(DEFAULT_REPORT_PATH), help="Report output path")
+    parser.add_argument("--baseline", required=False, help="Earlier report to compare against")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=DEFAULT_MAX_REGRESSION,
+        help="Allowed slowdown against --baseline as a fraction (0.25 = 25%%)",
+    )
+    return parser.parse_args(argv)
+
+
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """`-X importtime` lines as {module, depth, self_us, cumulative_us}, in import order."""
+    entries = []
+    for line in stderr.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append(
+                {
+                    "module": module,
+                    "depth": (len(indent) - 1) // 2,
+                    "self_us": int(self_us),
+                    "cumulative_us": int(cumulative_us),
+                }
+            )
+    return entries
+
+
+def _python(args: Sequence[str], cwd: Path) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def measure_entry_point(name: str, *, repeats: int, repo_root: Path) -> Dict[str, Any]:
+    entry_point = ENTRY_POINTS[name]
+    imports = parse_importtime(_python(["-X", "importtime", "-c", f"import {entry_point.module}"], repo_root).stderr)
+    modules = {entry["module"] for entry in imports}
+
+    # A cold start is a fresh interpreter that imports the entry point and parses `--help`.
+    wall_ms = []
+    for _ in range(max(1, repeats)):
+        started = time.perf_counter()
+        _python(["-m", entry_point.module, "--help"], repo_root)
+        wall_ms.append((time.perf_counter() - started) * 1000.0)
+
+    slowest = sorted(imports, key=lambda entry: entry["self_us"], reverse=True)[:15]
+    return {
+        "module": entry_point.module,
+        "import_ms": round(sum(entry["cumulative_us"] for entry in imports if entry["depth"] == 0) / 1000.0, 3),
+        "module_count": len(imports),
+        "slowest_imports": [{"module": entry["module"], "self_ms": entry["self_us"] / 1000.0} for entry in slowest],
+        "forbidden_imports": sorted(modules & entry_point.forbidden),
+        "wall_ms": [round(value, 3) for value in wall_ms],
+        "median_wall_ms": round(statistics.median(wall_ms), 3),
+    }
+
+
+def check_regressions(
+    report: Dict[str, Any],
+    baseline: Optional[Dict[str, Any]] = None,
+    *,
+    max_regression: float = DEFAULT_MAX_REGRESSION,
+) -> List[str]:
+    violations: List[str] = []
+    for name, entry in sorted(report["entry_points"].items()):
+        if entry["forbidden_imports"]:
+            violations.append(f"{name} imports deferred modules at startup: {entry['forbidden_imports']}.")
+        previous = (baseline or {}).get("entry_points", {}).get(name)
+        if previous is None:
+            continue
+        for metric in ("median_wall_ms", "import_ms"):
+            limit = previous[metric] * (1.0 + max_regression)
+            if entry[metric] > limit:
+                violations.append(
+                    f"{name} {metric} {entry[metric]:.1f} exceeds baseline {previous[metric]:.1f} "
+                    f"by more than {max_regression:.0%}."
+                )
+    return violations
+
+
+def run_startup_benchmark(
+    *,
+    entry_points: Optional[Sequence[str]] = None,
+    repeats: int = 5,
+    repo_root: Optional[Path] = None,
+    baseline: Optional[Dict[str, Any]] = None,
+    max_regression: float = DEFAULT_MAX_REGRESSION,
+) -> Dict[str, Any]:
+    repo_root = repo_root or Path(__file__).resolve().parents[1]
+    report: Dict[str, Any] = {
+        "python": sys.version.split()[0],
+        "repeats": repeats,
+        "entry_points": {
+            name: measure_entry_point(name, repeats=repeats, repo_root=repo_root)
+            for name in (entry_points or sorted(ENTRY_POINTS))
+        },
+    }
+    report["violations"] = check_regressions(report, baseline, max_regression=max_regression)
+    return report
+
+
+def main() -> None:
+    args = _parse_args(sys.argv[1:])
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8")) if args.baseline else None
+    report = run_startup_benchmark(
+        entry_points=args.entry,
+        repeats=args.repeats,
+        baseline=baseline,
+        max_regression=args.max_regression,
+    )
+    out_path = Path(args.out)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(stable_json_dumps(report), encoding="utf-8")
+    for name, entry in sorted(report["entry_points"].items()):
+        print(f"{name}: import {entry['import_ms']:.1f} ms, cold start {entry['median_wall_ms']:.1f} ms")
+    for violation in report["violations"]:
+        print(f"REGRESSION: {violation}")
+    sys.exit(1 if report["violations"] else 0)
+
+
+if __name__ == "__main__":
+    main()